@@ -0,0 +1,63 @@
+"""Benchmark the JSON codecs with `read_data()` responses.
+
+The responses are built from the real response shapes of the API in `tests/test_api_data.py`. Every fixture is
+decoded as it is and the items of all fixtures are repeated for the larger sizes.
+
+Run with `python -m benchmarks.codec`.
+"""
+
+import json
+import timeit
+from functools import partial
+from typing import Any
+
+from benchmarks.decode import SIZES
+from keba_keenergy_api.codec import CODECS
+from keba_keenergy_api.codec import JSONCodec
+from tests import test_api_data
+
+FIXTURES: dict[str, list[dict[str, Any]]] = {
+    name: payload
+    for name, payload in vars(test_api_data).items()
+    if name.startswith("read_data_") and "payload" in name and isinstance(payload, list)
+}
+ITEMS: list[dict[str, Any]] = [item for payload in FIXTURES.values() for item in payload]
+
+
+def get_codec(name: str) -> JSONCodec | None:
+    """Get a JSON codec or `None` if it is not installed."""
+    try:
+        return CODECS[name]()
+    except ImportError:
+        print(f"{name} is not installed")  # noqa: T201
+        return None
+
+
+def get_responses() -> dict[str, list[dict[str, Any]]]:
+    """Get every fixture and the repeated fixture items for every size."""
+    return FIXTURES | {f"{size} items": [ITEMS[idx % len(ITEMS)] for idx in range(size)] for size in SIZES}
+
+
+def main() -> None:
+    """Print the decode time of every installed codec for every response."""
+    codecs: list[JSONCodec] = [codec for name in CODECS if (codec := get_codec(name)) is not None]
+    responses: dict[str, list[dict[str, Any]]] = get_responses()
+
+    header: str = f"{'codec':>10} {'response':>36} {'variables':>10} {'decode [ms]':>12} {'per variable [µs]':>18}"
+    print(header)  # noqa: T201
+
+    for codec in codecs:
+        for name, response in responses.items():
+            data: str = json.dumps(response)
+            size: int = len(response)
+            number: int = max(1, 10_000 // size)
+            seconds: float = min(timeit.repeat(partial(codec.decode, data), number=number, repeat=5))
+
+            print(  # noqa: T201
+                f"{codec.name:>10} {name:>36} {size:>10} {seconds / number * 1e3:>12.3f} "
+                f"{seconds / number / size * 1e6:>18.3f}",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark the response decoder of `read_data()`.
+
+Run with `python -m benchmarks.decode`.
+"""
+
+import timeit
+from functools import partial
+from typing import Any
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.constants import HeatCircuit
+from keba_keenergy_api.endpoints import ReadPlan
+from keba_keenergy_api.endpoints import ReadPlanEntry
+
+SIZES: tuple[int, ...] = (100, 1_000, 10_000)
+SECTIONS: tuple[HeatCircuit, ...] = (
+    HeatCircuit.ROOM_TEMPERATURE,
+    HeatCircuit.TARGET_TEMPERATURE_DAY,
+    HeatCircuit.TARGET_TEMPERATURE_NIGHT,
+    HeatCircuit.MIXER_FLOW_TEMPERATURE,
+    HeatCircuit.OPERATING_MODE,
+)
+RESPONSE_ITEMS: dict[HeatCircuit, dict[str, Any]] = {
+    HeatCircuit.ROOM_TEMPERATURE: {"value": "22.35", "attributes": {"formatId": "fmtTemp", "upperLimit": "90"}},
+    HeatCircuit.TARGET_TEMPERATURE_DAY: {"value": "21", "attributes": {"formatId": "fmtTemp", "upperLimit": "90"}},
+    HeatCircuit.TARGET_TEMPERATURE_NIGHT: {"value": "18", "attributes": {"formatId": "fmtTemp", "upperLimit": "90"}},
+    HeatCircuit.MIXER_FLOW_TEMPERATURE: {"value": "21.5", "attributes": {"formatId": "fmtTemp", "upperLimit": "90"}},
+    HeatCircuit.OPERATING_MODE: {"value": "3", "attributes": {"formatId": "fmtHcMode", "upperLimit": "32767"}},
+}
+
+
+def get_plan_and_response(size: int) -> tuple[ReadPlan, list[dict[str, Any]]]:
+    """Get a read plan and a response with `size` variables."""
+    entries: list[ReadPlanEntry] = []
+    response: list[dict[str, Any]] = []
+
+    for idx in range(size):
+        section: HeatCircuit = SECTIONS[idx % len(SECTIONS)]
+        entries.append(ReadPlanEntry(key=section.name.lower(), section=section))
+        response.append({"name": section.value.value % (idx // len(SECTIONS))} | RESPONSE_ITEMS[section])
+
+    return ReadPlan(payload=[], data="[]", entries=tuple(entries)), response
+
+
+def main() -> None:
+    """Print the decode time for every size."""
+    client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="ap4400.local")
+
+    print(f"{'variables':>10} {'decode [ms]':>12} {'per variable [µs]':>18}")  # noqa: T201
+
+    for size in SIZES:
+        plan, response = get_plan_and_response(size)
+        number: int = max(1, 10_000 // size)
+        seconds: float = min(
+            timeit.repeat(
+                partial(client._get_response_data, response, plan),  # noqa: SLF001
+                number=number,
+                repeat=5,
+            ),
+        )
+
+        print(f"{size:>10} {seconds / number * 1e3:>12.3f} {seconds / number / size * 1e6:>18.3f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
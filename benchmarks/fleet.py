@@ -0,0 +1,116 @@
+"""Benchmark `ShardedFleet` against a local stand-in server.
+
+Every controller is simulated by its own loopback address, e.g. `127.0.0.1`, `127.0.0.2`, ..., served by a few server
+processes. Run with `python -m benchmarks.fleet` (Linux only).
+"""
+
+import asyncio
+import multiprocessing
+import socket
+import time
+from multiprocessing.synchronize import Event
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+
+from keba_keenergy_api.constants import HeatCircuit
+from keba_keenergy_api.constants import Section
+from keba_keenergy_api.sharding import ShardedFleet
+
+if TYPE_CHECKING:
+    from multiprocessing.context import SpawnProcess
+
+HOSTS: int = 1_000
+ROUNDS: int = 3
+PROCESSES: tuple[int, ...] = (1, 2, 4)
+SERVER_PROCESSES: int = 4
+POSITIONS: list[int] = [1, 2, 3, 4]
+REQUEST: list[Section] = [
+    HeatCircuit.ROOM_TEMPERATURE,
+    HeatCircuit.TARGET_TEMPERATURE_DAY,
+    HeatCircuit.TARGET_TEMPERATURE_NIGHT,
+    HeatCircuit.MIXER_FLOW_TEMPERATURE,
+    HeatCircuit.OPERATING_MODE,
+]
+
+
+def get_addresses() -> list[str]:
+    """Get one loopback address for every simulated controller."""
+    return [f"127.0.{idx // 250}.{idx % 250 + 1}" for idx in range(HOSTS)]
+
+
+async def handle_read_write_vars(request: web.Request) -> web.Response:
+    """Answer every requested variable with the same value."""
+    payload: list[dict[str, str]] = await request.json()
+    return web.json_response([{"name": item["name"], "value": "1"} for item in payload])
+
+
+async def serve(port: int, ready: Event) -> None:
+    """Serve the stand-in API on every loopback address."""
+    app: web.Application = web.Application()
+    app.router.add_post("/var/readWriteVars", handle_read_write_vars)
+
+    runner: web.AppRunner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+
+    for address in get_addresses():
+        await web.TCPSite(runner, address, port, reuse_port=True).start()
+
+    ready.set()
+    await asyncio.Event().wait()
+
+
+def run_server(port: int, ready: Event) -> None:
+    """Run a server process."""
+    asyncio.run(serve(port, ready))
+
+
+async def poll(hosts: list[str], processes: int) -> float:
+    """Get the seconds of one poll of every host with a warmed up fleet."""
+    async with ShardedFleet(hosts, processes=processes, jitter=0) as fleet:
+        seconds: list[float] = []
+
+        for _ in range(ROUNDS + 1):
+            started: float = time.perf_counter()
+            errors: int = sum([result.error is not None async for result in fleet.poll_all(REQUEST, POSITIONS)])
+            seconds.append(time.perf_counter() - started)
+
+            if errors:
+                print(f"{errors} errors")  # noqa: T201
+
+        # The first poll starts the worker processes and opens the connections
+        return min(seconds[1:])
+
+
+def main() -> None:
+    """Print the poll time of the whole fleet for every number of worker processes."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+
+    context: multiprocessing.context.SpawnContext = multiprocessing.get_context("spawn")
+    servers: list[tuple[SpawnProcess, Event]] = []
+
+    for _ in range(SERVER_PROCESSES):
+        ready: Event = context.Event()
+        server: SpawnProcess = context.Process(target=run_server, args=(port, ready), daemon=True)
+        server.start()
+        servers.append((server, ready))
+
+    for _, ready in servers:
+        ready.wait()
+
+    hosts: list[str] = [f"{address}:{port}" for address in get_addresses()]
+
+    print(f"{'processes':>10} {'hosts':>10} {'poll [ms]':>12} {'polls/s':>10}")  # noqa: T201
+
+    for processes in PROCESSES:
+        seconds: float = asyncio.run(poll(hosts, processes))
+        print(f"{processes:>10} {HOSTS:>10} {seconds * 1e3:>12.1f} {HOSTS / seconds:>10.0f}")  # noqa: T201
+
+    for server, _ in servers:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
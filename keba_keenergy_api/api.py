@@ -1,15 +1,34 @@
-import json
+import asyncio
+import math
+from collections.abc import AsyncIterator
+from collections.abc import Mapping
+from enum import Enum
+from time import monotonic
+from types import TracebackType
 from typing import Any
+from typing import cast
 
 from aiohttp import BasicAuth
 from aiohttp import ClientSession
 
+from keba_keenergy_api.cache import ReadCache
+from keba_keenergy_api.codec import JSONCodec
+from keba_keenergy_api.capabilities import CapabilityStore
+from keba_keenergy_api.constants import API_DEFAULT_MAX_POLL_INTERVAL
+from keba_keenergy_api.constants import API_DEFAULT_MIN_POLL_INTERVAL
+from keba_keenergy_api.constants import API_DEFAULT_POSITIONS_TTL
+from keba_keenergy_api.constants import API_DEFAULT_PROBE_LIMIT
+from keba_keenergy_api.constants import API_DEFAULT_SUBSCRIBE_INTERVAL
 from keba_keenergy_api.constants import EndpointPath
 from keba_keenergy_api.constants import HeatCircuit
+from keba_keenergy_api.constants import POSITION_SECTIONS
+from keba_keenergy_api.constants import SECTION_KEYS
 from keba_keenergy_api.constants import Section
+from keba_keenergy_api.constants import SectionMetadata
 from keba_keenergy_api.constants import SectionPrefix
 from keba_keenergy_api.endpoints import BaseEndpoints
 from keba_keenergy_api.endpoints import BufferTankEndpoints
+from keba_keenergy_api.endpoints import Connection
 from keba_keenergy_api.endpoints import ExternalHeatSourceEndpoints
 from keba_keenergy_api.endpoints import HeatCircuitEndpoints
 from keba_keenergy_api.endpoints import HeatPumpEndpoints
@@ -17,13 +36,20 @@ from keba_keenergy_api.endpoints import HeatingCurves
 from keba_keenergy_api.endpoints import HotWaterTankEndpoints
 from keba_keenergy_api.endpoints import PassiveCoolingEndpoints
 from keba_keenergy_api.endpoints import PhotovoltaicsEndpoints
+from keba_keenergy_api.endpoints import Payload
 from keba_keenergy_api.endpoints import Position
+from keba_keenergy_api.endpoints import ReadChildrenPayload
+from keba_keenergy_api.endpoints import ReadPlan
 from keba_keenergy_api.endpoints import Response
 from keba_keenergy_api.endpoints import SolarCircuitEndpoints
 from keba_keenergy_api.endpoints import SwitchValveEndpoints
 from keba_keenergy_api.endpoints import SystemEndpoints
 from keba_keenergy_api.endpoints import Value
 from keba_keenergy_api.endpoints import ValueResponse
+from keba_keenergy_api.scheduler import PollScheduler
+from keba_keenergy_api.subscription import ChangeTracker
+from keba_keenergy_api.subscription import ValueChange
+from keba_keenergy_api.subscription import Variable
 
 
 class KebaKeEnergyAPI(BaseEndpoints):
@@ -38,6 +64,15 @@ class KebaKeEnergyAPI(BaseEndpoints):
         ssl: bool = False,
         skip_ssl_verification: bool = False,
         session: ClientSession | None = None,
+        coalesce_window: float | None = None,
+        single_flight: bool = True,
+        cache: ReadCache | None = None,
+        positions_ttl: float | None = API_DEFAULT_POSITIONS_TTL,
+        heating_curve_cache: bool = False,
+        capability_store: CapabilityStore | None = None,
+        share_attributes: bool = False,
+        codec: JSONCodec | None = None,
+        cache_attributes: bool = False,
     ) -> None:
         """Initialize API with host and optionally authentication credentials.
 
@@ -54,7 +89,31 @@ class KebaKeEnergyAPI(BaseEndpoints):
         skip_ssl_verification
             Disable SSL verification (required for self-signed certificates)
         session
-            Add an aiohttp client session
+            Add an aiohttp client session. Without a session the client creates its own keep-alive session on the
+            first request, which is shared by all section endpoints and closed with `close()`.
+        coalesce_window
+            Merge concurrent reads into one request. Reads within the same event loop iteration (`0`) or within the
+            window in seconds are sent together. Disabled by default.
+        single_flight
+            Concurrent reads of the same variables share one request
+        cache
+            Cache read values with a time to live per section or section member
+        positions_ttl
+            Refresh the cached number of installed devices after this time in seconds or never with `None`
+        heating_curve_cache
+            Cache the heating curve names and points as long as the heating curve version counters are unchanged
+        capability_store
+            Persist the capability map of `filter_request()` for the current Web HMI software version
+        share_attributes
+            Share one attributes dictionary between all values with identical attributes, to save memory when polling
+            many values. Shared attributes must not be modified.
+        codec
+            Encode payloads and decode responses with this JSON codec. By default responses are decoded with `orjson`
+            or `msgspec` if installed.
+        cache_attributes
+            Read the attributes of every variable only once and poll only the values afterwards. The cached attributes
+            are merged into the results and can be refreshed with `client.connection.variable_attributes.clear()`.
+            Cached attributes must not be modified.
 
         Examples
         --------
@@ -66,6 +125,9 @@ class KebaKeEnergyAPI(BaseEndpoints):
         >>>     skip_ssl_verification=True
         >>> )
 
+        >>> async with KebaKeEnergyAPI(host="ap4400.local") as client:
+        >>>     await client.system.get_outdoor_temperature()
+
         """
         self.host: str = host
         self.schema: str = "https" if ssl else "http"
@@ -78,6 +140,26 @@ class KebaKeEnergyAPI(BaseEndpoints):
         self.ssl: bool = ssl
         self.skip_ssl_verification: bool = skip_ssl_verification
         self.session: ClientSession | None = session
+        self.connection: Connection = Connection(
+            session,
+            coalesce_window=coalesce_window,
+            single_flight=single_flight,
+            cache=cache,
+            heating_curve_cache=heating_curve_cache,
+            share_attributes=share_attributes,
+            codec=codec,
+            cache_attributes=cache_attributes,
+        )
+
+        self.connection.get_positions = self.get_positions
+        self.positions_ttl: float | None = positions_ttl
+        self._positions: Position | None = None
+        self._positions_expires: float = 0
+
+        self.capabilities: dict[Section, bool] = {}
+        self.connection.get_capabilities = lambda: self.capabilities
+        self.capability_store: CapabilityStore | None = capability_store
+        self._capabilities_key: str | None = None
 
         super().__init__(
             base_url=self.device_url,
@@ -85,8 +167,54 @@ class KebaKeEnergyAPI(BaseEndpoints):
             ssl=ssl,
             skip_ssl_verification=skip_ssl_verification,
             session=session,
+            connection=self.connection,
         )
 
+    async def __aenter__(self) -> "KebaKeEnergyAPI":  # noqa: PYI034
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the keep-alive session of the client.
+
+        An aiohttp client session that was passed to the client is not closed.
+
+        """
+        await self.connection.close()
+
+    def _set_positions(self, positions: Position, /) -> None:
+        self._positions = positions
+        self._positions_expires = monotonic() + (self.positions_ttl or 0)
+
+    def _positions_expired(self) -> bool:
+        return self.positions_ttl is not None and monotonic() >= self._positions_expires
+
+    async def get_positions(self, *, refresh: bool = False) -> Position:
+        """Get the cached number of installed devices e.g. heat circuit, solar circuit, etc.
+
+        Parameters
+        ----------
+        refresh
+            Read the number of installed devices from the API, even if the cached value is still valid
+
+        Returns
+        -------
+        Position
+            A dataclass with the position information
+
+        """
+        if refresh or self._positions is None or self._positions_expired():
+            self._set_positions(await self.system.get_positions())
+
+        return cast("Position", self._positions)
+
     @property
     def device_url(self) -> str:
         """Get the device URL.
@@ -108,6 +236,7 @@ class KebaKeEnergyAPI(BaseEndpoints):
             ssl=self.ssl,
             skip_ssl_verification=self.skip_ssl_verification,
             session=self.session,
+            connection=self.connection,
         )
 
     @property
@@ -119,6 +248,7 @@ class KebaKeEnergyAPI(BaseEndpoints):
             ssl=self.ssl,
             skip_ssl_verification=self.skip_ssl_verification,
             session=self.session,
+            connection=self.connection,
         )
 
     @property
@@ -130,6 +260,7 @@ class KebaKeEnergyAPI(BaseEndpoints):
             ssl=self.ssl,
             skip_ssl_verification=self.skip_ssl_verification,
             session=self.session,
+            connection=self.connection,
         )
 
     @property
@@ -141,6 +272,7 @@ class KebaKeEnergyAPI(BaseEndpoints):
             ssl=self.ssl,
             skip_ssl_verification=self.skip_ssl_verification,
             session=self.session,
+            connection=self.connection,
         )
 
     @property
@@ -152,6 +284,7 @@ class KebaKeEnergyAPI(BaseEndpoints):
             ssl=self.ssl,
             skip_ssl_verification=self.skip_ssl_verification,
             session=self.session,
+            connection=self.connection,
         )
 
     @property
@@ -163,6 +296,7 @@ class KebaKeEnergyAPI(BaseEndpoints):
             ssl=self.ssl,
             skip_ssl_verification=self.skip_ssl_verification,
             session=self.session,
+            connection=self.connection,
         )
 
     @property
@@ -174,6 +308,7 @@ class KebaKeEnergyAPI(BaseEndpoints):
             ssl=self.ssl,
             skip_ssl_verification=self.skip_ssl_verification,
             session=self.session,
+            connection=self.connection,
         )
 
     @property
@@ -185,6 +320,7 @@ class KebaKeEnergyAPI(BaseEndpoints):
             ssl=self.ssl,
             skip_ssl_verification=self.skip_ssl_verification,
             session=self.session,
+            connection=self.connection,
         )
 
     @property
@@ -196,6 +332,7 @@ class KebaKeEnergyAPI(BaseEndpoints):
             ssl=self.ssl,
             skip_ssl_verification=self.skip_ssl_verification,
             session=self.session,
+            connection=self.connection,
         )
 
     @property
@@ -207,9 +344,10 @@ class KebaKeEnergyAPI(BaseEndpoints):
             ssl=self.ssl,
             skip_ssl_verification=self.skip_ssl_verification,
             session=self.session,
+            connection=self.connection,
         )
 
-    async def _group_data(  # noqa: C901
+    async def _group_data(
         self,
         response: dict[str, list[list[Value]] | list[Value]],
         /,
@@ -230,42 +368,13 @@ class KebaKeEnergyAPI(BaseEndpoints):
         }
 
         for key, value in response.items():
-            _key: str = ""
-
-            if key.startswith(SectionPrefix.SYSTEM):
-                _key = key.lower().replace(f"{SectionPrefix.SYSTEM.value}_", "")
-                data[SectionPrefix.SYSTEM][_key] = value[0]
-            elif key.startswith(SectionPrefix.BUFFER_TANK):
-                _key = key.lower().replace(f"{SectionPrefix.BUFFER_TANK.value}_", "")
-                data[SectionPrefix.BUFFER_TANK][_key] = value
-            elif key.startswith(SectionPrefix.HOT_WATER_TANK):
-                _key = key.lower().replace(f"{SectionPrefix.HOT_WATER_TANK.value}_", "")
-                data[SectionPrefix.HOT_WATER_TANK][_key] = value
-            elif key.startswith(SectionPrefix.HEAT_PUMP):
-                _key = key.lower().replace(f"{SectionPrefix.HEAT_PUMP.value}_", "")
-                data[SectionPrefix.HEAT_PUMP][_key] = value
-            elif key.startswith(SectionPrefix.HEAT_CIRCUIT):
-                _key = key.lower().replace(f"{SectionPrefix.HEAT_CIRCUIT.value}_", "")
-
-                if extra_attributes:
-                    await self._extra_attributes_heating_curve(key, value)
-
-                data[SectionPrefix.HEAT_CIRCUIT][_key] = value
-            elif key.startswith(SectionPrefix.SOLAR_CIRCUIT):
-                _key = key.lower().replace(f"{SectionPrefix.SOLAR_CIRCUIT.value}_", "")
-                data[SectionPrefix.SOLAR_CIRCUIT][_key] = value
-            elif key.startswith(SectionPrefix.EXTERNAL_HEAT_SOURCE):
-                _key = key.lower().replace(f"{SectionPrefix.EXTERNAL_HEAT_SOURCE.value}_", "")
-                data[SectionPrefix.EXTERNAL_HEAT_SOURCE][_key] = value
-            elif key.startswith(SectionPrefix.SWITCH_VALVE):
-                _key = key.lower().replace(f"{SectionPrefix.SWITCH_VALVE.value}_", "")
-                data[SectionPrefix.SWITCH_VALVE][_key] = value
-            elif key.startswith(SectionPrefix.PASSIVE_COOLING):
-                _key = key.lower().replace(f"{SectionPrefix.PASSIVE_COOLING.value}_", "")
-                data[SectionPrefix.PASSIVE_COOLING][_key] = value
-            elif key.startswith(SectionPrefix.PHOTOVOLTAICS):
-                _key = key.lower().replace(f"{SectionPrefix.PHOTOVOLTAICS.value}_", "")
-                data[SectionPrefix.PHOTOVOLTAICS][_key] = value[0]
+            metadata: SectionMetadata = SECTION_KEYS[key]
+
+            if metadata.prefix is SectionPrefix.HEAT_CIRCUIT and extra_attributes:
+                await self._extra_attributes_heating_curve(key, value)
+
+            # System and photovoltaics have no positions
+            data[metadata.prefix][metadata.key] = value[0] if metadata.position is None else value
 
         return data
 
@@ -305,18 +414,144 @@ class KebaKeEnergyAPI(BaseEndpoints):
             A dictionary with section as key and reponse data as value
 
         """
+        if not isinstance(request, list):
+            request = [request]
+
+        revalidate: list[Section] = []
+
         if position is None:
-            position = await self.system.get_positions()
+            if self._positions is not None and self._positions_expired():
+                # Revalidate the cached positions with the same request
+                revalidate = [section for section in POSITION_SECTIONS if section not in request]
+
+            position = await self.get_positions() if not revalidate else cast("Position", self._positions)
 
         response: dict[str, list[list[Value]] | list[Value]] = await self._read_data(
-            request=request,
+            request=request + revalidate,
             position=position,
             human_readable=human_readable,
             extra_attributes=extra_attributes,
         )
 
+        if revalidate:
+            self._set_positions(self._parse_positions(response))
+
+            for section in revalidate:
+                del response[self._get_real_key(section)]
+
+            if self._positions != position:
+                return await self.read_data(
+                    request,
+                    position=self._positions,
+                    human_readable=human_readable,
+                    extra_attributes=extra_attributes,
+                )
+
         return await self._group_data(response, extra_attributes=extra_attributes)
 
+    async def subscribe(
+        self,
+        request: Section | list[Section],
+        position: Position | int | list[int] | None = None,
+        *,
+        interval: float = API_DEFAULT_SUBSCRIBE_INTERVAL,
+        policies: Mapping[type[Enum] | Enum, float] | None = None,
+        adaptive: bool = False,
+        min_interval: float = API_DEFAULT_MIN_POLL_INTERVAL,
+        max_interval: float = API_DEFAULT_MAX_POLL_INTERVAL,
+        human_readable: bool = True,
+    ) -> AsyncIterator[list[ValueChange]]:
+        """Poll the values and yield only the values that changed since the previous poll.
+
+        The request is compiled once into a read plan and polled without attributes. The raw values are compared
+        with the previous poll and only changed values are converted. The first poll yields every value.
+
+        Every variable is polled in its own interval from `policies` (see `PollScheduler`) and every poll reads only
+        the due variables with one request. The iteration stops if no variable is polled again.
+
+        Parameters
+        ----------
+        request
+            Section or a list of sections e.g. [BufferTank.NAME, ...]
+        position
+            The number of the installed devices e.g. number of buffer tanks, all installed devices by default
+        interval
+            The time between two polls in seconds for variables without a policy
+        policies
+            The poll interval per section or section member e.g. `DEFAULT_POLL_POLICIES`
+        adaptive
+            Poll changing values faster and unchanged values slower
+        min_interval
+            The shortest adaptive poll interval in seconds
+        max_interval
+            The longest adaptive poll interval in seconds
+        human_readable
+            Return a human-readable string
+
+        Examples
+        --------
+        >>> async for changes in client.subscribe([HeatPump.STATE, HeatPump.FLOW_TEMPERATURE], interval=5):
+        >>>     for change in changes:
+        >>>         print(change.timestamp, change.section, change.position, change.value)
+
+        >>> async for changes in client.subscribe(
+        >>>     [HeatPump.NAME, HeatPump.COMPRESSOR, HeatPump.HEATING_ENERGY],
+        >>>     policies=DEFAULT_POLL_POLICIES,
+        >>>     adaptive=True,
+        >>> ):
+        >>>     print(changes)
+
+        Yields
+        ------
+        list
+            The changed values with the time of the poll
+
+        """
+        if not isinstance(request, list):
+            request = [request]
+
+        _position: Position | list[int]
+
+        if position is None:
+            _position = await self.get_positions()
+        elif isinstance(position, int):
+            _position = [position]
+        else:
+            _position = position
+
+        plan: ReadPlan = self._get_read_plan(request=request, position=_position, allowed_type=None)
+        variables: list[Variable] = self._get_variables(request, _position)
+        tracker: ChangeTracker = ChangeTracker(variables, human_readable=human_readable)
+        scheduler: PollScheduler = PollScheduler(
+            variables,
+            interval=interval,
+            policies=policies,
+            adaptive=adaptive,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
+
+        while True:
+            started: float = monotonic()
+            indexes: list[int] = scheduler.get_due(started)
+
+            if indexes:
+                payload: Payload = (
+                    plan.payload if len(indexes) == len(plan.payload) else [plan.payload[idx] for idx in indexes]
+                )
+                changes: list[ValueChange] = tracker.update(await self._read_vars(payload, plan), indexes=indexes)
+                scheduler.update(indexes, changes, started)
+
+                if changes:
+                    yield changes
+
+            delay: float = scheduler.get_delay(monotonic())
+
+            if delay == math.inf:
+                return
+
+            await asyncio.sleep(delay)
+
     async def write_data(self, request: dict[Section, Any]) -> None:
         """Write multiple data to API with one request.
 
@@ -341,15 +576,26 @@ class KebaKeEnergyAPI(BaseEndpoints):
         self,
         request: Section | list[Section],
         position: Position | int | list[int] | None = None,
+        *,
+        limit: int = API_DEFAULT_PROBE_LIMIT,
+        refresh: bool = False,
     ) -> list[Section]:
         """Return only available section that are supported by the Web HMI software version.
 
+        The sections are probed concurrently and every section is probed only until the first position is
+        available. The results are stored in the capability map `capabilities`, so later calls don't probe
+        known sections again. With a capability store, the capability map is also loaded from and saved to a file.
+
         Parameters
         ----------
         request
             Section or a list of sections e.g. [BufferTank.NAME, ...]
         position
             The number of the installed devices e.g. number of buffer tanks
+        limit
+            The maximum number of concurrent probe requests
+        refresh
+            Probe the sections again, even if they are already in the capability map
 
         Returns
         -------
@@ -366,32 +612,72 @@ class KebaKeEnergyAPI(BaseEndpoints):
         >>> )
 
         """
-        if position is None:
-            position = await self.system.get_positions()
-
         if not isinstance(request, list):
             request = [request]
 
-        if isinstance(position, int):
-            position = [position]
+        sections: list[Section] = list(dict.fromkeys(request))
+        unknown: list[Section] = [section for section in sections if refresh or section not in self.capabilities]
 
-        filtered_sections: list[Section] = []
+        if unknown and self.capability_store is not None and self._capabilities_key is None:
+            self._capabilities_key = await self._get_capabilities_key()
+            stored: dict[Section, bool] = await asyncio.to_thread(self.capability_store.load, self._capabilities_key)
+            self.capabilities = {**stored, **self.capabilities}
+            unknown = [section for section in sections if refresh or section not in self.capabilities]
 
-        payloads = self._generate_read_children_payloads(
-            request=request,
-            position=position,
-        )
+        if unknown:
+            if position is None:
+                position = await self.get_positions()
+
+            if isinstance(position, int):
+                position = [position]
+
+            payloads: dict[Section, list[ReadChildrenPayload]] = {}
+
+            for section in unknown:
+                self.capabilities.pop(section, None)
+
+            for section, payload in self._generate_read_children_payloads(request=unknown, position=position):
+                payloads.setdefault(section, []).append(payload)
 
-        for section, payload in payloads:
-            response: Response = await self._post(
-                payload=json.dumps(payload),
-                endpoint=EndpointPath.READ_VAR_CHILDREN,
+            semaphore: asyncio.Semaphore = asyncio.Semaphore(limit)
+
+            await asyncio.gather(
+                *(self._probe_section(section, payloads[section], semaphore) for section in payloads),
             )
 
-            if response[0]["ret"] == "OK" and section not in filtered_sections:
-                filtered_sections.append(section)
+            if self.capability_store is not None and self._capabilities_key is not None:
+                await asyncio.to_thread(self.capability_store.save, self._capabilities_key, self.capabilities)
+
+        return [section for section in sections if self.capabilities.get(section)]
+
+    async def _get_capabilities_key(self) -> str:
+        hmi_info, system_info, positions = await asyncio.gather(
+            self.system.get_hmi_info(),
+            self.system.get_info(),
+            self.get_positions(),
+        )
+
+        return CapabilityStore.get_key(hmi_info, system_info, positions)
+
+    async def _probe_section(
+        self,
+        section: Section,
+        payloads: list[ReadChildrenPayload],
+        semaphore: asyncio.Semaphore,
+        /,
+    ) -> None:
+        async with semaphore:
+            for payload in payloads:
+                response: Response = await self._post(
+                    payload=self._codec.encode(payload),
+                    endpoint=EndpointPath.READ_VAR_CHILDREN,
+                )
+
+                if response[0]["ret"] == "OK":
+                    self.capabilities[section] = True
+                    return
 
-        return filtered_sections
+            self.capabilities[section] = False
 
     async def _extra_attributes_heating_curve(self, key: str, value: list[list[Value]] | list[Value], /) -> None:
         if key.lower() == self._get_real_key(HeatCircuit.HEATING_CURVE):
@@ -399,6 +685,8 @@ class KebaKeEnergyAPI(BaseEndpoints):
 
             for item in value:
                 if isinstance(item, dict):
-                    item["attributes"]["points"] = [
-                        {"outdoor": d[0], "flow": round(d[1], 2)} for d in heating_curve_points[item["value"]]
-                    ]
+                    item["attributes"] = item["attributes"] | {
+                        "points": [
+                            {"outdoor": d[0], "flow": round(d[1], 2)} for d in heating_curve_points[item["value"]]
+                        ],
+                    }
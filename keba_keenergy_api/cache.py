@@ -0,0 +1,233 @@
+"""Read cache for API variables."""
+
+import re
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Mapping
+from enum import Enum
+from re import Pattern
+from time import monotonic
+from typing import Any
+from typing import TYPE_CHECKING
+from typing import cast
+
+from keba_keenergy_api.constants import SECTION_METADATA
+
+if TYPE_CHECKING:
+    from keba_keenergy_api.endpoints import Payload
+    from keba_keenergy_api.endpoints import Response
+
+INDEX_PATTERN: Pattern[str] = re.compile(r"\[\d+]")
+
+SECTION_MEMBERS: dict[str, Enum] = {member.value.value: member for member in SECTION_METADATA}
+
+
+def get_section_member(name: str, /) -> Enum | None:
+    """Get the section member for a resolved variable name.
+
+    Parameters
+    ----------
+    name
+        The variable name e.g. APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState
+
+    Returns
+    -------
+    Enum or None
+        The section member e.g. HeatPump.STATE
+
+    """
+    return SECTION_MEMBERS.get(name) or SECTION_MEMBERS.get(INDEX_PATTERN.sub("[%s]", name))
+
+
+class ReadCache:
+    """Cache read values by the resolved variable name.
+
+    Every variable is cached with the time to live (in seconds) of its section member, its section or the default
+    time to live, in this order. Variables with a time to live of `0` are not cached. Every invalidation starts a new
+    generation of the variable, the responses of reads that started in an older generation are not cached.
+
+    Examples
+    --------
+    >>> cache = ReadCache(
+    >>>     ttl=5,
+    >>>     policies={
+    >>>         System: 10,
+    >>>         System.HEAT_PUMP_NUMBERS: 3600,
+    >>>         HeatPump.HAS_ACTIVE_COOLING: 3600,
+    >>>         HeatPump.HEAT_METER_TYPE: 3600,
+    >>>     }
+    >>> )
+    >>> client = KebaKeEnergyAPI(host="ap4400.local", cache=cache)
+
+    """
+
+    def __init__(self, ttl: float = 0, policies: Mapping[type[Enum] | Enum, float] | None = None) -> None:
+        self.ttl: float = ttl
+        self.policies: Mapping[type[Enum] | Enum, float] = policies or {}
+        self._ttls: dict[str, float] = {}
+        self._entries: dict[str, tuple[float, str, dict[str, Any]]] = {}
+        self._generation: int = 0
+        self._generations: dict[str, int] = {}
+        self._cleared: int = 0
+
+    def get_ttl(self, name: str, /) -> float:
+        """Get the time to live for a resolved variable name.
+
+        Parameters
+        ----------
+        name
+            The variable name e.g. APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState
+
+        Returns
+        -------
+        float
+            Time to live in seconds
+
+        """
+        ttl: float | None = self._ttls.get(name)
+
+        if ttl is None:
+            member: Enum | None = get_section_member(name)
+            ttl = self.ttl
+
+            if member is not None:
+                ttl = self.policies.get(member, self.policies.get(type(member), self.ttl))
+
+            self._ttls[name] = ttl
+
+        return ttl
+
+    def get_generation(self, name: str, /) -> int:
+        """Get the generation of a variable name.
+
+        Parameters
+        ----------
+        name
+            The variable name
+
+        Returns
+        -------
+        int
+            The generation, it changes with every invalidation of the variable
+
+        """
+        return max(self._cleared, self._generations.get(name, 0))
+
+    def get(self, name: str, attr: str = "1") -> dict[str, Any] | None:
+        """Get a fresh response item from the cache.
+
+        Parameters
+        ----------
+        name
+            The variable name
+        attr
+            `1` if the response item must contain the attributes
+
+        Returns
+        -------
+        dict or None
+            The response item or `None` if the variable is missing or stale, the attributes of a cached item are
+            removed if they were not requested
+
+        """
+        entry: tuple[float, str, dict[str, Any]] | None = self._entries.get(name)
+
+        if entry is None:
+            return None
+
+        expires, cached_attr, item = entry
+
+        if expires <= monotonic():
+            del self._entries[name]
+            return None
+
+        if cached_attr < attr:
+            return None
+
+        if cached_attr > attr:
+            # Serve the same response shape as an uncached read without attributes
+            return {key: value for key, value in item.items() if key != "attributes"}
+
+        return item
+
+    def set(self, name: str, attr: str, item: dict[str, Any], generation: int | None = None) -> None:
+        """Add a response item to the cache.
+
+        Parameters
+        ----------
+        name
+            The variable name
+        attr
+            `1` if the response item contains the attributes
+        item
+            The response item
+        generation
+            The generation of the variable when the read started, the item is not cached if the variable was
+            invalidated meanwhile
+
+        """
+        if generation is not None and generation != self.get_generation(name):
+            return
+
+        ttl: float = self.get_ttl(name)
+
+        if ttl > 0:
+            self._entries[name] = (monotonic() + ttl, attr, item)
+
+    def invalidate(self, names: Iterable[str] | None = None) -> None:
+        """Remove variables from the cache.
+
+        Parameters
+        ----------
+        names
+            The variable names or `None` to clear the whole cache
+
+        """
+        self._generation += 1
+
+        if names is None:
+            self._entries.clear()
+            self._cleared = self._generation
+        else:
+            for name in names:
+                self._entries.pop(name, None)
+                self._generations[name] = self._generation
+
+    async def read(self, payload: "Payload", post: Callable[["Payload"], Awaitable["Response"]]) -> "Response":
+        """Read the payload and fetch only missing or stale variables from the API.
+
+        Parameters
+        ----------
+        payload
+            The read payload
+        post
+            Send the payload to the API
+
+        Returns
+        -------
+        list
+            The response items for the given payload
+
+        """
+        response: list[dict[str, Any] | None] = [self.get(item["name"], str(item.get("attr", "1"))) for item in payload]
+        missing: Payload = [item for item, cached in zip(payload, response, strict=True) if cached is None]
+
+        if missing:
+            # A write during the read must not be overwritten by the older response
+            generations: list[int] = [self.get_generation(item["name"]) for item in missing]
+            fetched: Response = await post(missing)
+            fetched_idx: int = 0
+
+            for idx, cached in enumerate(response):
+                if cached is None:
+                    response[idx] = fetched[fetched_idx]
+                    self.set(
+                        payload[idx]["name"],
+                        str(payload[idx].get("attr", "1")),
+                        fetched[fetched_idx],
+                        generation=generations[fetched_idx],
+                    )
+                    fetched_idx += 1
+
+        return cast("Response", response)
@@ -0,0 +1,104 @@
+"""Persistent capability map for the Web HMI software version."""
+
+import hashlib
+import json
+from dataclasses import asdict
+from os import PathLike
+from pathlib import Path
+from typing import Any
+
+from keba_keenergy_api.constants import SECTION_METADATA
+from keba_keenergy_api.constants import SECTION_NAMES
+from keba_keenergy_api.constants import Section
+from keba_keenergy_api.endpoints import Position
+
+
+class CapabilityStore:
+    """Persist the capability map of `filter_request()` in a JSON file.
+
+    The capability map is stored with a key of the Web HMI and system information and the number of installed
+    devices. A stored capability map is only used as long as the key is unchanged e.g. until a software update.
+
+    Examples
+    --------
+    >>> store = CapabilityStore("/var/lib/keenergy/capabilities.json")
+    >>> client = KebaKeEnergyAPI(host="ap4400.local", capability_store=store)
+
+    """
+
+    def __init__(self, path: str | PathLike[str]) -> None:
+        self.path: Path = Path(path)
+
+    @staticmethod
+    def get_key(hmi_info: dict[str, Any], system_info: dict[str, Any], position: Position) -> str:
+        """Get the key for a Web HMI software version and the installed devices.
+
+        Parameters
+        ----------
+        hmi_info
+            The Web HMI information from `client.system.get_hmi_info()`
+        system_info
+            The system information from `client.system.get_info()`
+        position
+            The number of installed devices
+
+        Returns
+        -------
+        str
+            A SHA-256 hex digest
+
+        """
+        data: str = json.dumps({"hmi": hmi_info, "system": system_info, "position": asdict(position)}, sort_keys=True)
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    def load(self, key: str) -> dict[Section, bool]:
+        """Load the capability map.
+
+        Parameters
+        ----------
+        key
+            The key of the current Web HMI software version and installed devices
+
+        Returns
+        -------
+        dict
+            The stored capability map or an empty dictionary if the file is missing, malformed or has another key
+
+        """
+        try:
+            data: Any = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict) or data.get("key") != key:
+            return {}
+
+        capabilities: Any = data.get("capabilities")
+
+        # Probe again instead of trusting a mangled capability map
+        if not isinstance(capabilities, dict) or not all(isinstance(value, bool) for value in capabilities.values()):
+            return {}
+
+        return {SECTION_NAMES[name]: available for name, available in capabilities.items() if name in SECTION_NAMES}
+
+    def save(self, key: str, capabilities: dict[Section, bool]) -> None:
+        """Save the capability map.
+
+        Parameters
+        ----------
+        key
+            The key of the current Web HMI software version and installed devices
+        capabilities
+            The capability map
+
+        """
+        data: dict[str, Any] = {
+            "key": key,
+            "capabilities": {SECTION_METADATA[section].name: available for section, available in capabilities.items()},
+        }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path: Path = self.path.with_name(f"{self.path.name}.tmp")
+        tmp_path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+        tmp_path.replace(self.path)
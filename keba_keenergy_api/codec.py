@@ -0,0 +1,105 @@
+"""JSON codecs for payload encoding and response decoding."""
+
+import json
+from collections.abc import Callable
+from contextlib import suppress
+from importlib import import_module
+from typing import Any
+from typing import NamedTuple
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+
+class JSONCodec(NamedTuple):
+    """Encode payloads to and decode responses from JSON.
+
+    Examples
+    --------
+    >>> codec = JSONCodec(name="json", encode=json.dumps, decode=json.loads)
+    >>> client = KebaKeEnergyAPI(host="ap4400.local", codec=codec)
+
+    """
+
+    name: str
+    encode: Callable[[Any], str]
+    decode: Callable[[str | bytes], Any]
+
+
+STDLIB_CODEC: JSONCodec = JSONCodec(name="json", encode=json.dumps, decode=json.loads)
+
+
+def _get_orjson_codec() -> JSONCodec:
+    orjson: ModuleType = import_module("orjson")
+
+    def encode(obj: object) -> str:
+        return str(orjson.dumps(obj).decode())
+
+    return JSONCodec(name="orjson", encode=encode, decode=orjson.loads)
+
+
+def _get_msgspec_codec() -> JSONCodec:
+    msgspec_json: ModuleType = import_module("msgspec.json")
+
+    def encode(obj: object) -> str:
+        return str(msgspec_json.encode(obj).decode())
+
+    return JSONCodec(name="msgspec", encode=encode, decode=msgspec_json.decode)
+
+
+CODECS: dict[str, Callable[[], JSONCodec]] = {
+    "orjson": _get_orjson_codec,
+    "msgspec": _get_msgspec_codec,
+    "json": lambda: STDLIB_CODEC,
+}
+
+
+def get_codec(name: str | None = None) -> JSONCodec:
+    """Get a JSON codec by name or the fastest installed codec.
+
+    Without a name, responses are decoded with `orjson` or `msgspec` if installed and the standard library otherwise.
+    Payloads are always encoded with the standard library, because they are serialized only once per read plan and
+    keep the same format as before.
+
+    Parameters
+    ----------
+    name
+        The codec name `orjson`, `msgspec` or `json`
+
+    Returns
+    -------
+    JSONCodec
+        The JSON codec
+
+    Raises
+    ------
+    ValueError
+        If the codec is unknown or not installed
+
+    Examples
+    --------
+    >>> client = KebaKeEnergyAPI(host="ap4400.local", codec=get_codec("orjson"))
+
+    """
+    message: str
+
+    if name is None:
+        for factory in (_get_orjson_codec, _get_msgspec_codec):
+            with suppress(ImportError):
+                return factory()._replace(encode=json.dumps)
+
+        return STDLIB_CODEC
+
+    if name not in CODECS:
+        message = f"Unknown JSON codec {name!r}"
+        raise ValueError(message)
+
+    try:
+        return CODECS[name]()
+    except ImportError as error:
+        message = f"JSON codec {name!r} is not installed"
+        raise ValueError(message) from error
+
+
+DEFAULT_CODEC: JSONCodec = get_codec()
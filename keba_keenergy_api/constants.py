@@ -1,14 +1,39 @@
 """All API Constants."""
 
+import re
 from collections.abc import Callable
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
+from enum import EnumMeta
 from itertools import chain
+from re import Pattern
 from typing import Any
 from typing import Final
+from typing import NamedTuple
 from typing import TypeAlias
+from typing import cast
+from typing import get_args
 
 API_DEFAULT_TIMEOUT: int = 10
+API_DEFAULT_CONNECTION_LIMIT: int = 10
+API_DEFAULT_KEEPALIVE_TIMEOUT: float = 30
+API_DEFAULT_POSITIONS_TTL: float = 3600
+API_DEFAULT_PROBE_LIMIT: int = 5
+API_DEFAULT_SUBSCRIBE_INTERVAL: float = 10
+API_DEFAULT_MIN_POLL_INTERVAL: float = 1
+API_DEFAULT_MAX_POLL_INTERVAL: float = 3600
+API_DEFAULT_SUBSCRIBER_QUEUE_SIZE: int = 100
+API_DEFAULT_FLEET_LIMIT: int = 100
+API_DEFAULT_FLEET_LIMIT_PER_HOST: int = 1
+API_DEFAULT_FLEET_JITTER: float = 1
+API_DEFAULT_SHARD_BATCH_SIZE: int = 64
+
+# Read the values of all installed devices
+ALL: Final = "all"
+
+# Split camel case names e.g. heatCircuit or lowerLimit into snake case words
+CAMEL_CASE_PATTERN: Final[Pattern[str]] = re.compile(r"(?<!^)(?=[A-Z])")
 
 
 class EndpointPath:
@@ -21,20 +46,70 @@ class EndpointPath:
     DATE_TIME: Final[str] = "/dateTime"
 
 
-class BaseEnum(Enum):
+class BaseEnumMeta(EnumMeta):
+    """Build the reverse-lookup tables of an enum once at class creation."""
+
+    _code_members: dict[Any, Enum]
+    _code_names: dict[Any, str]
+
+    def __new__(  # noqa: D102
+        metacls,
+        cls: str,
+        bases: tuple[type, ...],
+        classdict: Any,  # noqa: ANN401
+        **kwds: Any,  # noqa: ANN401
+    ) -> "BaseEnumMeta":
+        enum_class: BaseEnumMeta = super().__new__(metacls, cls, bases, classdict, **kwds)
+        code_members: dict[Any, Enum] = {}
+
+        for member in cast("Iterable[Enum]", enum_class):
+            codes: tuple[Any, ...] = member.value if isinstance(member.value, tuple) else (member.value,)
+
+            for code in codes:
+                code_members.setdefault(code, member)
+
+        enum_class._code_members = code_members
+        enum_class._code_names = {code: member.name.lower() for code, member in code_members.items()}
+
+        return enum_class
+
+
+class BaseEnum(Enum, metaclass=BaseEnumMeta):
     @classmethod
     def _missing_(cls, value: object) -> "BaseEnum":
-        for member in cls:
-            member_value = member._value_
+        member: Enum | None = cls._code_members.get(value)
+
+        if member is None:
+            msg: str = f"{value!r} is not a valid {cls.__name__}"
+            raise ValueError(msg)
 
-            if isinstance(member_value, tuple):
-                if value in member_value:
-                    return member
-            elif value == member_value:  # pragma: no cover
-                return member
+        return cast("BaseEnum", member)
 
-        msg: str = f"{value!r} is not a valid {cls.__name__}"
-        raise ValueError(msg)
+    @classmethod
+    def get_name(cls, value: object, /) -> str:
+        """Get the lowercase member name for a value with one dictionary lookup.
+
+        Parameters
+        ----------
+        value
+            The value or one of the values of a member e.g. 21
+
+        Returns
+        -------
+        str
+            The lowercase member name e.g. pressure_equalization
+
+        Raises
+        ------
+        ValueError
+            If no member has the value
+
+        """
+        try:
+            return cls._code_names[value]
+        except KeyError:
+            msg: str = f"{value!r} is not a valid {cls.__name__}"
+            raise ValueError(msg) from None
 
 
 class BoolEnum(BaseEnum):
@@ -209,6 +284,7 @@ class HeatCircuitCoolRequest(BaseEnum):
 
 MIN_HEATING_CURVE_POINTS: Final[int] = 7
 MAX_HEATING_CURVE_POINTS: Final[int] = 16
+MAX_HEATING_CURVES: Final[int] = 30
 
 
 class SwitchValvePosition(BaseEnum):
@@ -234,7 +310,7 @@ PAYLOAD_PREFIX: Final[str] = "APPL.CtrlAppl"
 class Endpoint:
     value: str
     value_type: type[Any]
-    human_readable: type[Enum] | None = None
+    human_readable: type[BaseEnum] | None = None
     normalize: Callable[[Any], Any] = lambda x: x
     quantity: int = 1
     read_only: bool = True
@@ -1046,6 +1122,17 @@ class Photovoltaics(Enum):
     )
 
 
+POSITION_SECTIONS: Final[tuple[System, ...]] = (
+    System.HEAT_PUMP_NUMBERS,
+    System.HEAT_CIRCUIT_NUMBERS,
+    System.SOLAR_CIRCUIT_NUMBERS,
+    System.BUFFER_TANK_NUMBERS,
+    System.HOT_WATER_TANK_NUMBERS,
+    System.EXTERNAL_HEAT_SOURCE_NUMBERS,
+    System.SWITCH_VALVE_NUMBERS,
+)
+
+
 class SectionPrefix(str, Enum):
     """Section prefixes."""
 
@@ -1073,3 +1160,65 @@ Section: TypeAlias = (
     | PassiveCooling
     | Photovoltaics
 )
+
+
+class SectionMetadata(NamedTuple):
+    """Precomputed metadata of a section member."""
+
+    name: str
+    key: str
+    real_key: str
+    prefix: SectionPrefix
+    position: str | None
+    quantity: int
+    convert: Callable[[Any], float | int | str]
+    get_name: Callable[[Any], str] | None
+
+
+def _get_converter(endpoint: Endpoint, /) -> Callable[[Any], float | int | str]:
+    value_type: type[Any] = endpoint.value_type
+    normalize: Callable[[Any], Any] = endpoint.normalize
+    decimals: int = getattr(endpoint, "decimals", 2)
+
+    def convert(value: Any) -> float | int | str:  # noqa: ANN401
+        value = normalize(value_type(value))
+
+        if isinstance(value, float):
+            return round(value, decimals)
+
+        if isinstance(value, str) and value in ("true", "false"):
+            return 1 if value == "true" else 0
+
+        return cast("float | int | str", value)
+
+    return convert
+
+
+def _get_namer(human_readable: type[BaseEnum] | None, /) -> Callable[[Any], str] | None:
+    return None if human_readable is None else human_readable.get_name
+
+
+def _get_section_metadata(member: Section, /) -> SectionMetadata:
+    prefix: SectionPrefix = SectionPrefix(CAMEL_CASE_PATTERN.sub("_", type(member).__name__).lower())
+    key: str = member.name.lower()
+
+    return SectionMetadata(
+        name=f"{type(member).__name__}.{member.name}",
+        key=key,
+        real_key=f"{prefix.value}_{key}",
+        prefix=prefix,
+        position=None if isinstance(member, System | Photovoltaics) else prefix.value,
+        quantity=member.value.quantity,
+        convert=_get_converter(member.value),
+        get_name=_get_namer(member.value.human_readable),
+    )
+
+
+SECTION_METADATA: Final[dict[Section, SectionMetadata]] = {
+    member: _get_section_metadata(member) for section in get_args(Section) for member in section
+}
+SECTION_KEYS: Final[dict[str, SectionMetadata]] = {
+    metadata.real_key: metadata for metadata in SECTION_METADATA.values()
+}
+# Section members by their picklable name e.g. `HeatPump.STATE`
+SECTION_NAMES: Final[dict[str, Section]] = {metadata.name: member for member, metadata in SECTION_METADATA.items()}
@@ -0,0 +1,321 @@
+"""Share one poll loop between many subscribers."""
+
+import asyncio
+import math
+from collections.abc import Mapping
+from enum import Enum
+from time import monotonic
+from types import TracebackType
+from typing import TYPE_CHECKING
+from typing import TypeAlias
+
+from keba_keenergy_api.constants import API_DEFAULT_MAX_POLL_INTERVAL
+from keba_keenergy_api.constants import API_DEFAULT_MIN_POLL_INTERVAL
+from keba_keenergy_api.constants import API_DEFAULT_SUBSCRIBER_QUEUE_SIZE
+from keba_keenergy_api.constants import API_DEFAULT_SUBSCRIBE_INTERVAL
+from keba_keenergy_api.constants import Section
+from keba_keenergy_api.endpoints import BaseEndpoints
+from keba_keenergy_api.endpoints import Payload
+from keba_keenergy_api.endpoints import Position
+from keba_keenergy_api.endpoints import ReadPayload
+from keba_keenergy_api.endpoints import WritePayload
+from keba_keenergy_api.scheduler import PollScheduler
+from keba_keenergy_api.subscription import ChangeTracker
+from keba_keenergy_api.subscription import ValueChange
+from keba_keenergy_api.subscription import Variable
+
+if TYPE_CHECKING:
+    from keba_keenergy_api.api import KebaKeEnergyAPI
+
+QueueItem: TypeAlias = list[ValueChange] | Exception | None
+
+
+class Subscription:
+    """Receive the changed values of a part of the variables of a `PollCoordinator`.
+
+    Every subscription has a bounded queue. If a subscriber is too slow and the queue is full, the oldest changes are
+    dropped and counted in `dropped`.
+
+    Examples
+    --------
+    >>> subscription = await coordinator.subscribe([HeatPump.STATE, HeatPump.FLOW_TEMPERATURE])
+    >>> async for changes in subscription:
+    >>>     print(changes)
+
+    """
+
+    def __init__(
+        self,
+        coordinator: "PollCoordinator",
+        variables: list[Variable],
+        *,
+        maxsize: int = API_DEFAULT_SUBSCRIBER_QUEUE_SIZE,
+    ) -> None:
+        self.variables: frozenset[Variable] = frozenset(variables)
+        self.queue: asyncio.Queue[QueueItem] = asyncio.Queue(maxsize)
+        self.dropped: int = 0
+        self._coordinator: PollCoordinator = coordinator
+
+    def put(self, item: QueueItem, /) -> None:
+        """Put changes, an error or the end of the subscription into the queue without waiting.
+
+        Parameters
+        ----------
+        item
+            The changed values, the poll error or `None` if the coordinator was stopped
+
+        """
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+
+        self.queue.put_nowait(item)
+
+    def close(self) -> None:
+        """Stop receiving changes, variables without other subscribers are no longer polled."""
+        self._coordinator.unsubscribe(self)
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> list[ValueChange]:
+        item: QueueItem = await self.queue.get()
+
+        if item is None:
+            raise StopAsyncIteration
+
+        if isinstance(item, Exception):
+            raise item
+
+        return item
+
+
+class PollCoordinator(BaseEndpoints):
+    """Poll the union of the variables of all subscriptions with one poll loop and fan the changes out.
+
+    The coordinator shares the connection of the client. Every poll reads only the due variables (see
+    `PollScheduler`) with one request and every subscription receives only the changes of its own variables. New
+    subscriptions receive the current values first. Variables without subscribers are no longer polled. If a poll
+    fails, the error is raised in every subscription and the poll loop stops.
+
+    Examples
+    --------
+    >>> async with KebaKeEnergyAPI(host="ap4400.local") as client, PollCoordinator(client, interval=5) as coordinator:
+    >>>     dashboard = await coordinator.subscribe([HeatPump.STATE, HeatPump.FLOW_TEMPERATURE])
+    >>>     alarms = await coordinator.subscribe(HeatPump.HAS_COMPRESSOR_FAILURE, maxsize=10)
+
+    """
+
+    def __init__(
+        self,
+        client: "KebaKeEnergyAPI",
+        *,
+        interval: float = API_DEFAULT_SUBSCRIBE_INTERVAL,
+        policies: Mapping[type[Enum] | Enum, float] | None = None,
+        adaptive: bool = False,
+        min_interval: float = API_DEFAULT_MIN_POLL_INTERVAL,
+        max_interval: float = API_DEFAULT_MAX_POLL_INTERVAL,
+        human_readable: bool = True,
+    ) -> None:
+        """Initialize the coordinator with a client.
+
+        Parameters
+        ----------
+        client
+            The client for the controller
+        interval
+            The time between two polls in seconds for variables without a policy
+        policies
+            The poll interval per section or section member e.g. `DEFAULT_POLL_POLICIES`
+        adaptive
+            Poll changing values faster and unchanged values slower
+        min_interval
+            The shortest adaptive poll interval in seconds
+        max_interval
+            The longest adaptive poll interval in seconds
+        human_readable
+            Return human-readable strings
+
+        """
+        super().__init__(
+            base_url=client.device_url,
+            auth=client.auth,
+            ssl=client.ssl,
+            skip_ssl_verification=client.skip_ssl_verification,
+            session=client.session,
+            connection=client.connection,
+        )
+
+        self.client: KebaKeEnergyAPI = client
+        self.subscriptions: list[Subscription] = []
+        self._counts: dict[Variable, int] = {}
+        self._items: dict[Variable, ReadPayload | WritePayload] = {}
+        self._values: dict[Variable, ValueChange] = {}
+        self._payload: Payload = []
+        self._tracker: ChangeTracker = ChangeTracker([], human_readable=human_readable)
+        self._scheduler: PollScheduler = PollScheduler(
+            [],
+            interval=interval,
+            policies=policies,
+            adaptive=adaptive,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
+        self._changed: asyncio.Event = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> "PollCoordinator":  # noqa: PYI034
+        self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.stop()
+
+    def start(self) -> None:
+        """Start the poll loop, if it is not running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the poll loop and end every subscription."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        for subscription in self.subscriptions:
+            subscription.put(None)
+
+    async def subscribe(
+        self,
+        request: Section | list[Section],
+        position: Position | int | list[int] | None = None,
+        *,
+        maxsize: int = API_DEFAULT_SUBSCRIBER_QUEUE_SIZE,
+    ) -> Subscription:
+        """Subscribe to the changes of a request and start the poll loop.
+
+        Parameters
+        ----------
+        request
+            Section or a list of sections e.g. [BufferTank.NAME, ...]
+        position
+            The number of the installed devices e.g. number of buffer tanks, all installed devices by default
+        maxsize
+            The maximum number of unread changes
+
+        Returns
+        -------
+        Subscription
+            An async iterator of the changed values
+
+        """
+        if not isinstance(request, list):
+            request = [request]
+
+        _position: Position | list[int]
+
+        if position is None:
+            _position = await self.client.get_positions()
+        elif isinstance(position, int):
+            _position = [position]
+        else:
+            _position = position
+
+        variables: list[Variable] = self._get_variables(request, _position)
+        payload: Payload = self._get_read_plan(request=request, position=_position, allowed_type=None).payload
+        subscription: Subscription = Subscription(self, variables, maxsize=maxsize)
+
+        for variable, item in dict(zip(variables, payload, strict=True)).items():
+            self._items[variable] = item
+            self._counts[variable] = self._counts.get(variable, 0) + 1
+
+        if values := [self._values[variable] for variable in variables if variable in self._values]:
+            subscription.put(values)
+
+        self.subscriptions.append(subscription)
+        self._changed.set()
+        self.start()
+
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription, /) -> None:
+        """Remove a subscription.
+
+        Parameters
+        ----------
+        subscription
+            The subscription to remove
+
+        """
+        if subscription not in self.subscriptions:
+            return
+
+        self.subscriptions.remove(subscription)
+
+        for variable in subscription.variables:
+            self._counts[variable] -= 1
+
+            if self._counts[variable] == 0:
+                del self._counts[variable], self._items[variable]
+
+        self._changed.set()
+
+    def _update_variables(self) -> None:
+        # Only the poll loop changes the polled variables, so a running poll is never mixed with a new payload
+        variables: list[Variable] = list(self._counts)
+
+        self._payload = [self._items[variable] for variable in variables]
+        self._values = {variable: self._values[variable] for variable in variables if variable in self._values}
+        self._tracker.set_variables(variables)
+        self._scheduler.set_variables(variables)
+        self._changed.clear()
+
+    def _publish(self, changes: list[ValueChange], /) -> None:
+        for change in changes:
+            self._values[Variable(change.section, change.position, change.sub_index)] = change
+
+        for subscription in self.subscriptions:
+            if _changes := [
+                change
+                for change in changes
+                if Variable(change.section, change.position, change.sub_index) in subscription.variables
+            ]:
+                subscription.put(_changes)
+
+    async def _poll(self) -> None:
+        started: float = monotonic()
+        indexes: list[int] = self._scheduler.get_due(started)
+
+        if indexes:
+            payload: Payload = [self._payload[idx] for idx in indexes]
+            changes: list[ValueChange] = self._tracker.update(await self._read_vars(payload), indexes=indexes)
+            self._scheduler.update(indexes, changes, started)
+            self._publish(changes)
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                if self._changed.is_set():
+                    self._update_variables()
+
+                await self._poll()
+
+                delay: float = self._scheduler.get_delay(monotonic())
+
+                # Wait for the next due variable or a changed subscription. `asyncio.wait()` is used instead of
+                # `asyncio.wait_for()`, which can swallow the cancellation of `stop()` if the event is set meanwhile.
+                changed: asyncio.Task[bool] = asyncio.create_task(self._changed.wait())
+
+                try:
+                    await asyncio.wait({changed}, timeout=None if delay == math.inf else delay)
+                finally:
+                    changed.cancel()
+        except Exception as error:  # noqa: BLE001
+            for subscription in self.subscriptions:
+                subscription.put(error)
@@ -1,21 +1,37 @@
-import json
-import re
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Hashable
+from collections.abc import Mapping
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
+from functools import cache
+from functools import partial
 from http import HTTPStatus
-from re import Pattern
 from typing import Any
+from typing import Literal
 from typing import NamedTuple
 from typing import TypeAlias
+from typing import TypeVar
 from typing import TypedDict
 from typing import cast
+from typing import overload
 
 from aiohttp import BasicAuth
 from aiohttp import ClientError
 from aiohttp import ClientSession
 from aiohttp import ClientTimeout
-
+from aiohttp import TCPConnector
+
+from keba_keenergy_api.cache import ReadCache
+from keba_keenergy_api.codec import DEFAULT_CODEC
+from keba_keenergy_api.codec import JSONCodec
+from keba_keenergy_api.constants import ALL
+from keba_keenergy_api.constants import API_DEFAULT_CONNECTION_LIMIT
+from keba_keenergy_api.constants import API_DEFAULT_KEEPALIVE_TIMEOUT
 from keba_keenergy_api.constants import API_DEFAULT_TIMEOUT
+from keba_keenergy_api.constants import CAMEL_CASE_PATTERN
 from keba_keenergy_api.constants import BoolEnum
 from keba_keenergy_api.constants import BufferTank
 from keba_keenergy_api.constants import BufferTankOperatingMode
@@ -28,17 +44,52 @@ from keba_keenergy_api.constants import HeatPumpOperatingMode
 from keba_keenergy_api.constants import HotWaterTank
 from keba_keenergy_api.constants import HotWaterTankOperatingMode
 from keba_keenergy_api.constants import LineTablePool
+from keba_keenergy_api.constants import MAX_HEATING_CURVES
 from keba_keenergy_api.constants import MAX_HEATING_CURVE_POINTS
 from keba_keenergy_api.constants import MIN_HEATING_CURVE_POINTS
+from keba_keenergy_api.constants import POSITION_SECTIONS
+from keba_keenergy_api.constants import SECTION_METADATA
 from keba_keenergy_api.constants import PassiveCooling
 from keba_keenergy_api.constants import Photovoltaics
 from keba_keenergy_api.constants import Section
+from keba_keenergy_api.constants import SectionMetadata
 from keba_keenergy_api.constants import SolarCircuit
 from keba_keenergy_api.constants import SwitchValve
 from keba_keenergy_api.constants import System
 from keba_keenergy_api.constants import SystemOperatingMode
 from keba_keenergy_api.error import APIError
 from keba_keenergy_api.error import AuthenticationError
+from keba_keenergy_api.snapshots import BufferTankSnapshot
+from keba_keenergy_api.snapshots import ExternalHeatSourceSnapshot
+from keba_keenergy_api.snapshots import HeatCircuitSnapshot
+from keba_keenergy_api.snapshots import HeatPumpSnapshot
+from keba_keenergy_api.snapshots import HotWaterTankSnapshot
+from keba_keenergy_api.snapshots import PassiveCoolingSnapshot
+from keba_keenergy_api.snapshots import PhotovoltaicsSnapshot
+from keba_keenergy_api.snapshots import SolarCircuitSnapshot
+from keba_keenergy_api.snapshots import SwitchValveSnapshot
+from keba_keenergy_api.snapshots import SystemSnapshot
+from keba_keenergy_api.subscription import Variable
+
+DROPPED_ATTRIBUTES: frozenset[str] = frozenset({"unitId", "longText", "formatId", "dynLowerLimit", "dynUpperLimit"})
+
+
+@cache
+def get_attribute_key(key: str, /) -> str | None:
+    """Get the snake case attribute key or `None` if the attribute is dropped.
+
+    Parameters
+    ----------
+    key
+        The attribute key from the API e.g. lowerLimit
+
+    Returns
+    -------
+    str or None
+        The attribute key e.g. lower_limit
+
+    """
+    return None if key in DROPPED_ATTRIBUTES else CAMEL_CASE_PATTERN.sub("_", key).lower()
 
 
 class ReadPayload(TypedDict):
@@ -88,13 +139,274 @@ Response: TypeAlias = list[dict[str, Any]]
 
 HeatingCurvePoints = tuple[HeatingCurvePoint, ...]
 HeatingCurves: TypeAlias = dict[str, HeatingCurvePoints]
+SnapshotT = TypeVar("SnapshotT")
+Positions: TypeAlias = Sequence[int] | Literal["all"]
+
+
+@dataclass
+class HeatingCurveCache:
+    """Cached heating curve names and points.
+
+    The cache is only valid as long as the version counters (`verCnt`) of the line table pool are unchanged.
+
+    """
+
+    versions: tuple[str, ...] = ()
+    curves: tuple[tuple[int, str], ...] | None = None
+    points: HeatingCurves | None = None
+
+
+class ReadPlanEntry(NamedTuple):
+    key: str
+    section: Section
+
+
+@dataclass(frozen=True)
+class ReadPlan:
+    """Precompiled read request for a fixed request, position and attribute combination.
+
+    The payload is serialized only once. The decoding table has one entry per section and position in the order of
+    the response items.
+
+    """
+
+    payload: Payload
+    data: str
+    entries: tuple[ReadPlanEntry, ...]
+    attributes: bool = True
+
+
+class ReadCoalescer:
+    """Merge read requests into one request to the API.
+
+    All reads that are issued within the same event loop iteration (window `0`) or within the given time window in
+    seconds are sent as one merged payload. The response is split and returned to each caller in order.
+
+    **Attention!** If the merged request fails, every caller of the batch gets the same error.
+
+    """
+
+    def __init__(self, window: float = 0) -> None:
+        self.window: float = window
+        self._payload: Payload = []
+        self._waiters: list[tuple[int, int, asyncio.Future[Response]]] = []
+        self._post: Callable[[Payload], Awaitable[Response]] | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def read(self, payload: Payload, post: Callable[[Payload], Awaitable[Response]]) -> Response:
+        """Add a read payload to the current batch and wait for its part of the response.
+
+        Parameters
+        ----------
+        payload
+            The read payload
+        post
+            Send the merged payload, the callable of the first caller of a batch is used
+
+        Returns
+        -------
+        list
+            The response items for the given payload
+
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        future: asyncio.Future[Response] = loop.create_future()
+
+        self._waiters.append((len(self._payload), len(payload), future))
+        self._payload += payload
+
+        if self._post is None:
+            self._post = post
+
+            if self.window > 0:
+                loop.call_later(self.window, self._flush)
+            else:
+                loop.call_soon(self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        task: asyncio.Task[None] = asyncio.ensure_future(
+            self._send(self._payload, self._waiters, cast("Callable[[Payload], Awaitable[Response]]", self._post)),
+        )
+
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        self._payload = []
+        self._waiters = []
+        self._post = None
+
+    @staticmethod
+    async def _send(
+        payload: Payload,
+        waiters: list[tuple[int, int, asyncio.Future[Response]]],
+        post: Callable[[Payload], Awaitable[Response]],
+    ) -> None:
+        try:
+            response: Response = await post(payload)
+        except Exception as error:  # noqa: BLE001
+            for _, _, future in waiters:
+                if not future.done():
+                    future.set_exception(error)
+        else:
+            for start, length, future in waiters:
+                if not future.done():
+                    future.set_result(response[start : start + length])
+
+
+class SingleFlight:
+    """Share one in-flight read between concurrent callers that read the same variables.
+
+    Concurrent reads with an identical payload wait for the same request. Every caller gets its own copy of the
+    response, so that each caller can decode it independently.
+
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[tuple[tuple[str, str], ...], asyncio.Future[Response]] = {}
+
+    async def read(self, payload: Payload, post: Callable[[Payload], Awaitable[Response]]) -> Response:
+        """Read the payload or join a running request with the same payload.
+
+        Parameters
+        ----------
+        payload
+            The read payload
+        post
+            Send the payload to the API
+
+        Returns
+        -------
+        list
+            The response items for the given payload
+
+        """
+        # Key on the variables instead of serializing the payload again, a cached read plan is already encoded
+        key: tuple[tuple[str, str], ...] = tuple((item["name"], str(item.get("attr", "1"))) for item in payload)
+        future: asyncio.Future[Response] | None = self._calls.get(key)
+
+        if future is None:
+            future = asyncio.ensure_future(post(payload))
+            self._calls[key] = future
+            future.add_done_callback(lambda _: self._calls.pop(key, None))
+
+        return list(await asyncio.shield(future))
+
+
+class Connection:
+    """Keep-alive connection shared by the client and all section endpoints.
+
+    The aiohttp client session and its connector are created lazily on the first request and reused until
+    `close()` is called. An external session is used as it is and is never closed by the connection.
+
+    """
+
+    MAX_READ_PLANS: int = 128
+    MAX_SHARED_ATTRIBUTES: int = 4096
+
+    def __init__(
+        self,
+        session: ClientSession | None = None,
+        *,
+        limit: int = API_DEFAULT_CONNECTION_LIMIT,
+        keepalive_timeout: float = API_DEFAULT_KEEPALIVE_TIMEOUT,
+        coalesce_window: float | None = None,
+        single_flight: bool = True,
+        cache: ReadCache | None = None,
+        heating_curve_cache: bool = False,
+        share_attributes: bool = False,
+        codec: JSONCodec | None = None,
+        cache_attributes: bool = False,
+    ) -> None:
+        self._session: ClientSession | None = session
+        self._owns_session: bool = session is None
+        self._limit: int = limit
+        self._keepalive_timeout: float = keepalive_timeout
+        self.coalescer: ReadCoalescer | None = None if coalesce_window is None else ReadCoalescer(coalesce_window)
+        self.single_flight: SingleFlight | None = SingleFlight() if single_flight else None
+        self.cache: ReadCache | None = cache
+        self.heating_curves: HeatingCurveCache | None = HeatingCurveCache() if heating_curve_cache else None
+        self.read_plans: dict[Hashable, ReadPlan] = {}
+        self.attributes: dict[Hashable, dict[str, Any]] | None = {} if share_attributes else None
+        self.codec: JSONCodec = codec or DEFAULT_CODEC
+        self.variable_attributes: dict[str, dict[str, Any]] | None = {} if cache_attributes else None
+        # Get the cached number of installed devices, set by the client
+        self.get_positions: Callable[[], Awaitable[Position]] | None = None
+        # Get the capability map of `filter_request()`, set by the client
+        self.get_capabilities: Callable[[], dict[Section, bool]] | None = None
+
+    @property
+    def session(self) -> ClientSession | None:
+        """Get the current client session or `None` if no session was created yet."""
+        return self._session
+
+    def get_session(self) -> ClientSession:
+        """Get the shared client session and create it if necessary.
+
+        Returns
+        -------
+        ClientSession
+            The shared aiohttp client session
+
+        """
+        if self._owns_session and (self._session is None or self._session.closed):
+            self._session = ClientSession(
+                connector=TCPConnector(limit=self._limit, keepalive_timeout=self._keepalive_timeout),
+                timeout=ClientTimeout(total=API_DEFAULT_TIMEOUT),
+            )
+
+        return cast("ClientSession", self._session)
+
+    async def read(self, payload: Payload, post: Callable[[Payload], Awaitable[Response]]) -> Response:
+        """Read the payload with the read cache, single-flight deduplication and request coalescing if enabled.
+
+        Parameters
+        ----------
+        payload
+            The read payload
+        post
+            Send the payload to the API
+
+        Returns
+        -------
+        list
+            The response items for the given payload
+
+        """
+        if self.coalescer:
+            post = partial(self.coalescer.read, post=post)
+
+        if self.single_flight:
+            post = partial(self.single_flight.read, post=post)
+
+        if self.cache:
+            return await self.cache.read(payload, post)
+
+        return await post(payload)
+
+    def invalidate(self, payload: Payload) -> None:
+        """Remove written variables from the read cache.
+
+        Parameters
+        ----------
+        payload
+            The write payload
+
+        """
+        if self.cache:
+            self.cache.invalidate(item["name"] for item in payload)
+
+    async def close(self) -> None:
+        """Close the client session and its connector if it was created by the connection."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
 
 
 class BaseEndpoints:
     """Base class for all endpoint classes."""
 
-    KEY_PATTERN: Pattern[str] = re.compile(r"(?<!^)(?=[A-Z])")
-
     def __init__(
         self,
         base_url: str,
@@ -103,20 +415,26 @@ class BaseEndpoints:
         ssl: bool,
         skip_ssl_verification: bool,
         session: ClientSession | None = None,
+        connection: Connection | None = None,
     ) -> None:
         self._base_url: str = base_url
         self._auth: BasicAuth | None = auth
         self._ssl: bool = ssl
         self._skip_ssl_verification: bool = skip_ssl_verification
         self._session: ClientSession | None = session
+        self._connection: Connection | None = connection
+
+    @property
+    def _codec(self) -> JSONCodec:
+        return self._connection.codec if self._connection else DEFAULT_CODEC
 
     async def _post(self, payload: str | None = None, endpoint: str | None = None) -> Response:
         """Run a POST request against the API."""
-        session: ClientSession = (
-            self._session
-            if self._session and not self._session.closed
-            else ClientSession(timeout=ClientTimeout(total=API_DEFAULT_TIMEOUT))
-        )
+        session: ClientSession | None = self._connection.get_session() if self._connection else self._session
+        close_session: bool = session is None or session.closed
+
+        if session is None or close_session:
+            session = ClientSession(timeout=ClientTimeout(total=API_DEFAULT_TIMEOUT))
 
         try:
             url: str = f"{self._base_url}{endpoint or ''}"
@@ -128,7 +446,7 @@ class BaseEndpoints:
                 data=payload,
             ) as resp:
                 if resp.status <= HTTPStatus.MULTIPLE_CHOICES or resp.status == HTTPStatus.INTERNAL_SERVER_ERROR:
-                    response: list[dict[str, Any]] = await resp.json()
+                    response: list[dict[str, Any]] = await resp.json(loads=self._codec.decode)
 
                     if (
                         resp.status == HTTPStatus.INTERNAL_SERVER_ERROR
@@ -150,25 +468,36 @@ class BaseEndpoints:
         except ClientError as error:
             raise APIError(str(error)) from error
         finally:
-            if not self._session:
+            if close_session:
                 await session.close()
 
-    def _get_real_key(self, key: Section, /, *, key_prefix: bool = True) -> str:
-        class_name: str = key.__class__.__name__
-        _real_key: str = key.name.lower()
+    async def _post_read_vars(self, payload: Payload, /, plan: ReadPlan | None = None) -> Response:
+        return await self._post(
+            payload=plan.data if plan is not None and payload is plan.payload else self._codec.encode(payload),
+            endpoint=EndpointPath.READ_WRITE_VARS,
+        )
+
+    async def _read_vars(self, payload: Payload, /, plan: ReadPlan | None = None) -> Response:
+        post: Callable[[Payload], Awaitable[Response]] = partial(self._post_read_vars, plan=plan)
 
-        if key_prefix is True:
-            _real_key = f"{self.KEY_PATTERN.sub('_', class_name).lower()}_{_real_key}"
+        if self._connection:
+            return await self._connection.read(payload, post)
 
-        return _real_key
+        return await post(payload)
 
-    def _get_position_index(self, section: Section, position: Position | list[int]) -> list[bool | int]:
+    @staticmethod
+    def _get_real_key(key: Section, /, *, key_prefix: bool = True) -> str:
+        metadata: SectionMetadata = SECTION_METADATA[key]
+        return metadata.real_key if key_prefix is True else metadata.key
+
+    @staticmethod
+    def _get_position_index(section: Section, position: Position | list[int]) -> list[bool | int]:
         idx: list[bool | int] = []
+        position_key: str | None = SECTION_METADATA[section].position
 
-        if isinstance(section, System | Photovoltaics):
+        if position_key is None:
             idx = [True]
         elif isinstance(position, Position):
-            position_key: str = f"{self.KEY_PATTERN.sub('_', section.__class__.__name__).lower()}"
             _position: int | None = getattr(position, position_key, None)
             idx = list(range(_position)) if _position else [False]
         elif isinstance(position, list):
@@ -192,10 +521,12 @@ class BaseEndpoints:
                     if idx is False:
                         continue
 
-                    for sub_idx in range(idx * 2, section.value.quantity + idx * 2):
+                    quantity: int = SECTION_METADATA[section].quantity
+
+                    for sub_idx in range(idx * 2, quantity + idx * 2):
                         name: str = section.value.value if idx is True else section.value.value % idx
 
-                        if section.value.quantity > 1:
+                        if quantity > 1:
                             name = section.value.value % sub_idx
 
                         payload += [
@@ -207,6 +538,81 @@ class BaseEndpoints:
 
         return payload
 
+    def _get_variables(self, request: list[Section], position: Position | list[int]) -> list[Variable]:
+        # Same order as the read payload
+        variables: list[Variable] = []
+
+        for section in request:
+            quantity: int = SECTION_METADATA[section].quantity
+
+            for idx in self._get_position_index(section=section, position=position):
+                if idx is False:
+                    continue
+
+                variables += [
+                    Variable(section=section, position=None if idx is True else idx + 1, sub_index=sub_index)
+                    for sub_index in range(quantity)
+                ]
+
+        return variables
+
+    def _get_read_plan(
+        self,
+        request: list[Section],
+        position: Position | list[int],
+        allowed_type: list[type[Enum]] | None,
+        *,
+        key_prefix: bool = True,
+        extra_attributes: bool = False,
+    ) -> ReadPlan:
+        _position: tuple[Any, ...] = (
+            (Position, *vars(position).values()) if isinstance(position, Position) else tuple(position)
+        )
+        plan_key: Hashable = (
+            tuple(request),
+            _position,
+            tuple(allowed_type) if allowed_type else None,
+            key_prefix,
+            extra_attributes,
+        )
+
+        plans: dict[Hashable, ReadPlan] = self._connection.read_plans if self._connection else {}
+        plan: ReadPlan | None = plans.get(plan_key)
+
+        if plan is None:
+            payload: Payload = self._generate_read_payload(
+                request=request,
+                position=position,
+                allowed_type=allowed_type,
+                extra_attributes=extra_attributes,
+            )
+
+            entries: list[ReadPlanEntry] = []
+
+            for section in request:
+                if (allowed_type and type(section) in allowed_type) or not allowed_type:
+                    response_key: str = self._get_real_key(section, key_prefix=key_prefix)
+
+                    entries += [
+                        ReadPlanEntry(key=response_key, section=section)
+                        for idx in self._get_position_index(section=section, position=position)
+                        if idx is not False
+                    ]
+
+            plan = ReadPlan(
+                payload=payload,
+                data=self._codec.encode(payload),
+                entries=tuple(entries),
+                attributes=extra_attributes,
+            )
+
+            if len(plans) >= Connection.MAX_READ_PLANS:
+                del plans[next(iter(plans))]
+
+            plans[plan_key] = plan
+
+        return plan
+
     def _generate_read_children_payloads(
         self,
         request: list[Section],
@@ -227,98 +633,107 @@ class BaseEndpoints:
         return payloads
 
     @staticmethod
-    def _convert_value(section: Section, response: Response, *, human_readable: bool) -> float | int | str:
-        message: str
-
+    def _convert_value(section: Section, item: dict[str, Any]) -> float | int | str:
         try:
-            value: float | int | str = section.value.value_type(response[0]["value"])
+            return SECTION_METADATA[section].convert(item["value"])
         except ValueError as error:
-            message = f'Can\'t convert value to type "{section.value.value_type.__name__}"! {response[0]}'
+            message: str = f'Can\'t convert value to type "{section.value.value_type.__name__}"! {item}'
             raise APIError(message) from error
 
-        value = section.value.normalize(value)
-
-        if isinstance(value, float):
-            value = round(value, section.value.decimals)
+    @staticmethod
+    def _get_human_readable_value(section: Section, item: dict[str, Any], raw_value: float | str) -> str:
+        try:
+            return cast("Callable[[Any], str]", SECTION_METADATA[section].get_name)(raw_value)
+        except ValueError as error:
+            message: str = f"Can't convert value to human readable value! {item}"
+            raise APIError(message) from error
 
-        if value in ["true", "false"]:
-            value = 1 if value == "true" else 0
+    def _clean_attributes(self, item: dict[str, Any]) -> dict[str, Any]:
+        attributes: dict[str, Any] = item.get("attributes", {})
+        shared: dict[Hashable, dict[str, Any]] | None = self._connection.attributes if self._connection else None
+        shared_key: Hashable = None
 
-        if human_readable and section.value.human_readable:
+        if shared is not None:
             try:
-                value = section.value.human_readable(value).name.lower()
-            except ValueError as error:
-                message = f"Can't convert value to human readable value! {response[0]}"
-                raise APIError(message) from error
+                shared_key = tuple(attributes.items())
+                converted_attributes: dict[str, Any] | None = shared.get(shared_key)
+            except TypeError:
+                shared = None
+            else:
+                if converted_attributes is not None:
+                    return converted_attributes
 
-        return value
-
-    @staticmethod
-    def _clean_attributes(response: Response) -> dict[str, Any]:
-        attributes: dict[str, Any] = response[0].get("attributes", {})
-        converted_attributes: dict[str, Any] = {}
-        re_pattern: Pattern[str] = re.compile(r"(?<!^)(?=[A-Z])")
+        converted_attributes = {}
 
         for key, value in attributes.items():
-            if key not in ["unitId", "longText", "formatId", "dynLowerLimit", "dynUpperLimit"]:
-                new_attr_key: str = re_pattern.sub("_", key).lower()
+            new_attr_key: str | None = get_attribute_key(key)
+
+            if new_attr_key is not None:
                 converted_attributes[new_attr_key] = value
 
+        if shared is not None and len(shared) < Connection.MAX_SHARED_ATTRIBUTES:
+            shared[shared_key] = converted_attributes
+
         return converted_attributes
 
     def _get_response_data(
         self,
         response: Response,
         /,
-        request: list[Section],
-        position: Position | list[int],
-        allowed_type: type[Enum] | list[type[Enum]] | None = None,
+        plan: ReadPlan,
         *,
-        key_prefix: bool = True,
         human_readable: bool = True,
+        attributes: Sequence[dict[str, Any]] | None = None,
     ) -> dict[str, list[list[Value]] | list[Value]]:
         _response_without_quantity: dict[str, list[Value]] = {}
         _response_with_quantity: dict[str, list[list[Value]]] = {}
+        variable_attributes: dict[str, dict[str, Any]] | None = (
+            self._connection.variable_attributes if self._connection and plan.attributes else None
+        )
 
-        for section in request:
-            if (allowed_type and type(section) in allowed_type) or not allowed_type:
-                for idx in self._get_position_index(section=section, position=position):
-                    if idx is False:
-                        continue
+        # Walk the response once with a cursor, the response itself is not modified
+        cursor: int = 0
 
-                    response_key: str = self._get_real_key(section, key_prefix=key_prefix)
-                    response_group: list[Value] = []
+        for response_key, section in plan.entries:
+            response_group: list[Value] = []
+            metadata: SectionMetadata = SECTION_METADATA[section]
+            quantity: int = metadata.quantity
 
-                    for _ in range(1, section.value.quantity + 1):
-                        value: float | int | str = self._convert_value(
-                            section,
-                            response=response,
-                            human_readable=human_readable,
-                        )
+            for _ in range(quantity):
+                item: dict[str, Any] = response[cursor]
+                _attributes: dict[str, Any]
 
-                        raw_value: float | int | str = self._convert_value(
-                            section,
-                            response=response,
-                            human_readable=False,
-                        )
+                if attributes is not None:
+                    _attributes = attributes[cursor]
+                else:
+                    _attributes = self._clean_attributes(item)
 
-                        attributes: dict[str, Any] = self._clean_attributes(response=response)
+                    if variable_attributes is not None:
+                        variable_attributes[plan.payload[cursor]["name"]] = _attributes
 
-                        if value != raw_value:
-                            attributes = attributes | {"raw_value": raw_value}
+                cursor += 1
 
-                        _value: Value = {
-                            "value": value,
-                            "attributes": attributes,
-                        }
+                # Convert the raw value once and derive the human-readable value from it
+                raw_value: float | int | str = self._convert_value(section, item)
+                value: float | int | str = raw_value
 
-                        response_group.append(_value)
-                        del response[0]
+                if human_readable and metadata.get_name is not None:
+                    value = self._get_human_readable_value(section, item, raw_value)
 
-                    if section.value.quantity == 1:
-                        _response_without_quantity.setdefault(response_key, []).append(response_group[0])
-                    else:
-                        _response_with_quantity.setdefault(response_key, []).append(response_group)
+                    if value != raw_value:
+                        _attributes = _attributes | {"raw_value": raw_value}
+
+                _value: Value = {
+                    "value": value,
+                    "attributes": _attributes,
+                }
+
+                response_group.append(_value)
+
+            if quantity == 1:
+                _response_without_quantity.setdefault(response_key, []).append(response_group[0])
+            else:
+                _response_with_quantity.setdefault(response_key, []).append(response_group)
 
         _response: dict[str, list[Value] | list[list[Value]]] = {}
         _response.update(_response_without_quantity)
@@ -329,7 +744,7 @@ class BaseEndpoints:
     async def _read_data(
         self,
         request: Section | list[Section],
-        position: Position | int | list[int] = 1,
+        position: Position | int | Positions = 1,
         allowed_type: type[Enum] | list[type[Enum]] | None = None,
         *,
         key_prefix: bool = True,
@@ -339,33 +754,128 @@ class BaseEndpoints:
         if not isinstance(request, list):
             request = [request]
 
-        if isinstance(position, int):
+        if position == ALL:
+            position = await self._get_installed_positions()
+        elif isinstance(position, int):
             position = [position]
+        elif not isinstance(position, Position | list):
+            position = list(position)
 
         if isinstance(allowed_type, type):
             allowed_type = [allowed_type]
 
-        payload: Payload = self._generate_read_payload(
+        plan: ReadPlan = self._get_read_plan(
             request=request,
             position=position,
             allowed_type=allowed_type,
+            key_prefix=key_prefix,
             extra_attributes=extra_attributes,
         )
 
-        response: Response = await self._post(
-            payload=json.dumps(payload),
-            endpoint=EndpointPath.READ_WRITE_VARS,
+        # Nothing to read e.g. `ALL` without installed devices
+        if not plan.payload:
+            return {}
+
+        attributes: list[dict[str, Any]] | None = None
+        variable_attributes: dict[str, dict[str, Any]] | None = (
+            self._connection.variable_attributes if self._connection else None
         )
 
-        return self._get_response_data(
-            response,
+        if plan.attributes and variable_attributes is not None:
+            # Poll only the values if the attributes of all variables are already known
+            try:
+                attributes = [variable_attributes[item["name"]] for item in plan.payload]
+            except KeyError:
+                pass
+            else:
+                plan = self._get_read_plan(
+                    request=request,
+                    position=position,
+                    allowed_type=allowed_type,
+                    key_prefix=key_prefix,
+                    extra_attributes=False,
+                )
+
+        response: Response = await self._read_vars(plan.payload, plan)
+
+        return self._get_response_data(response, plan, human_readable=human_readable, attributes=attributes)
+
+    @classmethod
+    def _parse_positions(
+        cls,
+        response: Mapping[str, list[list[Value]] | list[Value]],
+        /,
+        *,
+        key_prefix: bool = True,
+    ) -> Position:
+        # Shared by the position reads and the piggybacked revalidation in `read_data()`
+        return Position(
+            **{
+                SECTION_METADATA[section].key.replace("_numbers", ""): int(
+                    cast("list[Value]", response[cls._get_real_key(section, key_prefix=key_prefix)])[0]["value"],
+                )
+                for section in POSITION_SECTIONS
+            },
+        )
+
+    async def _read_positions(self) -> Position:
+        response: dict[str, list[list[Value]] | list[Value]] = await self._read_data(
+            request=list(POSITION_SECTIONS),
+            key_prefix=False,
+            allowed_type=System,
+            extra_attributes=True,
+        )
+
+        return self._parse_positions(response, key_prefix=False)
+
+    async def _get_installed_positions(self) -> Position:
+        if self._connection and self._connection.get_positions:
+            return await self._connection.get_positions()
+
+        return await self._read_positions()
+
+    async def _get_snapshot(
+        self,
+        snapshot: type[SnapshotT],
+        section: type[Enum],
+        position: int = 1,
+        *,
+        human_readable: bool = True,
+        members: Sequence[Section] | None = None,
+    ) -> SnapshotT:
+        capabilities: dict[Section, bool] = (
+            self._connection.get_capabilities() if self._connection and self._connection.get_capabilities else {}
+        )
+
+        if members is None:
+            # Private members are only used to write values
+            members = [cast("Section", member) for member in section if not member.name.startswith("_")]
+        elif invalid := [member for member in members if not isinstance(member, section)]:
+            message: str = f"Invalid members {invalid} for {section.__name__}"
+            raise APIError(message)
+
+        # Skip the members that are not supported by the Web HMI software version
+        request: list[Section] = [member for member in members if capabilities.get(member, True)]
+
+        if not request:
+            return snapshot()
+
+        response: dict[str, list[list[Value]] | list[Value]] = await self._read_data(
             request=request,
             position=position,
-            allowed_type=allowed_type,
-            key_prefix=key_prefix,
             human_readable=human_readable,
         )
 
+        values: dict[str, Any] = {}
+
+        for member in request:
+            value: Value | list[Value] = response[self._get_real_key(member)][0]
+            values[member.name.lower()] = (
+                tuple(item["value"] for item in value) if isinstance(value, list) else value["value"]
+            )
+
+        return snapshot(**values)
+
     def _generate_write_payload(self, request: dict[Section, Any]) -> Payload:
         payload: Payload = []
 
@@ -404,36 +914,81 @@ class BaseEndpoints:
         payload: Payload = self._generate_write_payload(request)
 
         await self._post(
-            payload=json.dumps(payload),
+            payload=self._codec.encode(payload),
             endpoint=f"{EndpointPath.READ_WRITE_VARS}?action=set",
         )
 
+        # Invalidate after the write, so reads during the write can't cache the old values again
+        if self._connection:
+            self._connection.invalidate(payload)
+
     @staticmethod
     def _get_allowed_values(enum: type[Enum], /) -> list[str]:
         return [item for pair in ((_.name, str(_.value)) for _ in enum) for item in pair]
 
-    def _get_int_or_str_value(
+    def _get_raw_values(
         self,
         response: dict[str, list[list[Value]] | list[Value]],
         /,
         *,
         section: Section,
-        position: int | None = None,
-        index: int = 0,
-    ) -> int | str:
-        _idx: int = position - 1 if position else 0
-        _key: str = self._get_real_key(section)
+        index: int,
+        attribute: str | None,
+    ) -> list[Any]:
+        # The response contains one value for every requested position in position order
+        values: list[Any] = []
 
-        value: Value | list[Value] = response[_key][_idx]
-        _value: str | int = value[index]["value"] if isinstance(value, list) else value["value"]
+        for value in response.get(self._get_real_key(section), []):
+            item: Value = value[index] if isinstance(value, list) else value
+            values.append(item["attributes"][attribute] if attribute else item["value"])
 
+        return values
+
+    @staticmethod
+    def _to_int_or_str(value: Any) -> int | str:  # noqa: ANN401
         try:
-            _value = int(_value)
+            return int(value)
         except ValueError:
-            _value = str(_value)
+            return str(value)
+
+    @overload
+    def _get_int_or_str_value(
+        self,
+        response: dict[str, list[list[Value]] | list[Value]],
+        /,
+        *,
+        section: Section,
+        position: int | None = None,
+        index: int = 0,
+    ) -> int | str: ...
+
+    @overload
+    def _get_int_or_str_value(
+        self,
+        response: dict[str, list[list[Value]] | list[Value]],
+        /,
+        *,
+        section: Section,
+        position: Positions,
+        index: int = 0,
+    ) -> list[int | str]: ...
 
-        return _value
+    def _get_int_or_str_value(
+        self,
+        response: dict[str, list[list[Value]] | list[Value]],
+        /,
+        *,
+        section: Section,
+        position: int | Positions | None = None,
+        index: int = 0,
+    ) -> int | str | list[int | str]:
+        values: list[int | str] = [
+            self._to_int_or_str(value)
+            for value in self._get_raw_values(response, section=section, index=index, attribute=None)
+        ]
+        return values[0] if position is None or isinstance(position, int) else values
 
+    @overload
     def _get_float_value(
         self,
         response: dict[str, list[list[Value]] | list[Value]],
@@ -443,20 +998,36 @@ class BaseEndpoints:
         position: int | None = None,
         index: int = 0,
         attribute: str | None = None,
-    ) -> float:
-        _idx: int = position - 1 if position else 0
-        _key: str = self._get_real_key(section)
+    ) -> float: ...
 
-        value: Value | list[Value] = response[_key][_idx]
+    @overload
+    def _get_float_value(
+        self,
+        response: dict[str, list[list[Value]] | list[Value]],
+        /,
+        *,
+        section: Section,
+        position: Positions,
+        index: int = 0,
+        attribute: str | None = None,
+    ) -> list[float]: ...
 
-        return float(
-            (
-                (value[index]["attributes"][attribute] if attribute else value[index]["value"])
-                if isinstance(value, list)
-                else (value["attributes"][attribute] if attribute else value["value"])
-            ),
-        )
+    def _get_float_value(
+        self,
+        response: dict[str, list[list[Value]] | list[Value]],
+        /,
+        *,
+        section: Section,
+        position: int | Positions | None = None,
+        index: int = 0,
+        attribute: str | None = None,
+    ) -> float | list[float]:
+        values: list[float] = [
+            float(value) for value in self._get_raw_values(response, section=section, index=index, attribute=attribute)
+        ]
+        return values[0] if position is None or isinstance(position, int) else values
 
+    @overload
     def _get_int_value(
         self,
         response: dict[str, list[list[Value]] | list[Value]],
@@ -466,20 +1037,36 @@ class BaseEndpoints:
         position: int | None = None,
         index: int = 0,
         attribute: str | None = None,
-    ) -> int:
-        _idx: int = position - 1 if position else 0
-        _key: str = self._get_real_key(section)
+    ) -> int: ...
 
-        value: Value | list[Value] = response[_key][_idx]
+    @overload
+    def _get_int_value(
+        self,
+        response: dict[str, list[list[Value]] | list[Value]],
+        /,
+        *,
+        section: Section,
+        position: Positions,
+        index: int = 0,
+        attribute: str | None = None,
+    ) -> list[int]: ...
 
-        return int(
-            (
-                (value[index]["attributes"][attribute] if attribute else value[index]["value"])
-                if isinstance(value, list)
-                else (value["attributes"][attribute] if attribute else value["value"])
-            ),
-        )
+    def _get_int_value(
+        self,
+        response: dict[str, list[list[Value]] | list[Value]],
+        /,
+        *,
+        section: Section,
+        position: int | Positions | None = None,
+        index: int = 0,
+        attribute: str | None = None,
+    ) -> int | list[int]:
+        values: list[int] = [
+            int(value) for value in self._get_raw_values(response, section=section, index=index, attribute=attribute)
+        ]
+        return values[0] if position is None or isinstance(position, int) else values
 
+    @overload
     def _get_str_value(
         self,
         response: dict[str, list[list[Value]] | list[Value]],
@@ -488,13 +1075,32 @@ class BaseEndpoints:
         section: Section,
         position: int | None = None,
         index: int = 0,
-    ) -> str:
-        _idx: int = position - 1 if position else 0
-        _key: str = self._get_real_key(section)
+    ) -> str: ...
 
-        value: Value | list[Value] = response[_key][_idx]
+    @overload
+    def _get_str_value(
+        self,
+        response: dict[str, list[list[Value]] | list[Value]],
+        /,
+        *,
+        section: Section,
+        position: Positions,
+        index: int = 0,
+    ) -> list[str]: ...
 
-        return str(value[index]["value"] if isinstance(value, list) else value["value"])
+    def _get_str_value(
+        self,
+        response: dict[str, list[list[Value]] | list[Value]],
+        /,
+        *,
+        section: Section,
+        position: int | Positions | None = None,
+        index: int = 0,
+    ) -> str | list[str]:
+        values: list[str] = [
+            str(value) for value in self._get_raw_values(response, section=section, index=index, attribute=None)
+        ]
+        return values[0] if position is None or isinstance(position, int) else values
 
 
 class SystemEndpoints(BaseEndpoints):
@@ -521,6 +1127,7 @@ class SystemEndpoints(BaseEndpoints):
         ssl: bool,
         skip_ssl_verification: bool,
         session: ClientSession | None = None,
+        connection: Connection | None = None,
     ) -> None:
         super().__init__(
             base_url=base_url,
@@ -528,6 +1135,37 @@ class SystemEndpoints(BaseEndpoints):
             ssl=ssl,
             skip_ssl_verification=skip_ssl_verification,
             session=session,
+            connection=connection,
+        )
+
+    async def get_all(
+        self,
+        *,
+        human_readable: bool = True,
+        members: Sequence[System] | None = None,
+    ) -> SystemSnapshot:
+        """Get all system values with one request.
+
+        Members that are unsupported according to the capability map of `filter_request()` are not read.
+
+        Parameters
+        ----------
+        human_readable
+            Return human-readable strings
+        members
+            Read only these section members, all members by default. The other fields are `None`
+
+        Returns
+        -------
+        SystemSnapshot
+            All system values
+
+        """
+        return await self._get_snapshot(
+            SystemSnapshot,
+            System,
+            human_readable=human_readable,
+            members=members,
         )
 
     async def get_positions(self) -> Position:
@@ -539,25 +1177,7 @@ class SystemEndpoints(BaseEndpoints):
             A named tuple with the position information
 
         """
-        response: dict[str, list[Value]] = cast(
-            "dict[str, list[Value]]",
-            await self._read_data(
-                request=[
-                    System.HEAT_PUMP_NUMBERS,
-                    System.HEAT_CIRCUIT_NUMBERS,
-                    System.SOLAR_CIRCUIT_NUMBERS,
-                    System.BUFFER_TANK_NUMBERS,
-                    System.HOT_WATER_TANK_NUMBERS,
-                    System.EXTERNAL_HEAT_SOURCE_NUMBERS,
-                    System.SWITCH_VALVE_NUMBERS,
-                ],
-                key_prefix=False,
-                allowed_type=System,
-                extra_attributes=True,
-            ),
-        )
-
-        return Position(**{k.replace("_numbers", ""): int(v[0]["value"]) for k, v in response.items()})
+        return await self._read_positions()
 
     async def get_info(self) -> dict[str, Any]:
         """Get the system information.
@@ -921,6 +1541,7 @@ class BufferTankEndpoints(BaseEndpoints):
         ssl: bool,
         skip_ssl_verification: bool,
         session: ClientSession | None = None,
+        connection: Connection | None = None,
     ) -> None:
         super().__init__(
             base_url=base_url,
@@ -928,15 +1549,56 @@ class BufferTankEndpoints(BaseEndpoints):
             ssl=ssl,
             skip_ssl_verification=skip_ssl_verification,
             session=session,
+            connection=connection,
         )
 
-    async def get_name(self, position: int = 1) -> str:
-        """Get the buffer tank name.
+    async def get_all(
+        self,
+        position: int = 1,
+        *,
+        human_readable: bool = True,
+        members: Sequence[BufferTank] | None = None,
+    ) -> BufferTankSnapshot:
+        """Get all buffer tank values with one request.
+
+        Members that are unsupported according to the capability map of `filter_request()` are not read.
 
         Parameters
         ----------
         position
             The number of the buffer tanks
+        human_readable
+            Return human-readable strings
+        members
+            Read only these section members, all members by default. The other fields are `None`
+
+        Returns
+        -------
+        BufferTankSnapshot
+            All buffer tank values
+
+        """
+        return await self._get_snapshot(
+            BufferTankSnapshot,
+            BufferTank,
+            position,
+            human_readable=human_readable,
+            members=members,
+        )
+
+    @overload
+    async def get_name(self, position: int = 1) -> str: ...
+
+    @overload
+    async def get_name(self, position: Positions) -> list[str]: ...
+
+    async def get_name(self, position: int | Positions = 1) -> str | list[str]:
+        """Get the buffer tank name.
+
+        Parameters
+        ----------
+        position
+            The number of the buffer tanks, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -951,13 +1613,19 @@ class BufferTankEndpoints(BaseEndpoints):
         )
         return self._get_str_value(response, section=BufferTank.NAME, position=position)
 
-    async def get_current_top_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_current_top_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_current_top_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_current_top_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the current top temperature from the buffer tank.
 
         Parameters
         ----------
         position
-            The number of the buffer tanks
+            The number of the buffer tanks, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -972,13 +1640,19 @@ class BufferTankEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=BufferTank.CURRENT_TOP_TEMPERATURE, position=position)
 
-    async def get_current_bottom_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_current_bottom_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_current_bottom_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_current_bottom_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the current bottom temperature from the buffer tank.
 
         Parameters
         ----------
         position
-            The number of the buffer tanks
+            The number of the buffer tanks, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -993,13 +1667,21 @@ class BufferTankEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=BufferTank.CURRENT_BOTTOM_TEMPERATURE, position=position)
 
-    async def get_operating_mode(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_operating_mode(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_operating_mode(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_operating_mode(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the operating mode from the buffer tank.
 
         Parameters
         ----------
         position
-            The number of the buffer tanks
+            The number of the buffer tanks, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -1041,13 +1723,19 @@ class BufferTankEndpoints(BaseEndpoints):
 
         await self._write_values(request={BufferTank.OPERATING_MODE: modes})
 
-    async def get_standby_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_standby_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_standby_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_standby_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the standby temperature from the buffer tank.
 
         Parameters
         ----------
         position
-            The number of the buffer tanks
+            The number of the buffer tanks, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -1079,13 +1767,19 @@ class BufferTankEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={BufferTank.STANDBY_TEMPERATURE: temperatures})
 
-    async def get_target_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_target_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_target_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_target_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the target temperature from the buffer tank.
 
         Parameters
         ----------
         position
-            The number of the buffer tanks
+            The number of the buffer tanks, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -1100,13 +1794,19 @@ class BufferTankEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=BufferTank.TARGET_TEMPERATURE, position=position)
 
-    async def get_excess_energy_target_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_excess_energy_target_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_excess_energy_target_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_excess_energy_target_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the excess energy target temperature from the buffer tank.
 
         Parameters
         ----------
         position
-            The number of the buffer tanks
+            The number of the buffer tanks, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -1138,13 +1838,21 @@ class BufferTankEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={BufferTank.EXCESS_ENERGY_TARGET_TEMPERATURE: temperatures})
 
-    async def get_excess_energy_target_temperature_hysteresis(self, position: int = 1) -> float:
+    @overload
+    async def get_excess_energy_target_temperature_hysteresis(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_excess_energy_target_temperature_hysteresis(self, position: Positions) -> list[float]: ...
+
+    async def get_excess_energy_target_temperature_hysteresis(
+        self, position: int | Positions = 1
+    ) -> float | list[float]:
         """Get the excess energy target temperature hysteresis from the buffer tank.
 
         Parameters
         ----------
         position
-            The number of the buffer tanks
+            The number of the buffer tanks, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -1178,13 +1886,19 @@ class BufferTankEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={BufferTank.EXCESS_ENERGY_TARGET_TEMPERATURE_HYSTERESIS: temperatures})
 
-    async def get_outdoor_temperature_excess_energy_limit(self, position: int = 1) -> float:
+    @overload
+    async def get_outdoor_temperature_excess_energy_limit(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_outdoor_temperature_excess_energy_limit(self, position: Positions) -> list[float]: ...
+
+    async def get_outdoor_temperature_excess_energy_limit(self, position: int | Positions = 1) -> float | list[float]:
         """Get the outdoor temperature excess energy limit from the buffer tank.
 
         Parameters
         ----------
         position
-            The number of the buffer tanks
+            The number of the buffer tanks, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -1218,18 +1932,21 @@ class BufferTankEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={BufferTank.OUTDOOR_TEMPERATURE_EXCESS_ENERGY_LIMIT: temperatures})
 
+    @overload
+    async def get_use_excess_energy(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_use_excess_energy(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
     async def get_use_excess_energy(
-        self,
-        position: int = 1,
-        *,
-        human_readable: bool = True,
-    ) -> int | str:
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the use excess energy state.
 
         Parameters
         ----------
         position
-            The number of the buffer tanks
+            The number of the buffer tanks, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -1271,18 +1988,21 @@ class BufferTankEndpoints(BaseEndpoints):
 
         await self._write_values(request={BufferTank.USE_EXCESS_ENERGY: modes})
 
+    @overload
+    async def get_excess_energy_mode(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_excess_energy_mode(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
     async def get_excess_energy_mode(
-        self,
-        position: int = 1,
-        *,
-        human_readable: bool = True,
-    ) -> int | str:
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the excess energy mode.
 
         Parameters
         ----------
         position
-            The number of the buffer tanks
+            The number of the buffer tanks, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -1300,13 +2020,21 @@ class BufferTankEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=BufferTank.EXCESS_ENERGY_MODE, position=position)
 
-    async def get_heat_request(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_heat_request(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_heat_request(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_heat_request(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the heat request state from the buffer tank.
 
         Parameters
         ----------
         position
-            The number of the buffer tanks
+            The number of the buffer tanks, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -1324,13 +2052,21 @@ class BufferTankEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=BufferTank.HEAT_REQUEST, position=position)
 
-    async def get_cool_request(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_cool_request(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_cool_request(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_cool_request(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the cool request state from the buffer tank.
 
         Parameters
         ----------
         position
-            The number of the buffer tanks
+            The number of the buffer tanks, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -1373,6 +2109,7 @@ class HotWaterTankEndpoints(BaseEndpoints):
         ssl: bool,
         skip_ssl_verification: bool,
         session: ClientSession | None = None,
+        connection: Connection | None = None,
     ) -> None:
         super().__init__(
             base_url=base_url,
@@ -1380,15 +2117,56 @@ class HotWaterTankEndpoints(BaseEndpoints):
             ssl=ssl,
             skip_ssl_verification=skip_ssl_verification,
             session=session,
+            connection=connection,
+        )
+
+    async def get_all(
+        self,
+        position: int = 1,
+        *,
+        human_readable: bool = True,
+        members: Sequence[HotWaterTank] | None = None,
+    ) -> HotWaterTankSnapshot:
+        """Get all hot water tank values with one request.
+
+        Members that are unsupported according to the capability map of `filter_request()` are not read.
+
+        Parameters
+        ----------
+        position
+            The number of the hot water tanks
+        human_readable
+            Return human-readable strings
+        members
+            Read only these section members, all members by default. The other fields are `None`
+
+        Returns
+        -------
+        HotWaterTankSnapshot
+            All hot water tank values
+
+        """
+        return await self._get_snapshot(
+            HotWaterTankSnapshot,
+            HotWaterTank,
+            position,
+            human_readable=human_readable,
+            members=members,
         )
 
-    async def get_name(self, position: int = 1) -> str:
+    @overload
+    async def get_name(self, position: int = 1) -> str: ...
+
+    @overload
+    async def get_name(self, position: Positions) -> list[str]: ...
+
+    async def get_name(self, position: int | Positions = 1) -> str | list[str]:
         """Get the hot water tank name.
 
         Parameters
         ----------
         position
-            The number of the hot water tanks
+            The number of the hot water tanks, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -1403,13 +2181,19 @@ class HotWaterTankEndpoints(BaseEndpoints):
         )
         return self._get_str_value(response, section=HotWaterTank.NAME, position=position)
 
-    async def get_current_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_current_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_current_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_current_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the current temperature from the hot water tank.
 
         Parameters
         ----------
         position
-            The number of the hot water tanks
+            The number of the hot water tanks, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -1424,13 +2208,21 @@ class HotWaterTankEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HotWaterTank.CURRENT_TEMPERATURE, position=position)
 
-    async def get_operating_mode(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_operating_mode(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_operating_mode(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_operating_mode(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the operating mode from the hot water tank.
 
         Parameters
         ----------
         position
-            The number of the hot water tanks
+            The number of the hot water tanks, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -1472,13 +2264,19 @@ class HotWaterTankEndpoints(BaseEndpoints):
 
         await self._write_values(request={HotWaterTank.OPERATING_MODE: modes})
 
-    async def get_min_target_temperature(self, position: int = 1) -> int:
+    @overload
+    async def get_min_target_temperature(self, position: int = 1) -> int: ...
+
+    @overload
+    async def get_min_target_temperature(self, position: Positions) -> list[int]: ...
+
+    async def get_min_target_temperature(self, position: int | Positions = 1) -> int | list[int]:
         """Get the minimum target temperature from the hot water tank.
 
         Parameters
         ----------
         position
-            The number of the hot water tanks
+            The number of the hot water tanks, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -1498,13 +2296,19 @@ class HotWaterTankEndpoints(BaseEndpoints):
             attribute="lower_limit",
         )
 
-    async def get_max_target_temperature(self, position: int = 1) -> int:
+    @overload
+    async def get_max_target_temperature(self, position: int = 1) -> int: ...
+
+    @overload
+    async def get_max_target_temperature(self, position: Positions) -> list[int]: ...
+
+    async def get_max_target_temperature(self, position: int | Positions = 1) -> int | list[int]:
         """Get the maximum target temperature from the hot water tank.
 
         Parameters
         ----------
         position
-            The number of the hot water tanks
+            The number of the hot water tanks, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -1524,13 +2328,19 @@ class HotWaterTankEndpoints(BaseEndpoints):
             attribute="upper_limit",
         )
 
-    async def get_standby_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_standby_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_standby_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_standby_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the standby temperature from the hot water tank.
 
         Parameters
         ----------
         position
-            The number of the hot water tanks
+            The number of the hot water tanks, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -1562,13 +2372,19 @@ class HotWaterTankEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HotWaterTank.STANDBY_TEMPERATURE: temperatures})
 
-    async def get_target_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_target_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_target_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_target_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the target temperature from the hot water tank.
 
         Parameters
         ----------
         position
-            The number of the hot water tanks
+            The number of the hot water tanks, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -1600,13 +2416,19 @@ class HotWaterTankEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HotWaterTank.TARGET_TEMPERATURE: temperatures})
 
-    async def get_excess_energy_target_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_excess_energy_target_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_excess_energy_target_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_excess_energy_target_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the excess energy target temperature from the hot water tank.
 
         Parameters
         ----------
         position
-            The number of the hot water tanks
+            The number of the hot water tanks, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -1638,13 +2460,21 @@ class HotWaterTankEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HotWaterTank.EXCESS_ENERGY_TARGET_TEMPERATURE: temperatures})
 
-    async def get_excess_energy_target_temperature_hysteresis(self, position: int = 1) -> float:
+    @overload
+    async def get_excess_energy_target_temperature_hysteresis(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_excess_energy_target_temperature_hysteresis(self, position: Positions) -> list[float]: ...
+
+    async def get_excess_energy_target_temperature_hysteresis(
+        self, position: int | Positions = 1
+    ) -> float | list[float]:
         """Get the excess energy target temperature hysteresis from the hot water tank.
 
         Parameters
         ----------
         position
-            The number of the hot water tanks
+            The number of the hot water tanks, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -1678,18 +2508,21 @@ class HotWaterTankEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HotWaterTank.EXCESS_ENERGY_TARGET_TEMPERATURE_HYSTERESIS: temperatures})
 
+    @overload
+    async def get_use_excess_energy(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_use_excess_energy(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
     async def get_use_excess_energy(
-        self,
-        position: int = 1,
-        *,
-        human_readable: bool = True,
-    ) -> int | str:
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the use excess energy state.
 
         Parameters
         ----------
         position
-            The number of the hot water tanks
+            The number of the hot water tanks, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -1731,18 +2564,21 @@ class HotWaterTankEndpoints(BaseEndpoints):
 
         await self._write_values(request={HotWaterTank.USE_EXCESS_ENERGY: modes})
 
+    @overload
+    async def get_excess_energy_mode(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_excess_energy_mode(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
     async def get_excess_energy_mode(
-        self,
-        position: int = 1,
-        *,
-        human_readable: bool = True,
-    ) -> int | str:
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the excess energy mode.
 
         Parameters
         ----------
         position
-            The number of the hot water tanks
+            The number of the hot water tanks, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -1760,13 +2596,21 @@ class HotWaterTankEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HotWaterTank.EXCESS_ENERGY_MODE, position=position)
 
-    async def get_heat_request(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_heat_request(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_heat_request(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_heat_request(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the heat request state from the hot water tank.
 
         Parameters
         ----------
         position
-            The number of the hot water tanks
+            The number of the hot water tanks, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -1805,13 +2649,21 @@ class HotWaterTankEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HotWaterTank.HAS_FRESH_WATER_MODULE)
 
-    async def get_fresh_water_flow(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_fresh_water_flow(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_fresh_water_flow(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_fresh_water_flow(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the fresh water flow from the fresh water module.
 
         Parameters
         ----------
         position
-            The number of the hot water tanks
+            The number of the hot water tanks, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -1829,13 +2681,19 @@ class HotWaterTankEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HotWaterTank.FRESH_WATER_FLOW, position=position)
 
-    async def get_fresh_water_module_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_fresh_water_module_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_fresh_water_module_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_fresh_water_module_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the fresh water module temperature.
 
         Parameters
         ----------
         position
-            The number of the hot water tanks
+            The number of the hot water tanks, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -1850,13 +2708,19 @@ class HotWaterTankEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HotWaterTank.FRESH_WATER_MODULE_TEMPERATURE, position=position)
 
-    async def get_fresh_water_module_pump_speed(self, position: int = 1) -> float:
+    @overload
+    async def get_fresh_water_module_pump_speed(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_fresh_water_module_pump_speed(self, position: Positions) -> list[float]: ...
+
+    async def get_fresh_water_module_pump_speed(self, position: int | Positions = 1) -> float | list[float]:
         """Get the fresh water module pump speed.
 
         Parameters
         ----------
         position
-            The number of the hot water tanks
+            The number of the hot water tanks, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -1871,13 +2735,19 @@ class HotWaterTankEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HotWaterTank.FRESH_WATER_MODULE_PUMP_SPEED, position=position)
 
-    async def get_circulation_return_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_circulation_return_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_circulation_return_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_circulation_return_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the circulation return temperature.
 
         Parameters
         ----------
         position
-            The number of the hot water tanks
+            The number of the hot water tanks, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -1892,13 +2762,23 @@ class HotWaterTankEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HotWaterTank.CIRCULATION_RETURN_TEMPERATURE, position=position)
 
-    async def get_circulation_pump_state(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_circulation_pump_state(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_circulation_pump_state(
+        self, position: Positions, *, human_readable: bool = True
+    ) -> list[int | str]: ...
+
+    async def get_circulation_pump_state(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the circulation pump state.
 
         Parameters
         ----------
         position
-            The number of the hot water tanks
+            The number of the hot water tanks, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -1941,6 +2821,7 @@ class HeatPumpEndpoints(BaseEndpoints):
         ssl: bool,
         skip_ssl_verification: bool,
         session: ClientSession | None = None,
+        connection: Connection | None = None,
     ) -> None:
         super().__init__(
             base_url=base_url,
@@ -1948,15 +2829,56 @@ class HeatPumpEndpoints(BaseEndpoints):
             ssl=ssl,
             skip_ssl_verification=skip_ssl_verification,
             session=session,
+            connection=connection,
         )
 
-    async def get_name(self, position: int = 1) -> str:
-        """Get the heat pump name.
+    async def get_all(
+        self,
+        position: int = 1,
+        *,
+        human_readable: bool = True,
+        members: Sequence[HeatPump] | None = None,
+    ) -> HeatPumpSnapshot:
+        """Get all heat pump values with one request.
+
+        Members that are unsupported according to the capability map of `filter_request()` are not read.
 
         Parameters
         ----------
         position
             The number of the heat pumps
+        human_readable
+            Return human-readable strings
+        members
+            Read only these section members, all members by default. The other fields are `None`
+
+        Returns
+        -------
+        HeatPumpSnapshot
+            All heat pump values
+
+        """
+        return await self._get_snapshot(
+            HeatPumpSnapshot,
+            HeatPump,
+            position,
+            human_readable=human_readable,
+            members=members,
+        )
+
+    @overload
+    async def get_name(self, position: int = 1) -> str: ...
+
+    @overload
+    async def get_name(self, position: Positions) -> list[str]: ...
+
+    async def get_name(self, position: int | Positions = 1) -> str | list[str]:
+        """Get the heat pump name.
+
+        Parameters
+        ----------
+        position
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -1971,13 +2893,21 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_str_value(response, section=HeatPump.NAME, position=position)
 
-    async def get_state(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_state(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_state(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_state(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the heat pump state.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -1996,13 +2926,21 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HeatPump.STATE, position=position)
 
-    async def get_substate(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_substate(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_substate(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_substate(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the heat pump substate.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -2026,13 +2964,21 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HeatPump.SUBSTATE, position=position)
 
-    async def get_operating_mode(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_operating_mode(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_operating_mode(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_operating_mode(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the operating mode from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -2074,18 +3020,23 @@ class HeatPumpEndpoints(BaseEndpoints):
 
         await self._write_values(request={HeatPump.OPERATING_MODE: modes})
 
+    @overload
+    async def get_compressor_use_night_speed(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
     async def get_compressor_use_night_speed(
-        self,
-        position: int = 1,
-        *,
-        human_readable: bool = True,
-    ) -> int | str:
+        self, position: Positions, *, human_readable: bool = True
+    ) -> list[int | str]: ...
+
+    async def get_compressor_use_night_speed(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the compressor use night speed state.
 
         Parameters
         ----------
         position
-            The number of the hot water tanks
+            The number of the hot water tanks, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -2127,18 +3078,21 @@ class HeatPumpEndpoints(BaseEndpoints):
 
         await self._write_values(request={HeatPump.COMPRESSOR_USE_NIGHT_SPEED: modes})
 
+    @overload
+    async def get_compressor_night_speed(self, position: int = 1, *, human_readable: bool = True) -> float: ...
+
+    @overload
+    async def get_compressor_night_speed(self, position: Positions, *, human_readable: bool = True) -> list[float]: ...
+
     async def get_compressor_night_speed(
-        self,
-        position: int = 1,
-        *,
-        human_readable: bool = True,
-    ) -> float:
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> float | list[float]:
         """Get the compressor night speed.
 
         Parameters
         ----------
         position
-            The number of the hot water tanks
+            The number of the hot water tanks, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -2173,13 +3127,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         speeds: list[float | None] = [speed if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatPump.COMPRESSOR_NIGHT_SPEED: speeds})
 
-    async def get_min_compressor_night_speed(self, position: int = 1) -> float:
+    @overload
+    async def get_min_compressor_night_speed(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_min_compressor_night_speed(self, position: Positions) -> list[float]: ...
+
+    async def get_min_compressor_night_speed(self, position: int | Positions = 1) -> float | list[float]:
         """Get the minimum compressor night speed.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2199,13 +3159,19 @@ class HeatPumpEndpoints(BaseEndpoints):
             attribute="lower_limit",
         )
 
-    async def get_max_compressor_night_speed(self, position: int = 1) -> float:
+    @overload
+    async def get_max_compressor_night_speed(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_max_compressor_night_speed(self, position: Positions) -> list[float]: ...
+
+    async def get_max_compressor_night_speed(self, position: int | Positions = 1) -> float | list[float]:
         """Get the maximum compressor night speed.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2225,13 +3191,19 @@ class HeatPumpEndpoints(BaseEndpoints):
             attribute="upper_limit",
         )
 
-    async def get_circulation_pump_speed(self, position: int = 1) -> float:
+    @overload
+    async def get_circulation_pump_speed(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_circulation_pump_speed(self, position: Positions) -> list[float]: ...
+
+    async def get_circulation_pump_speed(self, position: int | Positions = 1) -> float | list[float]:
         """Get the circulation pump speed.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2246,13 +3218,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.CIRCULATION_PUMP_SPEED, position=position)
 
-    async def get_source_pump_speed(self, position: int = 1) -> float:
+    @overload
+    async def get_source_pump_speed(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_source_pump_speed(self, position: Positions) -> list[float]: ...
+
+    async def get_source_pump_speed(self, position: int | Positions = 1) -> float | list[float]:
         """Get the source pump speed.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2267,13 +3245,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.SOURCE_PUMP_SPEED, position=position)
 
-    async def get_flow_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_flow_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_flow_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_flow_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the flow temperature from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2288,13 +3272,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.FLOW_TEMPERATURE, position=position)
 
-    async def get_return_flow_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_return_flow_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_return_flow_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_return_flow_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the return flow temperature from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2309,13 +3299,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.RETURN_FLOW_TEMPERATURE, position=position)
 
-    async def get_source_input_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_source_input_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_source_input_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_source_input_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the source input temperature from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2330,13 +3326,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.SOURCE_INPUT_TEMPERATURE, position=position)
 
-    async def get_source_output_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_source_output_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_source_output_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_source_output_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the source output temperature from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2351,13 +3353,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.SOURCE_OUTPUT_TEMPERATURE, position=position)
 
-    async def get_compressor_input_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_compressor_input_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_compressor_input_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_compressor_input_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the compressor input temperature from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2372,13 +3380,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.COMPRESSOR_INPUT_TEMPERATURE, position=position)
 
-    async def get_compressor_output_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_compressor_output_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_compressor_output_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_compressor_output_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the compressor output temperature from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2393,13 +3407,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.COMPRESSOR_OUTPUT_TEMPERATURE, position=position)
 
-    async def get_compressor_speed(self, position: int = 1) -> float:
+    @overload
+    async def get_compressor_speed(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_compressor_speed(self, position: Positions) -> list[float]: ...
+
+    async def get_compressor_speed(self, position: int | Positions = 1) -> float | list[float]:
         """Get the compressor speed from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2414,13 +3434,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.COMPRESSOR, position=position)
 
-    async def get_condenser_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_condenser_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_condenser_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_condenser_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the condenser temperature from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2435,13 +3461,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.CONDENSER_TEMPERATURE, position=position)
 
-    async def get_vaporizer_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_vaporizer_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_vaporizer_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_vaporizer_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the vaporizer temperature from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2456,13 +3488,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.VAPORIZER_TEMPERATURE, position=position)
 
-    async def get_target_overheating(self, position: int = 1) -> float:
+    @overload
+    async def get_target_overheating(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_target_overheating(self, position: Positions) -> list[float]: ...
+
+    async def get_target_overheating(self, position: int | Positions = 1) -> float | list[float]:
         """Get the target overheating from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2477,13 +3515,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.TARGET_OVERHEATING, position=position)
 
-    async def get_current_overheating(self, position: int = 1) -> float:
+    @overload
+    async def get_current_overheating(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_current_overheating(self, position: Positions) -> list[float]: ...
+
+    async def get_current_overheating(self, position: int | Positions = 1) -> float | list[float]:
         """Get the current overheating from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2498,13 +3542,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.CURRENT_OVERHEATING, position=position)
 
-    async def get_expansion_valve_position(self, position: int = 1) -> int:
+    @overload
+    async def get_expansion_valve_position(self, position: int = 1) -> int: ...
+
+    @overload
+    async def get_expansion_valve_position(self, position: Positions) -> list[int]: ...
+
+    async def get_expansion_valve_position(self, position: int | Positions = 1) -> int | list[int]:
         """Get the expansion valve position from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2519,13 +3569,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_int_value(response, section=HeatPump.EXPANSION_VALVE_POSITION, position=position)
 
-    async def get_high_pressure(self, position: int = 1) -> float:
+    @overload
+    async def get_high_pressure(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_high_pressure(self, position: Positions) -> list[float]: ...
+
+    async def get_high_pressure(self, position: int | Positions = 1) -> float | list[float]:
         """Get the high pressure from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2540,13 +3596,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.HIGH_PRESSURE, position=position)
 
-    async def get_low_pressure(self, position: int = 1) -> float:
+    @overload
+    async def get_low_pressure(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_low_pressure(self, position: Positions) -> list[float]: ...
+
+    async def get_low_pressure(self, position: int | Positions = 1) -> float | list[float]:
         """Get the low pressure from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2561,13 +3623,21 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.LOW_PRESSURE, position=position)
 
-    async def get_heat_request(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_heat_request(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_heat_request(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_heat_request(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the heat request state from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -2585,13 +3655,23 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HeatPump.HEAT_REQUEST, position=position)
 
-    async def get_consuming_excess_energy(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_consuming_excess_energy(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_consuming_excess_energy(
+        self, position: Positions, *, human_readable: bool = True
+    ) -> list[int | str]: ...
+
+    async def get_consuming_excess_energy(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the consuming excess energy from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -2609,13 +3689,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HeatPump.CONSUMING_EXCESS_ENERGY, position=position)
 
-    async def get_excess_energy_operating_time(self, position: int = 1) -> int:
+    @overload
+    async def get_excess_energy_operating_time(self, position: int = 1) -> int: ...
+
+    @overload
+    async def get_excess_energy_operating_time(self, position: Positions) -> list[int]: ...
+
+    async def get_excess_energy_operating_time(self, position: int | Positions = 1) -> int | list[int]:
         """Get the excess energy operating time from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2630,13 +3716,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_int_value(response, section=HeatPump.EXCESS_ENERGY_OPERATING_TIME, position=position)
 
-    async def get_excess_energy_max_runtime(self, position: int = 1) -> int:
+    @overload
+    async def get_excess_energy_max_runtime(self, position: int = 1) -> int: ...
+
+    @overload
+    async def get_excess_energy_max_runtime(self, position: Positions) -> list[int]: ...
+
+    async def get_excess_energy_max_runtime(self, position: int | Positions = 1) -> int | list[int]:
         """Get the excess energy maximum runtime from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2651,13 +3743,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_int_value(response, section=HeatPump.EXCESS_ENERGY_MAX_RUNTIME, position=position)
 
-    async def get_excess_energy_activation_counter(self, position: int = 1) -> int:
+    @overload
+    async def get_excess_energy_activation_counter(self, position: int = 1) -> int: ...
+
+    @overload
+    async def get_excess_energy_activation_counter(self, position: Positions) -> list[int]: ...
+
+    async def get_excess_energy_activation_counter(self, position: int | Positions = 1) -> int | list[int]:
         """Get the activation counter from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2672,13 +3770,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_int_value(response, section=HeatPump.EXCESS_ENERGY_ACTIVATION_COUNTER, position=position)
 
-    async def get_compressor_power(self, position: int = 1) -> float:
+    @overload
+    async def get_compressor_power(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_compressor_power(self, position: Positions) -> list[float]: ...
+
+    async def get_compressor_power(self, position: int | Positions = 1) -> float | list[float]:
         """Get the compressor power from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2693,13 +3797,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.COMPRESSOR_POWER, position=position)
 
-    async def get_heating_power(self, position: int = 1) -> float:
+    @overload
+    async def get_heating_power(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_heating_power(self, position: Positions) -> list[float]: ...
+
+    async def get_heating_power(self, position: int | Positions = 1) -> float | list[float]:
         """Get the heating power from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2714,13 +3824,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.HEATING_POWER, position=position)
 
-    async def get_hot_water_power(self, position: int = 1) -> float:
+    @overload
+    async def get_hot_water_power(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_hot_water_power(self, position: Positions) -> list[float]: ...
+
+    async def get_hot_water_power(self, position: int | Positions = 1) -> float | list[float]:
         """Get the hot water power from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2735,13 +3851,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.HOT_WATER_POWER, position=position)
 
-    async def get_cop(self, position: int = 1) -> float:
+    @overload
+    async def get_cop(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_cop(self, position: Positions) -> list[float]: ...
+
+    async def get_cop(self, position: int | Positions = 1) -> float | list[float]:
         """Get the COP from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2756,13 +3878,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.COP, position=position)
 
-    async def get_heating_energy(self, position: int = 1) -> float:
+    @overload
+    async def get_heating_energy(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_heating_energy(self, position: Positions) -> list[float]: ...
+
+    async def get_heating_energy(self, position: int | Positions = 1) -> float | list[float]:
         """Get the heating energy from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2777,13 +3905,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.HEATING_ENERGY, position=position)
 
-    async def get_heating_energy_consumption(self, position: int = 1) -> float:
+    @overload
+    async def get_heating_energy_consumption(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_heating_energy_consumption(self, position: Positions) -> list[float]: ...
+
+    async def get_heating_energy_consumption(self, position: int | Positions = 1) -> float | list[float]:
         """Get the energy consumption for heating from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2798,13 +3932,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.HEATING_ENERGY_CONSUMPTION, position=position)
 
-    async def get_heating_spf(self, position: int = 1) -> float:
+    @overload
+    async def get_heating_spf(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_heating_spf(self, position: Positions) -> list[float]: ...
+
+    async def get_heating_spf(self, position: int | Positions = 1) -> float | list[float]:
         """Get the heating SPF from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2819,13 +3959,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.HEATING_SPF, position=position)
 
-    async def get_cooling_energy(self, position: int = 1) -> float:
+    @overload
+    async def get_cooling_energy(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_cooling_energy(self, position: Positions) -> list[float]: ...
+
+    async def get_cooling_energy(self, position: int | Positions = 1) -> float | list[float]:
         """Get the cooling energy from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2840,13 +3986,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.COOLING_ENERGY, position=position)
 
-    async def get_cooling_energy_consumption(self, position: int = 1) -> float:
+    @overload
+    async def get_cooling_energy_consumption(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_cooling_energy_consumption(self, position: Positions) -> list[float]: ...
+
+    async def get_cooling_energy_consumption(self, position: int | Positions = 1) -> float | list[float]:
         """Get the cooling energy consumption from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2861,13 +4013,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.COOLING_ENERGY_CONSUMPTION, position=position)
 
-    async def get_cooling_spf(self, position: int = 1) -> float:
+    @overload
+    async def get_cooling_spf(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_cooling_spf(self, position: Positions) -> list[float]: ...
+
+    async def get_cooling_spf(self, position: int | Positions = 1) -> float | list[float]:
         """Get the cooling SPF from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2882,13 +4040,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.COOLING_SPF, position=position)
 
-    async def get_hot_water_energy(self, position: int = 1) -> float:
+    @overload
+    async def get_hot_water_energy(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_hot_water_energy(self, position: Positions) -> list[float]: ...
+
+    async def get_hot_water_energy(self, position: int | Positions = 1) -> float | list[float]:
         """Get the hot water energy from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2903,13 +4067,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.HOT_WATER_ENERGY, position=position)
 
-    async def get_hot_water_energy_consumption(self, position: int = 1) -> float:
+    @overload
+    async def get_hot_water_energy_consumption(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_hot_water_energy_consumption(self, position: Positions) -> list[float]: ...
+
+    async def get_hot_water_energy_consumption(self, position: int | Positions = 1) -> float | list[float]:
         """Get the hot water energy consumption from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2924,13 +4094,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.HOT_WATER_ENERGY_CONSUMPTION, position=position)
 
-    async def get_hot_water_spf(self, position: int = 1) -> float:
+    @overload
+    async def get_hot_water_spf(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_hot_water_spf(self, position: Positions) -> list[float]: ...
+
+    async def get_hot_water_spf(self, position: int | Positions = 1) -> float | list[float]:
         """Get the hot water SPF from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2945,13 +4121,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.HOT_WATER_SPF, position=position)
 
-    async def get_total_thermal_energy(self, position: int = 1) -> float:
+    @overload
+    async def get_total_thermal_energy(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_total_thermal_energy(self, position: Positions) -> list[float]: ...
+
+    async def get_total_thermal_energy(self, position: int | Positions = 1) -> float | list[float]:
         """Get the total thermal energy from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2966,13 +4148,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.TOTAL_THERMAL_ENERGY, position=position)
 
-    async def get_total_energy_consumption(self, position: int = 1) -> float:
+    @overload
+    async def get_total_energy_consumption(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_total_energy_consumption(self, position: Positions) -> list[float]: ...
+
+    async def get_total_energy_consumption(self, position: int | Positions = 1) -> float | list[float]:
         """Get the total energy consumption from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -2987,13 +4175,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.TOTAL_ENERGY_CONSUMPTION, position=position)
 
-    async def get_excess_energy_consumption(self, position: int = 1) -> float:
+    @overload
+    async def get_excess_energy_consumption(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_excess_energy_consumption(self, position: Positions) -> list[float]: ...
+
+    async def get_excess_energy_consumption(self, position: int | Positions = 1) -> float | list[float]:
         """Get the excess energy consumption from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -3008,13 +4202,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.EXCESS_ENERGY_CONSUMPTION, position=position)
 
-    async def get_heating_excess_energy_consumption(self, position: int = 1) -> float:
+    @overload
+    async def get_heating_excess_energy_consumption(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_heating_excess_energy_consumption(self, position: Positions) -> list[float]: ...
+
+    async def get_heating_excess_energy_consumption(self, position: int | Positions = 1) -> float | list[float]:
         """Get the heating excess energy consumption from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -3029,13 +4229,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.HEATING_EXCESS_ENERGY_CONSUMPTION, position=position)
 
-    async def get_cooling_excess_energy_consumption(self, position: int = 1) -> float:
+    @overload
+    async def get_cooling_excess_energy_consumption(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_cooling_excess_energy_consumption(self, position: Positions) -> list[float]: ...
+
+    async def get_cooling_excess_energy_consumption(self, position: int | Positions = 1) -> float | list[float]:
         """Get the cooling excess energy consumption from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -3050,13 +4256,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.COOLING_EXCESS_ENERGY_CONSUMPTION, position=position)
 
-    async def get_hot_water_excess_energy_consumption(self, position: int = 1) -> float:
+    @overload
+    async def get_hot_water_excess_energy_consumption(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_hot_water_excess_energy_consumption(self, position: Positions) -> list[float]: ...
+
+    async def get_hot_water_excess_energy_consumption(self, position: int | Positions = 1) -> float | list[float]:
         """Get the hot water excess energy consumption from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -3071,13 +4283,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.HOT_WATER_EXCESS_ENERGY_CONSUMPTION, position=position)
 
-    async def get_total_spf(self, position: int = 1) -> float:
+    @overload
+    async def get_total_spf(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_total_spf(self, position: Positions) -> list[float]: ...
+
+    async def get_total_spf(self, position: int | Positions = 1) -> float | list[float]:
         """Get the SPF from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -3092,13 +4310,21 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatPump.TOTAL_SPF, position=position)
 
-    async def has_active_cooling(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def has_active_cooling(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def has_active_cooling(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def has_active_cooling(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Check if active cooling for the heat pump is available.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -3116,13 +4342,21 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HeatPump.HAS_ACTIVE_COOLING, position=position)
 
-    async def has_passive_cooling(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def has_passive_cooling(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def has_passive_cooling(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def has_passive_cooling(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Check if passive cooling for the heat pump is available.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -3140,13 +4374,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HeatPump.HAS_PASSIVE_COOLING, position=position)
 
-    async def get_operating_time(self, position: int = 1) -> int:
+    @overload
+    async def get_operating_time(self, position: int = 1) -> int: ...
+
+    @overload
+    async def get_operating_time(self, position: Positions) -> list[int]: ...
+
+    async def get_operating_time(self, position: int | Positions = 1) -> int | list[int]:
         """Get the operating time from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -3161,13 +4401,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_int_value(response, section=HeatPump.OPERATING_TIME, position=position)
 
-    async def get_max_runtime(self, position: int = 1) -> int:
+    @overload
+    async def get_max_runtime(self, position: int = 1) -> int: ...
+
+    @overload
+    async def get_max_runtime(self, position: Positions) -> list[int]: ...
+
+    async def get_max_runtime(self, position: int | Positions = 1) -> int | list[int]:
         """Get the maximum runtime from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -3182,13 +4428,19 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_int_value(response, section=HeatPump.MAX_RUNTIME, position=position)
 
-    async def get_activation_counter(self, position: int = 1) -> int:
+    @overload
+    async def get_activation_counter(self, position: int = 1) -> int: ...
+
+    @overload
+    async def get_activation_counter(self, position: Positions) -> list[int]: ...
+
+    async def get_activation_counter(self, position: int | Positions = 1) -> int | list[int]:
         """Get the activation counter from the heat pump.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -3203,13 +4455,21 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_int_value(response, section=HeatPump.ACTIVATION_COUNTER, position=position)
 
-    async def has_compressor_failure(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def has_compressor_failure(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def has_compressor_failure(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def has_compressor_failure(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Check if the heat pump has a compressor failure.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -3227,13 +4487,21 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HeatPump.HAS_COMPRESSOR_FAILURE, position=position)
 
-    async def has_source_failure(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def has_source_failure(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def has_source_failure(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def has_source_failure(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Check if the heat pump has a source failure.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -3251,13 +4519,23 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HeatPump.HAS_SOURCE_FAILURE, position=position)
 
-    async def has_source_actuator_failure(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def has_source_actuator_failure(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def has_source_actuator_failure(
+        self, position: Positions, *, human_readable: bool = True
+    ) -> list[int | str]: ...
+
+    async def has_source_actuator_failure(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Check if the heat pump has a source actuator failure.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -3275,13 +4553,21 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HeatPump.HAS_SOURCE_ACTUATOR_FAILURE, position=position)
 
-    async def has_three_phase_failure(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def has_three_phase_failure(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def has_three_phase_failure(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def has_three_phase_failure(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Check if the heat pump has a three-phase failure.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -3299,13 +4585,23 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HeatPump.HAS_THREE_PHASE_FAILURE, position=position)
 
-    async def has_source_pressure_failure(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def has_source_pressure_failure(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def has_source_pressure_failure(
+        self, position: Positions, *, human_readable: bool = True
+    ) -> list[int | str]: ...
+
+    async def has_source_pressure_failure(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Check if the heat pump has a source pressure failure.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -3323,13 +4619,21 @@ class HeatPumpEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HeatPump.HAS_SOURCE_PRESSURE_FAILURE, position=position)
 
-    async def has_vfd_failure(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def has_vfd_failure(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def has_vfd_failure(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def has_vfd_failure(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Check if the heat pump has a source pressure variable frequency drive (VFD) failure.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat pumps, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -3372,6 +4676,7 @@ class HeatCircuitEndpoints(BaseEndpoints):
         ssl: bool,
         skip_ssl_verification: bool,
         session: ClientSession | None = None,
+        connection: Connection | None = None,
     ) -> None:
         super().__init__(
             base_url=base_url,
@@ -3379,15 +4684,56 @@ class HeatCircuitEndpoints(BaseEndpoints):
             ssl=ssl,
             skip_ssl_verification=skip_ssl_verification,
             session=session,
+            connection=connection,
         )
 
-    async def get_name(self, position: int = 1) -> str:
-        """Get the heat circuit name.
+    async def get_all(
+        self,
+        position: int = 1,
+        *,
+        human_readable: bool = True,
+        members: Sequence[HeatCircuit] | None = None,
+    ) -> HeatCircuitSnapshot:
+        """Get all heat circuit values with one request.
+
+        Members that are unsupported according to the capability map of `filter_request()` are not read.
 
         Parameters
         ----------
         position
             The number of the heat circuits
+        human_readable
+            Return human-readable strings
+        members
+            Read only these section members, all members by default. The other fields are `None`
+
+        Returns
+        -------
+        HeatCircuitSnapshot
+            All heat circuit values
+
+        """
+        return await self._get_snapshot(
+            HeatCircuitSnapshot,
+            HeatCircuit,
+            position,
+            human_readable=human_readable,
+            members=members,
+        )
+
+    @overload
+    async def get_name(self, position: int = 1) -> str: ...
+
+    @overload
+    async def get_name(self, position: Positions) -> list[str]: ...
+
+    async def get_name(self, position: int | Positions = 1) -> str | list[str]:
+        """Get the heat circuit name.
+
+        Parameters
+        ----------
+        position
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -3402,13 +4748,21 @@ class HeatCircuitEndpoints(BaseEndpoints):
         )
         return self._get_str_value(response, section=HeatCircuit.NAME, position=position)
 
-    async def get_mode(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_mode(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_mode(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_mode(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the mode from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the external heat circuits
+            The number of the external heat circuits, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -3426,13 +4780,21 @@ class HeatCircuitEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HeatCircuit.MODE, position=position)
 
-    async def has_room_temperature(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def has_room_temperature(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def has_room_temperature(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def has_room_temperature(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Check if room temperature from the heat circuit is available.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -3450,13 +4812,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HeatCircuit.HAS_ROOM_TEMPERATURE, position=position)
 
-    async def get_room_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_room_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_room_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_room_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the room temperature from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -3471,13 +4839,21 @@ class HeatCircuitEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatCircuit.ROOM_TEMPERATURE, position=position)
 
-    async def has_room_humidity(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def has_room_humidity(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def has_room_humidity(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def has_room_humidity(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Check if room humidity from the heat circuit is available.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -3495,13 +4871,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HeatCircuit.HAS_ROOM_HUMIDITY, position=position)
 
-    async def get_room_humidity(self, position: int = 1) -> float:
+    @overload
+    async def get_room_humidity(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_room_humidity(self, position: Positions) -> list[float]: ...
+
+    async def get_room_humidity(self, position: int | Positions = 1) -> float | list[float]:
         """Get the room humidity from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -3516,13 +4898,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatCircuit.ROOM_HUMIDITY, position=position)
 
-    async def get_dew_point(self, position: int = 1) -> float:
+    @overload
+    async def get_dew_point(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_dew_point(self, position: Positions) -> list[float]: ...
+
+    async def get_dew_point(self, position: int | Positions = 1) -> float | list[float]:
         """Get the dew point from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -3537,13 +4925,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatCircuit.DEW_POINT, position=position)
 
-    async def get_flow_temperature_setpoint(self, position: int = 1) -> float:
+    @overload
+    async def get_flow_temperature_setpoint(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_flow_temperature_setpoint(self, position: Positions) -> list[float]: ...
+
+    async def get_flow_temperature_setpoint(self, position: int | Positions = 1) -> float | list[float]:
         """Get the flow temperature setpoint from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -3579,13 +4973,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HeatCircuit.HAS_MIXER)
 
-    async def get_mixer_flow_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_mixer_flow_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_mixer_flow_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_mixer_flow_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the mixer flow temperature from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -3600,13 +5000,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatCircuit.MIXER_FLOW_TEMPERATURE, position=position)
 
-    async def get_mixer_return_flow_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_mixer_return_flow_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_mixer_return_flow_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_mixer_return_flow_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the mixer return flow temperature from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -3621,13 +5027,21 @@ class HeatCircuitEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatCircuit.MIXER_RETURN_FLOW_TEMPERATURE, position=position)
 
-    async def get_mixer_position(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_mixer_position(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_mixer_position(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_mixer_position(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the mixer position.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -3646,13 +5060,21 @@ class HeatCircuitEndpoints(BaseEndpoints):
 
         return self._get_int_or_str_value(response, section=HeatCircuit.MIXER_POSITION, position=position)
 
-    async def get_pump_state(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_pump_state(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_pump_state(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_pump_state(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the pump state.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -3670,13 +5092,23 @@ class HeatCircuitEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HeatCircuit.PUMP_STATE, position=position)
 
-    async def has_return_flow_temperature(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def has_return_flow_temperature(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def has_return_flow_temperature(
+        self, position: Positions, *, human_readable: bool = True
+    ) -> list[int | str]: ...
+
+    async def has_return_flow_temperature(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Check if return flow temperature sensor cooling is available.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -3694,13 +5126,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HeatCircuit.HAS_RETURN_FLOW_TEMPERATURE, position=position)
 
-    async def get_return_flow_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_return_flow_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_return_flow_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_return_flow_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the return flow temperature from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -3716,13 +5154,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
 
         return self._get_float_value(response, section=HeatCircuit.RETURN_FLOW_TEMPERATURE, position=position)
 
-    async def get_target_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_target_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_target_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_target_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the target temperature from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -3737,18 +5181,21 @@ class HeatCircuitEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatCircuit.TARGET_TEMPERATURE, position=position)
 
+    @overload
+    async def get_use_excess_energy(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_use_excess_energy(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
     async def get_use_excess_energy(
-        self,
-        position: int = 1,
-        *,
-        human_readable: bool = True,
-    ) -> int | str:
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the use excess energy state.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -3790,18 +5237,21 @@ class HeatCircuitEndpoints(BaseEndpoints):
 
         await self._write_values(request={HeatCircuit.USE_EXCESS_ENERGY: modes})
 
+    @overload
+    async def get_excess_energy_mode(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_excess_energy_mode(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
     async def get_excess_energy_mode(
-        self,
-        position: int = 1,
-        *,
-        human_readable: bool = True,
-    ) -> int | str:
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the excess energy mode.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -3819,13 +5269,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HeatCircuit.EXCESS_ENERGY_MODE, position=position)
 
-    async def get_excess_energy_target_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_excess_energy_target_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_excess_energy_target_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_excess_energy_target_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the excess energy target temperature from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -3857,13 +5313,21 @@ class HeatCircuitEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.EXCESS_ENERGY_TARGET_TEMPERATURE: temperatures})
 
-    async def get_excess_energy_target_temperature_hysteresis(self, position: int = 1) -> float:
+    @overload
+    async def get_excess_energy_target_temperature_hysteresis(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_excess_energy_target_temperature_hysteresis(self, position: Positions) -> list[float]: ...
+
+    async def get_excess_energy_target_temperature_hysteresis(
+        self, position: int | Positions = 1
+    ) -> float | list[float]:
         """Get the excess energy target temperature hysteresis from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -3897,13 +5361,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.EXCESS_ENERGY_TARGET_TEMPERATURE_HYSTERESIS: temperatures})
 
-    async def get_excess_energy_target_cooling_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_excess_energy_target_cooling_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_excess_energy_target_cooling_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_excess_energy_target_cooling_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the excess energy target cooling temperature from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -3937,13 +5407,21 @@ class HeatCircuitEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.EXCESS_ENERGY_TARGET_COOLING_TEMPERATURE: temperatures})
 
-    async def get_excess_energy_target_cooling_temperature_hysteresis(self, position: int = 1) -> float:
+    @overload
+    async def get_excess_energy_target_cooling_temperature_hysteresis(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_excess_energy_target_cooling_temperature_hysteresis(self, position: Positions) -> list[float]: ...
+
+    async def get_excess_energy_target_cooling_temperature_hysteresis(
+        self, position: int | Positions = 1
+    ) -> float | list[float]:
         """Get the excess energy target cooling temperature hysteresis from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -3981,13 +5459,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
             request={HeatCircuit.EXCESS_ENERGY_TARGET_COOLING_TEMPERATURE_HYSTERESIS: temperatures}
         )
 
-    async def get_selected_target_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_selected_target_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_selected_target_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_selected_target_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the selected target temperature from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4002,13 +5486,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=HeatCircuit.SELECTED_TARGET_TEMPERATURE, position=position)
 
-    async def get_target_temperature_day(self, position: int = 1) -> float:
+    @overload
+    async def get_target_temperature_day(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_target_temperature_day(self, position: Positions) -> list[float]: ...
+
+    async def get_target_temperature_day(self, position: int | Positions = 1) -> float | list[float]:
         """Get the target temperature for the day from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4040,13 +5530,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.TARGET_TEMPERATURE_DAY: temperatures})
 
-    async def get_target_cooling_temperature_day(self, position: int = 1) -> float:
+    @overload
+    async def get_target_cooling_temperature_day(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_target_cooling_temperature_day(self, position: Positions) -> list[float]: ...
+
+    async def get_target_cooling_temperature_day(self, position: int | Positions = 1) -> float | list[float]:
         """Get the target cooling temperature for the day from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4078,13 +5574,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.TARGET_COOLING_TEMPERATURE_DAY: temperatures})
 
-    async def get_heating_limit_day(self, position: int = 1) -> float:
+    @overload
+    async def get_heating_limit_day(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_heating_limit_day(self, position: Positions) -> list[float]: ...
+
+    async def get_heating_limit_day(self, position: int | Positions = 1) -> float | list[float]:
         """Get the heating limit for the day from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4116,13 +5618,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.HEATING_LIMIT_DAY: temperatures})
 
-    async def get_cooling_limit_day(self, position: int = 1) -> float:
+    @overload
+    async def get_cooling_limit_day(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_cooling_limit_day(self, position: Positions) -> list[float]: ...
+
+    async def get_cooling_limit_day(self, position: int | Positions = 1) -> float | list[float]:
         """Get the cooling limit for the day from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4154,13 +5662,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.COOLING_LIMIT_DAY: temperatures})
 
-    async def get_excess_energy_heating_limit_day(self, position: int = 1) -> float:
+    @overload
+    async def get_excess_energy_heating_limit_day(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_excess_energy_heating_limit_day(self, position: Positions) -> list[float]: ...
+
+    async def get_excess_energy_heating_limit_day(self, position: int | Positions = 1) -> float | list[float]:
         """Get the excess energy heating limit for the day from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4192,13 +5706,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.EXCESS_ENERGY_HEATING_LIMIT_DAY: temperatures})
 
-    async def get_excess_energy_cooling_limit_day(self, position: int = 1) -> float:
+    @overload
+    async def get_excess_energy_cooling_limit_day(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_excess_energy_cooling_limit_day(self, position: Positions) -> list[float]: ...
+
+    async def get_excess_energy_cooling_limit_day(self, position: int | Positions = 1) -> float | list[float]:
         """Get the excess energy cooling limit for the day from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4230,13 +5750,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.EXCESS_ENERGY_COOLING_LIMIT_DAY: temperatures})
 
-    async def get_target_temperature_night(self, position: int = 1) -> float:
+    @overload
+    async def get_target_temperature_night(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_target_temperature_night(self, position: Positions) -> list[float]: ...
+
+    async def get_target_temperature_night(self, position: int | Positions = 1) -> float | list[float]:
         """Get the target temperature for the night from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4268,13 +5794,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.TARGET_TEMPERATURE_NIGHT: temperatures})
 
-    async def get_target_cooling_temperature_night(self, position: int = 1) -> float:
+    @overload
+    async def get_target_cooling_temperature_night(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_target_cooling_temperature_night(self, position: Positions) -> list[float]: ...
+
+    async def get_target_cooling_temperature_night(self, position: int | Positions = 1) -> float | list[float]:
         """Get the target cooling temperature for the night from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4306,13 +5838,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.TARGET_COOLING_TEMPERATURE_NIGHT: temperatures})
 
-    async def get_heating_limit_night(self, position: int = 1) -> float:
+    @overload
+    async def get_heating_limit_night(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_heating_limit_night(self, position: Positions) -> list[float]: ...
+
+    async def get_heating_limit_night(self, position: int | Positions = 1) -> float | list[float]:
         """Get the heating limit for the night from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4344,13 +5882,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.HEATING_LIMIT_NIGHT: temperatures})
 
-    async def get_cooling_limit_night(self, position: int = 1) -> float:
+    @overload
+    async def get_cooling_limit_night(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_cooling_limit_night(self, position: Positions) -> list[float]: ...
+
+    async def get_cooling_limit_night(self, position: int | Positions = 1) -> float | list[float]:
         """Get the cooling limit for the night from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4382,13 +5926,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.COOLING_LIMIT_NIGHT: temperatures})
 
-    async def get_excess_energy_heating_limit_night(self, position: int = 1) -> float:
+    @overload
+    async def get_excess_energy_heating_limit_night(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_excess_energy_heating_limit_night(self, position: Positions) -> list[float]: ...
+
+    async def get_excess_energy_heating_limit_night(self, position: int | Positions = 1) -> float | list[float]:
         """Get the excess energy heating limit for the night from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4420,13 +5970,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.EXCESS_ENERGY_HEATING_LIMIT_NIGHT: temperatures})
 
-    async def get_excess_energy_cooling_limit_night(self, position: int = 1) -> float:
+    @overload
+    async def get_excess_energy_cooling_limit_night(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_excess_energy_cooling_limit_night(self, position: Positions) -> list[float]: ...
+
+    async def get_excess_energy_cooling_limit_night(self, position: int | Positions = 1) -> float | list[float]:
         """Get the excess energy cooling limit for the night from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4458,13 +6014,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.EXCESS_ENERGY_COOLING_LIMIT_NIGHT: temperatures})
 
-    async def get_target_temperature_away(self, position: int = 1) -> float:
+    @overload
+    async def get_target_temperature_away(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_target_temperature_away(self, position: Positions) -> list[float]: ...
+
+    async def get_target_temperature_away(self, position: int | Positions = 1) -> float | list[float]:
         """Get the target temperature when away for the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4496,13 +6058,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         temperatures: list[float | None] = [temperature if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.TARGET_TEMPERATURE_AWAY: temperatures})
 
-    async def get_target_temperature_offset(self, position: int = 1) -> float:
+    @overload
+    async def get_target_temperature_offset(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_target_temperature_offset(self, position: Positions) -> list[float]: ...
+
+    async def get_target_temperature_offset(self, position: int | Positions = 1) -> float | list[float]:
         """Get the target temperature offset from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4534,13 +6102,21 @@ class HeatCircuitEndpoints(BaseEndpoints):
         offsets: list[float | None] = [offset if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.TARGET_TEMPERATURE_OFFSET: offsets})
 
-    async def get_operating_mode(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_operating_mode(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_operating_mode(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_operating_mode(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the operating mode from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -4582,13 +6158,21 @@ class HeatCircuitEndpoints(BaseEndpoints):
 
         await self._write_values(request={HeatCircuit.OPERATING_MODE: modes})
 
-    async def get_heat_request(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_heat_request(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_heat_request(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_heat_request(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the heat request state from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the external heat circuits
+            The number of the external heat circuits, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -4606,13 +6190,21 @@ class HeatCircuitEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HeatCircuit.HEAT_REQUEST, position=position)
 
-    async def get_cool_request(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_cool_request(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_cool_request(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_cool_request(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the cool request state from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the external heat circuits
+            The number of the external heat circuits, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -4630,13 +6222,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HeatCircuit.COOL_REQUEST, position=position)
 
-    async def get_away_start_date(self, position: int = 1) -> int:
+    @overload
+    async def get_away_start_date(self, position: int = 1) -> int: ...
+
+    @overload
+    async def get_away_start_date(self, position: Positions) -> list[int]: ...
+
+    async def get_away_start_date(self, position: int | Positions = 1) -> int | list[int]:
         """Get the away start date from the heating circuit.
 
         Parameters
         ----------
         position
-            The number of the external heat circuits
+            The number of the external heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4668,13 +6266,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         timestamps: list[float | None] = [timestamp if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.AWAY_START_DATE: timestamps})
 
-    async def get_away_end_date(self, position: int = 1) -> int:
+    @overload
+    async def get_away_end_date(self, position: int = 1) -> int: ...
+
+    @overload
+    async def get_away_end_date(self, position: Positions) -> list[int]: ...
+
+    async def get_away_end_date(self, position: int | Positions = 1) -> int | list[int]:
         """Get the away end date from the heating circuit.
 
         Parameters
         ----------
         position
-            The number of the external heat circuits
+            The number of the external heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4706,13 +6310,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         timestamps: list[float | None] = [timestamp if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.AWAY_END_DATE: timestamps})
 
-    async def get_heating_curve_offset(self, position: int = 1) -> float:
+    @overload
+    async def get_heating_curve_offset(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_heating_curve_offset(self, position: Positions) -> list[float]: ...
+
+    async def get_heating_curve_offset(self, position: int | Positions = 1) -> float | list[float]:
         """Get the heating curve offset from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4744,13 +6354,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         offsets: list[float | None] = [offset if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.HEATING_CURVE_OFFSET: offsets})
 
-    async def get_cooling_curve_offset(self, position: int = 1) -> float:
+    @overload
+    async def get_cooling_curve_offset(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_cooling_curve_offset(self, position: Positions) -> list[float]: ...
+
+    async def get_cooling_curve_offset(self, position: int | Positions = 1) -> float | list[float]:
         """Get the cooling curve offset from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4782,13 +6398,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         offsets: list[float | None] = [offset if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.COOLING_CURVE_OFFSET: offsets})
 
-    async def get_heating_curve_slope(self, position: int = 1) -> float:
+    @overload
+    async def get_heating_curve_slope(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_heating_curve_slope(self, position: Positions) -> list[float]: ...
+
+    async def get_heating_curve_slope(self, position: int | Positions = 1) -> float | list[float]:
         """Get the heating curve slope from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4820,13 +6442,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         slopes: list[float | None] = [slope if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.HEATING_CURVE_SLOPE: slopes})
 
-    async def get_cooling_curve_slope(self, position: int = 1) -> float:
+    @overload
+    async def get_cooling_curve_slope(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_cooling_curve_slope(self, position: Positions) -> list[float]: ...
+
+    async def get_cooling_curve_slope(self, position: int | Positions = 1) -> float | list[float]:
         """Get the cooling curve slope from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4858,18 +6486,21 @@ class HeatCircuitEndpoints(BaseEndpoints):
         slopes: list[float | None] = [slope if position == p else None for p in range(1, position + 1)]
         await self._write_values(request={HeatCircuit.COOLING_CURVE_SLOPE: slopes})
 
+    @overload
+    async def get_use_heating_curve(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_use_heating_curve(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
     async def get_use_heating_curve(
-        self,
-        position: int = 1,
-        *,
-        human_readable: bool = True,
-    ) -> int | str:
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the use heating curve from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -4911,13 +6542,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
 
         await self._write_values(request={HeatCircuit.USE_HEATING_CURVE: modes})
 
-    async def get_heating_curve(self, position: int = 1) -> str:
+    @overload
+    async def get_heating_curve(self, position: int = 1) -> str: ...
+
+    @overload
+    async def get_heating_curve(self, position: Positions) -> list[str]: ...
+
+    async def get_heating_curve(self, position: int | Positions = 1) -> str | list[str]:
         """Get the heating curve from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4959,13 +6596,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
 
         await self._write_values(request={HeatCircuit.HEATING_CURVE: names})
 
-    async def get_cooling_curve(self, position: int = 1) -> str:
+    @overload
+    async def get_cooling_curve(self, position: int = 1) -> str: ...
+
+    @overload
+    async def get_cooling_curve(self, position: Positions) -> list[str]: ...
+
+    async def get_cooling_curve(self, position: int | Positions = 1) -> str | list[str]:
         """Get the cooling curve from the heat circuit.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -4997,34 +6640,144 @@ class HeatCircuitEndpoints(BaseEndpoints):
 
         curve_map: dict[str, tuple[int, str]] = {name: (idx, name) for idx, name in cooling_curves}
 
-        try:
-            _idx, _name = curve_map[cooling_curve]
-        except KeyError as error:
-            message: str = f"Invalid value! Allowed values are {[name for _, name in cooling_curves]}"
-            raise APIError(message) from error
+        try:
+            _idx, _name = curve_map[cooling_curve]
+        except KeyError as error:
+            message: str = f"Invalid value! Allowed values are {[name for _, name in cooling_curves]}"
+            raise APIError(message) from error
+
+        names: list[str | None] = [_name if position == p else None for p in range(1, position + 1)]
+
+        await self._write_values(request={HeatCircuit.COOLING_CURVE: names})
+
+    async def get_heating_curve_points(
+        self,
+        heating_curve: str | Sequence[str] | None = None,
+        *,
+        only_used_points: bool = False,
+    ) -> HeatingCurves:
+        """Get the heating curve points.
+
+        Parameters
+        ----------
+        heating_curve
+            One or more heating curve names or `None` for all heating curves
+        only_used_points
+            Read the number of points (`noOfPoints`) of the selected heating curves first and request only the
+            used points instead of all 16 points per heating curve
+
+        Returns
+        -------
+        dict
+            One or more heating curves and the points
+
+        Raises
+        ------
+        APIError
+            If a heating curve name is not available
+
+        Examples
+        --------
+        >>> await client.heat_circuit.get_heating_curve_points(["HC1", "HC FBH"], only_used_points=True)
+
+        """
+        heating_curves: tuple[tuple[int, str], ...] = await self.get_available_heating_curves()
+        cache: HeatingCurveCache | None = self._connection.heating_curves if self._connection else None
+        names: list[str] | None = None
+
+        if heating_curve is not None:
+            names = [heating_curve] if isinstance(heating_curve, str) else list(heating_curve)
+            available: set[str] = {name for _, name in heating_curves}
+
+            # Validate the names before any points are read
+            for name in names:
+                if name not in available:
+                    message: str = f'Heating curve "{name}" not found'
+                    raise APIError(message)
+
+            if not names:
+                return {}
+
+        data: HeatingCurves | None = cache.points if cache else None
+
+        if data is None:
+            if only_used_points:
+                data = await self._read_used_heating_curve_points(
+                    tuple(curve for curve in heating_curves if names is None or curve[1] in names),
+                )
+            else:
+                data = await self._read_heating_curve_points(heating_curves)
+
+            if cache and (names is None or not only_used_points):
+                cache.points = data
+
+        if names is not None:
+            return {name: data[name] for name in names}
+
+        return data
+
+    async def _read_used_heating_curve_points(self, heating_curves: tuple[tuple[int, str], ...]) -> HeatingCurves:
+        if not heating_curves:
+            return {}
+
+        count_payload: Payload = [
+            ReadPayload(
+                name=LineTablePool.HEATING_CURVE_POINTS.value.value % idx,
+                attr="0",
+            )
+            for idx, _ in heating_curves
+        ]
+
+        count_response: Response = await self._post(
+            payload=self._codec.encode(count_payload),
+            endpoint=EndpointPath.READ_WRITE_VARS,
+        )
+
+        no_of_points: list[int] = [min(int(item["value"]), MAX_HEATING_CURVE_POINTS) for item in count_response]
+        payload: Payload = []
+
+        for (idx, _), points in zip(heating_curves, no_of_points, strict=True):
+            for point_idx in range(points):
+                payload += [
+                    ReadPayload(
+                        name=LineTablePool.HEATING_CURVE_POINT_X.value.value % (idx, point_idx),
+                        attr="0",
+                    ),
+                    ReadPayload(
+                        name=LineTablePool.HEATING_CURVE_POINT_Y.value.value % (idx, point_idx),
+                        attr="0",
+                    ),
+                ]
+
+        # Heating curves without points need no second request
+        response: Response = (
+            await self._post(payload=self._codec.encode(payload), endpoint=EndpointPath.READ_WRITE_VARS)
+            if payload
+            else []
+        )
 
-        names: list[str | None] = [_name if position == p else None for p in range(1, position + 1)]
+        data: HeatingCurves = {}
+        data_idx: int = 0
 
-        await self._write_values(request={HeatCircuit.COOLING_CURVE: names})
+        for (_, name), points in zip(heating_curves, no_of_points, strict=True):
+            data[name] = tuple(
+                HeatingCurvePoint(
+                    outdoor=float(response[i]["value"]),
+                    flow=float(response[i + 1]["value"]),
+                )
+                for i in range(data_idx, data_idx + points * 2, 2)
+            )
 
-    async def get_heating_curve_points(self, heating_curve: str | None = None) -> HeatingCurves:
-        """Get the heating curve points.
+            data_idx += points * 2
 
-        Parameters
-        ----------
-        heating_curve
-            The heating curve name
+        return data
 
-        Returns
-        -------
-        dict
-            One or more heating curves and the points
+    async def _read_heating_curve_points(self, heating_curves: tuple[tuple[int, str], ...]) -> HeatingCurves:
+        if not heating_curves:
+            return {}
 
-        """
         payload: Payload = []
 
-        heating_curves: tuple[tuple[int, str], ...] = await self.get_available_heating_curves()
-
         for idx, _ in heating_curves:
             payload += [
                 ReadPayload(
@@ -5050,7 +6803,7 @@ class HeatCircuitEndpoints(BaseEndpoints):
                 ]
 
         response: Response = await self._post(
-            payload=json.dumps(payload),
+            payload=self._codec.encode(payload),
             endpoint=EndpointPath.READ_WRITE_VARS,
         )
 
@@ -5081,13 +6834,6 @@ class HeatCircuitEndpoints(BaseEndpoints):
 
             data_idx += 2 + points_per_table * values_per_point
 
-        if heating_curve is not None:
-            try:
-                return {heating_curve: data[heating_curve]}
-            except KeyError as error:
-                message: str = f'Heating curve "{heating_curve}" not found'
-                raise APIError(message) from error
-
         return data
 
     async def set_heating_curve_points(self, heating_curve: str, points: HeatingCurvePoints) -> None:
@@ -5121,7 +6867,7 @@ class HeatCircuitEndpoints(BaseEndpoints):
             ]
 
             read_response: Response = await self._post(
-                payload=json.dumps(read_payload),
+                payload=self._codec.encode(read_payload),
                 endpoint=EndpointPath.READ_WRITE_VARS,
             )
 
@@ -5161,22 +6907,60 @@ class HeatCircuitEndpoints(BaseEndpoints):
             ]
 
             await self._post(
-                payload=json.dumps(write_payload),
+                payload=self._codec.encode(write_payload),
                 endpoint=f"{EndpointPath.READ_WRITE_VARS}?action=set",
             )
 
+            if self._connection and self._connection.heating_curves:
+                self._connection.heating_curves = HeatingCurveCache()
+
     async def get_available_heating_curves(self) -> tuple[tuple[int, str], ...]:
         """Get available heating curves.
 
+        With the heating curve cache of the client, only the version counters of the heating curves are read,
+        as long as no heating curve was changed.
+
         Returns
         -------
         tuple
             Index and heating curve name pairs
 
         """
+        cache: HeatingCurveCache | None = self._connection.heating_curves if self._connection else None
+
+        if cache is None:
+            return await self._read_available_heating_curves()
+
+        versions: tuple[str, ...] = await self._read_heating_curve_versions()
+
+        if versions != cache.versions:
+            cache.versions, cache.curves, cache.points = versions, None, None
+
+        if cache.curves is None:
+            cache.curves = await self._read_available_heating_curves()
+
+        return cache.curves
+
+    async def _read_heating_curve_versions(self) -> tuple[str, ...]:
+        payload: Payload = [
+            ReadPayload(
+                name=LineTablePool.SAVE_HEATING_CURVE.value.value % idx,
+                attr="0",
+            )
+            for idx in range(MAX_HEATING_CURVES)
+        ]
+
+        response: Response = await self._post(
+            payload=self._codec.encode(payload),
+            endpoint=EndpointPath.READ_WRITE_VARS,
+        )
+
+        return tuple(str(item["value"]) for item in response)
+
+    async def _read_available_heating_curves(self) -> tuple[tuple[int, str], ...]:
         payload: Payload = []
 
-        for idx in list(range(30)):
+        for idx in list(range(MAX_HEATING_CURVES)):
             payload += [
                 ReadPayload(
                     name=LineTablePool.HEATING_CURVE_NAME.value.value % idx,
@@ -5187,7 +6971,7 @@ class HeatCircuitEndpoints(BaseEndpoints):
         heating_curves: list[tuple[int, str]] = []
 
         response: Response = await self._post(
-            payload=json.dumps(payload),
+            payload=self._codec.encode(payload),
             endpoint=EndpointPath.READ_WRITE_VARS,
         )
 
@@ -5197,13 +6981,21 @@ class HeatCircuitEndpoints(BaseEndpoints):
 
         return tuple(heating_curves)
 
-    async def has_pump(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def has_pump(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def has_pump(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def has_pump(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Check if return heating circuit pump is available.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -5221,13 +7013,21 @@ class HeatCircuitEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HeatCircuit.HAS_PUMP, position=position)
 
-    async def has_var_speed_pump(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def has_var_speed_pump(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def has_var_speed_pump(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def has_var_speed_pump(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Check if return heating circuit variable sped pump is available.
 
         Parameters
         ----------
         position
-            The number of the heat pumps
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -5245,13 +7045,19 @@ class HeatCircuitEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=HeatCircuit.HAS_VAR_SPEED_PUMP, position=position)
 
-    async def get_pump_speed(self, position: int = 1) -> float:
+    @overload
+    async def get_pump_speed(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_pump_speed(self, position: Positions) -> list[float]: ...
+
+    async def get_pump_speed(self, position: int | Positions = 1) -> float | list[float]:
         """Get pump speed.
 
         Parameters
         ----------
         position
-            The number of the heat circuits
+            The number of the heat circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -5291,6 +7097,7 @@ class SolarCircuitEndpoints(BaseEndpoints):
         ssl: bool,
         skip_ssl_verification: bool,
         session: ClientSession | None = None,
+        connection: Connection | None = None,
     ) -> None:
         super().__init__(
             base_url=base_url,
@@ -5298,15 +7105,56 @@ class SolarCircuitEndpoints(BaseEndpoints):
             ssl=ssl,
             skip_ssl_verification=skip_ssl_verification,
             session=session,
+            connection=connection,
         )
 
-    async def get_name(self, position: int = 1) -> str:
-        """Get the solar circuit name.
+    async def get_all(
+        self,
+        position: int = 1,
+        *,
+        human_readable: bool = True,
+        members: Sequence[SolarCircuit] | None = None,
+    ) -> SolarCircuitSnapshot:
+        """Get all solar circuit values with one request.
+
+        Members that are unsupported according to the capability map of `filter_request()` are not read.
 
         Parameters
         ----------
         position
             The number of the solar circuits
+        human_readable
+            Return human-readable strings
+        members
+            Read only these section members, all members by default. The other fields are `None`
+
+        Returns
+        -------
+        SolarCircuitSnapshot
+            All solar circuit values
+
+        """
+        return await self._get_snapshot(
+            SolarCircuitSnapshot,
+            SolarCircuit,
+            position,
+            human_readable=human_readable,
+            members=members,
+        )
+
+    @overload
+    async def get_name(self, position: int = 1) -> str: ...
+
+    @overload
+    async def get_name(self, position: Positions) -> list[str]: ...
+
+    async def get_name(self, position: int | Positions = 1) -> str | list[str]:
+        """Get the solar circuit name.
+
+        Parameters
+        ----------
+        position
+            The number of the solar circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -5321,13 +7169,21 @@ class SolarCircuitEndpoints(BaseEndpoints):
         )
         return self._get_str_value(response, section=SolarCircuit.NAME, position=position)
 
-    async def get_operating_mode(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_operating_mode(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_operating_mode(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_operating_mode(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the operating mode from the solar circuit.
 
         Parameters
         ----------
         position
-            The number of the solar circuits
+            The number of the solar circuits, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -5369,13 +7225,21 @@ class SolarCircuitEndpoints(BaseEndpoints):
 
         await self._write_values(request={SolarCircuit.OPERATING_MODE: modes})
 
-    async def get_priority_1_before_2(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_priority_1_before_2(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_priority_1_before_2(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_priority_1_before_2(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get priority 1 before 2 for the pumps from the solar circuit.
 
         Parameters
         ----------
         position
-            The number of the solar circuits
+            The number of the solar circuits, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -5421,13 +7285,19 @@ class SolarCircuitEndpoints(BaseEndpoints):
             },
         )
 
-    async def get_source_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_source_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_source_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_source_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get source temperature from the solar circuit.
 
         Parameters
         ----------
         position
-            The number of the solar circuits
+            The number of the solar circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -5442,13 +7312,19 @@ class SolarCircuitEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=SolarCircuit.SOURCE_TEMPERATURE, position=position)
 
-    async def get_pump_1_speed(self, position: int = 1) -> float:
+    @overload
+    async def get_pump_1_speed(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_pump_1_speed(self, position: Positions) -> list[float]: ...
+
+    async def get_pump_1_speed(self, position: int | Positions = 1) -> float | list[float]:
         """Get pump 1 speed.
 
         Parameters
         ----------
         position
-            The number of the solar circuits
+            The number of the solar circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -5463,13 +7339,19 @@ class SolarCircuitEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=SolarCircuit.PUMP_1, position=position)
 
-    async def get_pump_2_speed(self, position: int = 1) -> float:
+    @overload
+    async def get_pump_2_speed(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_pump_2_speed(self, position: Positions) -> list[float]: ...
+
+    async def get_pump_2_speed(self, position: int | Positions = 1) -> float | list[float]:
         """Get pump 2 speed.
 
         Parameters
         ----------
         position
-            The number of the solar circuits
+            The number of the solar circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -5484,13 +7366,19 @@ class SolarCircuitEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=SolarCircuit.PUMP_2, position=position)
 
-    async def get_current_temperature_1(self, position: int = 1) -> float:
+    @overload
+    async def get_current_temperature_1(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_current_temperature_1(self, position: Positions) -> list[float]: ...
+
+    async def get_current_temperature_1(self, position: int | Positions = 1) -> float | list[float]:
         """Get current temperature 1 from the solar circuit.
 
         Parameters
         ----------
         position
-            The number of the solar circuits
+            The number of the solar circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -5505,13 +7393,19 @@ class SolarCircuitEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=SolarCircuit.CURRENT_TEMPERATURE, position=position, index=0)
 
-    async def get_current_temperature_2(self, position: int = 1) -> float:
+    @overload
+    async def get_current_temperature_2(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_current_temperature_2(self, position: Positions) -> list[float]: ...
+
+    async def get_current_temperature_2(self, position: int | Positions = 1) -> float | list[float]:
         """Get current temperature 2 from the solar circuit.
 
         Parameters
         ----------
         position
-            The number of the solar circuits
+            The number of the solar circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -5526,13 +7420,19 @@ class SolarCircuitEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=SolarCircuit.CURRENT_TEMPERATURE, position=position, index=1)
 
-    async def get_target_temperature_1(self, position: int = 1) -> float:
+    @overload
+    async def get_target_temperature_1(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_target_temperature_1(self, position: Positions) -> list[float]: ...
+
+    async def get_target_temperature_1(self, position: int | Positions = 1) -> float | list[float]:
         """Get target temperature 1 from the solar circuit.
 
         Parameters
         ----------
         position
-            The number of the solar circuits
+            The number of the solar circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -5567,13 +7467,19 @@ class SolarCircuitEndpoints(BaseEndpoints):
         ]
         await self._write_values(request={SolarCircuit.TARGET_TEMPERATURE: temperatures})
 
-    async def get_target_temperature_2(self, position: int = 1) -> float:
+    @overload
+    async def get_target_temperature_2(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_target_temperature_2(self, position: Positions) -> list[float]: ...
+
+    async def get_target_temperature_2(self, position: int | Positions = 1) -> float | list[float]:
         """Get target temperature 2 from the solar circuit.
 
         Parameters
         ----------
         position
-            The number of the solar circuits
+            The number of the solar circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -5608,13 +7514,21 @@ class SolarCircuitEndpoints(BaseEndpoints):
         ]
         await self._write_values(request={SolarCircuit.TARGET_TEMPERATURE: temperatures})
 
-    async def get_heat_request_1(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_heat_request_1(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_heat_request_1(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_heat_request_1(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the heat request 1 state from the solar circuit.
 
         Parameters
         ----------
         position
-            The number of the external solar circuits
+            The number of the external solar circuits, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -5632,13 +7546,21 @@ class SolarCircuitEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=SolarCircuit.HEAT_REQUEST, position=position, index=0)
 
-    async def get_heat_request_2(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_heat_request_2(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_heat_request_2(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_heat_request_2(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the heat request 2 state from the solar circuit.
 
         Parameters
         ----------
         position
-            The number of the external solar circuits
+            The number of the external solar circuits, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -5656,13 +7578,19 @@ class SolarCircuitEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=SolarCircuit.HEAT_REQUEST, position=position, index=1)
 
-    async def get_heating_energy(self, position: int = 1) -> float:
+    @overload
+    async def get_heating_energy(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_heating_energy(self, position: Positions) -> list[float]: ...
+
+    async def get_heating_energy(self, position: int | Positions = 1) -> float | list[float]:
         """Get heating energy from the solar circuit.
 
         Parameters
         ----------
         position
-            The number of the solar circuits
+            The number of the solar circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -5677,13 +7605,19 @@ class SolarCircuitEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=SolarCircuit.HEATING_ENERGY, position=position)
 
-    async def get_daily_energy(self, position: int = 1) -> float:
+    @overload
+    async def get_daily_energy(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_daily_energy(self, position: Positions) -> list[float]: ...
+
+    async def get_daily_energy(self, position: int | Positions = 1) -> float | list[float]:
         """Get daily energy from the solar circuit.
 
         Parameters
         ----------
         position
-            The number of the solar circuits
+            The number of the solar circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -5698,13 +7632,19 @@ class SolarCircuitEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=SolarCircuit.DAILY_ENERGY)
 
-    async def get_actual_power(self, position: int = 1) -> float:
+    @overload
+    async def get_actual_power(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_actual_power(self, position: Positions) -> list[float]: ...
+
+    async def get_actual_power(self, position: int | Positions = 1) -> float | list[float]:
         """Get actual power from the solar circuit.
 
         Parameters
         ----------
         position
-            The number of the solar circuits
+            The number of the solar circuits, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -5744,6 +7684,7 @@ class ExternalHeatSourceEndpoints(BaseEndpoints):
         ssl: bool,
         skip_ssl_verification: bool,
         session: ClientSession | None = None,
+        connection: Connection | None = None,
     ) -> None:
         super().__init__(
             base_url=base_url,
@@ -5751,15 +7692,58 @@ class ExternalHeatSourceEndpoints(BaseEndpoints):
             ssl=ssl,
             skip_ssl_verification=skip_ssl_verification,
             session=session,
+            connection=connection,
         )
 
-    async def get_operating_mode(self, position: int = 1, *, human_readable: bool = True) -> int | str:
-        """Get the operating mode from the external heat source.
+    async def get_all(
+        self,
+        position: int = 1,
+        *,
+        human_readable: bool = True,
+        members: Sequence[ExternalHeatSource] | None = None,
+    ) -> ExternalHeatSourceSnapshot:
+        """Get all external heat source values with one request.
+
+        Members that are unsupported according to the capability map of `filter_request()` are not read.
 
         Parameters
         ----------
         position
             The number of the external heat sources
+        human_readable
+            Return human-readable strings
+        members
+            Read only these section members, all members by default. The other fields are `None`
+
+        Returns
+        -------
+        ExternalHeatSourceSnapshot
+            All external heat source values
+
+        """
+        return await self._get_snapshot(
+            ExternalHeatSourceSnapshot,
+            ExternalHeatSource,
+            position,
+            human_readable=human_readable,
+            members=members,
+        )
+
+    @overload
+    async def get_operating_mode(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_operating_mode(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_operating_mode(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
+        """Get the operating mode from the external heat source.
+
+        Parameters
+        ----------
+        position
+            The number of the external heat sources, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -5801,13 +7785,19 @@ class ExternalHeatSourceEndpoints(BaseEndpoints):
 
         await self._write_values(request={ExternalHeatSource.OPERATING_MODE: modes})
 
-    async def get_target_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_target_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_target_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_target_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get target temperature from the external heat source.
 
         Parameters
         ----------
         position
-            The number of the external heat sources
+            The number of the external heat sources, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -5822,13 +7812,21 @@ class ExternalHeatSourceEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=ExternalHeatSource.TARGET_TEMPERATURE, position=position)
 
-    async def get_heat_request(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_heat_request(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_heat_request(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_heat_request(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the heat request state from the external heat source.
 
         Parameters
         ----------
         position
-            The number of the external heat sources
+            The number of the external heat sources, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -5846,13 +7844,19 @@ class ExternalHeatSourceEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=ExternalHeatSource.HEAT_REQUEST, position=position)
 
-    async def get_operating_time(self, position: int = 1) -> int:
+    @overload
+    async def get_operating_time(self, position: int = 1) -> int: ...
+
+    @overload
+    async def get_operating_time(self, position: Positions) -> list[int]: ...
+
+    async def get_operating_time(self, position: int | Positions = 1) -> int | list[int]:
         """Get the operating time from the external heat source.
 
         Parameters
         ----------
         position
-            The number of the external heat sources
+            The number of the external heat sources, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -5867,13 +7871,19 @@ class ExternalHeatSourceEndpoints(BaseEndpoints):
         )
         return self._get_int_value(response, section=ExternalHeatSource.OPERATING_TIME, position=position)
 
-    async def get_max_runtime(self, position: int = 1) -> int:
+    @overload
+    async def get_max_runtime(self, position: int = 1) -> int: ...
+
+    @overload
+    async def get_max_runtime(self, position: Positions) -> list[int]: ...
+
+    async def get_max_runtime(self, position: int | Positions = 1) -> int | list[int]:
         """Get the maximum runtime from the external heat source.
 
         Parameters
         ----------
         position
-            The number of the external heat sources
+            The number of the external heat sources, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -5888,13 +7898,19 @@ class ExternalHeatSourceEndpoints(BaseEndpoints):
         )
         return self._get_int_value(response, section=ExternalHeatSource.MAX_RUNTIME, position=position)
 
-    async def get_activation_counter(self, position: int = 1) -> int:
+    @overload
+    async def get_activation_counter(self, position: int = 1) -> int: ...
+
+    @overload
+    async def get_activation_counter(self, position: Positions) -> list[int]: ...
+
+    async def get_activation_counter(self, position: int | Positions = 1) -> int | list[int]:
         """Get the activation counter from the external heat source.
 
         Parameters
         ----------
         position
-            The number of the external heat sources
+            The number of the external heat sources, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -5909,13 +7925,23 @@ class ExternalHeatSourceEndpoints(BaseEndpoints):
         )
         return self._get_int_value(response, section=ExternalHeatSource.ACTIVATION_COUNTER, position=position)
 
-    async def get_consuming_excess_energy(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_consuming_excess_energy(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_consuming_excess_energy(
+        self, position: Positions, *, human_readable: bool = True
+    ) -> list[int | str]: ...
+
+    async def get_consuming_excess_energy(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the consuming excess energy from the external heat source.
 
         Parameters
         ----------
         position
-            The number of the external heat sources
+            The number of the external heat sources, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -5935,13 +7961,19 @@ class ExternalHeatSourceEndpoints(BaseEndpoints):
             response, section=ExternalHeatSource.CONSUMING_EXCESS_ENERGY, position=position
         )
 
-    async def get_excess_energy_operating_time(self, position: int = 1) -> int:
+    @overload
+    async def get_excess_energy_operating_time(self, position: int = 1) -> int: ...
+
+    @overload
+    async def get_excess_energy_operating_time(self, position: Positions) -> list[int]: ...
+
+    async def get_excess_energy_operating_time(self, position: int | Positions = 1) -> int | list[int]:
         """Get the excess energy operating time from the external heat source.
 
         Parameters
         ----------
         position
-            The number of the external heat sources
+            The number of the external heat sources, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -5956,13 +7988,19 @@ class ExternalHeatSourceEndpoints(BaseEndpoints):
         )
         return self._get_int_value(response, section=ExternalHeatSource.EXCESS_ENERGY_OPERATING_TIME, position=position)
 
-    async def get_excess_energy_max_runtime(self, position: int = 1) -> int:
+    @overload
+    async def get_excess_energy_max_runtime(self, position: int = 1) -> int: ...
+
+    @overload
+    async def get_excess_energy_max_runtime(self, position: Positions) -> list[int]: ...
+
+    async def get_excess_energy_max_runtime(self, position: int | Positions = 1) -> int | list[int]:
         """Get the excess energy maximum runtime from the external heat source.
 
         Parameters
         ----------
         position
-            The number of the external heat sources
+            The number of the external heat sources, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -5977,13 +8015,19 @@ class ExternalHeatSourceEndpoints(BaseEndpoints):
         )
         return self._get_int_value(response, section=ExternalHeatSource.EXCESS_ENERGY_MAX_RUNTIME, position=position)
 
-    async def get_excess_energy_activation_counter(self, position: int = 1) -> int:
+    @overload
+    async def get_excess_energy_activation_counter(self, position: int = 1) -> int: ...
+
+    @overload
+    async def get_excess_energy_activation_counter(self, position: Positions) -> list[int]: ...
+
+    async def get_excess_energy_activation_counter(self, position: int | Positions = 1) -> int | list[int]:
         """Get the excess energy activation counter from the external heat source.
 
         Parameters
         ----------
         position
-            The number of the external heat sources
+            The number of the external heat sources, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -6000,18 +8044,21 @@ class ExternalHeatSourceEndpoints(BaseEndpoints):
             response, section=ExternalHeatSource.EXCESS_ENERGY_ACTIVATION_COUNTER, position=position
         )
 
+    @overload
+    async def get_use_excess_energy(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_use_excess_energy(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
     async def get_use_excess_energy(
-        self,
-        position: int = 1,
-        *,
-        human_readable: bool = True,
-    ) -> int | str:
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the use excess energy state.
 
         Parameters
         ----------
         position
-            The number of the external heat sources
+            The number of the external heat sources, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -6053,13 +8100,19 @@ class ExternalHeatSourceEndpoints(BaseEndpoints):
 
         await self._write_values(request={ExternalHeatSource.USE_EXCESS_ENERGY: modes})
 
-    async def get_min_runtime_excess_energy(self, position: int = 1) -> int:
+    @overload
+    async def get_min_runtime_excess_energy(self, position: int = 1) -> int: ...
+
+    @overload
+    async def get_min_runtime_excess_energy(self, position: Positions) -> list[int]: ...
+
+    async def get_min_runtime_excess_energy(self, position: int | Positions = 1) -> int | list[int]:
         """Get the minimum runtime excess energy.
 
         Parameters
         ----------
         position
-            The number of the external heat sources
+            The number of the external heat sources, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -6116,6 +8169,7 @@ class SwitchValveEndpoints(BaseEndpoints):
         ssl: bool,
         skip_ssl_verification: bool,
         session: ClientSession | None = None,
+        connection: Connection | None = None,
     ) -> None:
         super().__init__(
             base_url=base_url,
@@ -6123,15 +8177,58 @@ class SwitchValveEndpoints(BaseEndpoints):
             ssl=ssl,
             skip_ssl_verification=skip_ssl_verification,
             session=session,
+            connection=connection,
         )
 
-    async def get_position(self, position: int = 1, *, human_readable: bool = True) -> int | str:
-        """Get switch valve position.
+    async def get_all(
+        self,
+        position: int = 1,
+        *,
+        human_readable: bool = True,
+        members: Sequence[SwitchValve] | None = None,
+    ) -> SwitchValveSnapshot:
+        """Get all switch valve values with one request.
+
+        Members that are unsupported according to the capability map of `filter_request()` are not read.
 
         Parameters
         ----------
         position
             The number of the switch valves
+        human_readable
+            Return human-readable strings
+        members
+            Read only these section members, all members by default. The other fields are `None`
+
+        Returns
+        -------
+        SwitchValveSnapshot
+            All switch valve values
+
+        """
+        return await self._get_snapshot(
+            SwitchValveSnapshot,
+            SwitchValve,
+            position,
+            human_readable=human_readable,
+            members=members,
+        )
+
+    @overload
+    async def get_position(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_position(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_position(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
+        """Get switch valve position.
+
+        Parameters
+        ----------
+        position
+            The number of the switch valves, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -6174,6 +8271,7 @@ class PassiveCoolingEndpoints(BaseEndpoints):
         ssl: bool,
         skip_ssl_verification: bool,
         session: ClientSession | None = None,
+        connection: Connection | None = None,
     ) -> None:
         super().__init__(
             base_url=base_url,
@@ -6181,15 +8279,56 @@ class PassiveCoolingEndpoints(BaseEndpoints):
             ssl=ssl,
             skip_ssl_verification=skip_ssl_verification,
             session=session,
+            connection=connection,
         )
 
-    async def get_temperature(self, position: int = 1) -> float:
-        """Get the temperature from passive cooling.
+    async def get_all(
+        self,
+        position: int = 1,
+        *,
+        human_readable: bool = True,
+        members: Sequence[PassiveCooling] | None = None,
+    ) -> PassiveCoolingSnapshot:
+        """Get all passive cooling values with one request.
+
+        Members that are unsupported according to the capability map of `filter_request()` are not read.
 
         Parameters
         ----------
         position
             The number of passive cooling
+        human_readable
+            Return human-readable strings
+        members
+            Read only these section members, all members by default. The other fields are `None`
+
+        Returns
+        -------
+        PassiveCoolingSnapshot
+            All passive cooling values
+
+        """
+        return await self._get_snapshot(
+            PassiveCoolingSnapshot,
+            PassiveCooling,
+            position,
+            human_readable=human_readable,
+            members=members,
+        )
+
+    @overload
+    async def get_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_temperature(self, position: int | Positions = 1) -> float | list[float]:
+        """Get the temperature from passive cooling.
+
+        Parameters
+        ----------
+        position
+            The number of passive cooling, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -6204,13 +8343,23 @@ class PassiveCoolingEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=PassiveCooling.TEMPERATURE, position=position)
 
-    async def get_switch_valve_position(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_switch_valve_position(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_switch_valve_position(
+        self, position: Positions, *, human_readable: bool = True
+    ) -> list[int | str]: ...
+
+    async def get_switch_valve_position(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get switch valve position from passive cooling.
 
         Parameters
         ----------
         position
-            The number of passive cooling
+            The number of passive cooling, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -6228,13 +8377,19 @@ class PassiveCoolingEndpoints(BaseEndpoints):
         )
         return self._get_int_or_str_value(response, section=PassiveCooling.SWITCH_VALVE_POSITION, position=position)
 
-    async def get_circulation_pump_speed(self, position: int = 1) -> float:
+    @overload
+    async def get_circulation_pump_speed(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_circulation_pump_speed(self, position: Positions) -> list[float]: ...
+
+    async def get_circulation_pump_speed(self, position: int | Positions = 1) -> float | list[float]:
         """Get the circulation pump speed from passive cooling.
 
         Parameters
         ----------
         position
-            The number of passive cooling
+            The number of passive cooling, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -6249,13 +8404,19 @@ class PassiveCoolingEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=PassiveCooling.CIRCULATION_PUMP_SPEED, position=position)
 
-    async def get_mixer_target_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_mixer_target_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_mixer_target_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_mixer_target_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the mixer target temperature from passive cooling.
 
         Parameters
         ----------
         position
-            The number of passive cooling
+            The number of passive cooling, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -6270,13 +8431,19 @@ class PassiveCoolingEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=PassiveCooling.MIXER_TARGET_TEMPERATURE, position=position)
 
-    async def get_mixer_flow_temperature(self, position: int = 1) -> float:
+    @overload
+    async def get_mixer_flow_temperature(self, position: int = 1) -> float: ...
+
+    @overload
+    async def get_mixer_flow_temperature(self, position: Positions) -> list[float]: ...
+
+    async def get_mixer_flow_temperature(self, position: int | Positions = 1) -> float | list[float]:
         """Get the mixer flow temperature from passive cooling.
 
         Parameters
         ----------
         position
-            The number of passive cooling
+            The number of passive cooling, a sequence of numbers or `ALL` for a list in position order
 
         Returns
         -------
@@ -6291,13 +8458,21 @@ class PassiveCoolingEndpoints(BaseEndpoints):
         )
         return self._get_float_value(response, section=PassiveCooling.MIXER_FLOW_TEMPERATURE, position=position)
 
-    async def get_mixer_position(self, position: int = 1, *, human_readable: bool = True) -> int | str:
+    @overload
+    async def get_mixer_position(self, position: int = 1, *, human_readable: bool = True) -> int | str: ...
+
+    @overload
+    async def get_mixer_position(self, position: Positions, *, human_readable: bool = True) -> list[int | str]: ...
+
+    async def get_mixer_position(
+        self, position: int | Positions = 1, *, human_readable: bool = True
+    ) -> int | str | list[int | str]:
         """Get the mixer position.
 
         Parameters
         ----------
         position
-            The number of passive cooling
+            The number of passive cooling, a sequence of numbers or `ALL` for a list in position order
         human_readable
             Return a human-readable string
 
@@ -6341,6 +8516,7 @@ class PhotovoltaicsEndpoints(BaseEndpoints):
         ssl: bool,
         skip_ssl_verification: bool,
         session: ClientSession | None = None,
+        connection: Connection | None = None,
     ) -> None:
         super().__init__(
             base_url=base_url,
@@ -6348,6 +8524,37 @@ class PhotovoltaicsEndpoints(BaseEndpoints):
             ssl=ssl,
             skip_ssl_verification=skip_ssl_verification,
             session=session,
+            connection=connection,
+        )
+
+    async def get_all(
+        self,
+        *,
+        human_readable: bool = True,
+        members: Sequence[Photovoltaics] | None = None,
+    ) -> PhotovoltaicsSnapshot:
+        """Get all photovoltaics values with one request.
+
+        Members that are unsupported according to the capability map of `filter_request()` are not read.
+
+        Parameters
+        ----------
+        human_readable
+            Return human-readable strings
+        members
+            Read only these section members, all members by default. The other fields are `None`
+
+        Returns
+        -------
+        PhotovoltaicsSnapshot
+            All photovoltaics values
+
+        """
+        return await self._get_snapshot(
+            PhotovoltaicsSnapshot,
+            Photovoltaics,
+            human_readable=human_readable,
+            members=members,
         )
 
     async def get_excess_energy_active(
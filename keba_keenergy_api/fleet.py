@@ -0,0 +1,224 @@
+"""Poll many controllers concurrently over one shared connector."""
+
+import asyncio
+import random
+from collections.abc import AsyncGenerator
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterable
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+from typing import Generic
+from typing import TypeVar
+
+from aiohttp import ClientSession
+from aiohttp import ClientTimeout
+from aiohttp import TCPConnector
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.constants import API_DEFAULT_FLEET_JITTER
+from keba_keenergy_api.constants import API_DEFAULT_FLEET_LIMIT
+from keba_keenergy_api.constants import API_DEFAULT_FLEET_LIMIT_PER_HOST
+from keba_keenergy_api.constants import API_DEFAULT_KEEPALIVE_TIMEOUT
+from keba_keenergy_api.constants import API_DEFAULT_TIMEOUT
+from keba_keenergy_api.error import APIError
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class FleetResult(Generic[T]):
+    """The result of a poll of one controller.
+
+    Either the value or the error is set.
+
+    """
+
+    host: str
+    value: T | None = None
+    error: Exception | None = None
+
+
+class KebaFleet:
+    """Manage many clients that share one aiohttp session and connector.
+
+    Examples
+    --------
+    >>> async with KebaFleet(limit=50, jitter=2) as fleet:
+    >>>     for host in ("ap4400-1.local", "ap4400-2.local"):
+    >>>         fleet.add(host)
+    >>>
+    >>>     async for result in fleet.poll_all(lambda client: client.system.get_outdoor_temperature()):
+    >>>         print(result.host, result.value, result.error)
+
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int = API_DEFAULT_FLEET_LIMIT,
+        limit_per_host: int = API_DEFAULT_FLEET_LIMIT_PER_HOST,
+        jitter: float = API_DEFAULT_FLEET_JITTER,
+        keepalive_timeout: float = API_DEFAULT_KEEPALIVE_TIMEOUT,
+    ) -> None:
+        """Initialize the fleet with concurrency limits.
+
+        Parameters
+        ----------
+        limit
+            The maximum number of concurrent polls and connections of the whole fleet
+        limit_per_host
+            The maximum number of concurrent polls and connections per controller
+        jitter
+            Delay every poll by a random time between `0` and `jitter` seconds, so the polls of the fleet are
+            staggered
+        keepalive_timeout
+            Close idle keep-alive connections after this time in seconds
+
+        """
+        self.limit: int = limit
+        self.limit_per_host: int = limit_per_host
+        self.jitter: float = jitter
+        self.keepalive_timeout: float = keepalive_timeout
+        self.clients: dict[str, KebaKeEnergyAPI] = {}
+        self._session: ClientSession | None = None
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(limit)
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    async def __aenter__(self) -> "KebaFleet":  # noqa: PYI034
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    def get_session(self) -> ClientSession:
+        """Get the shared client session and create it if necessary.
+
+        The session must be created inside the running event loop and is shared until `close()` is called.
+
+        Returns
+        -------
+        ClientSession
+            The shared aiohttp client session
+
+        """
+        if self._session is None or self._session.closed:
+            self._session = ClientSession(
+                connector=TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                ),
+                timeout=ClientTimeout(total=API_DEFAULT_TIMEOUT),
+            )
+
+        return self._session
+
+    def add(
+        self,
+        host: str,
+        username: str | None = None,
+        password: str | None = None,
+        **options: Any,  # noqa: ANN401
+    ) -> KebaKeEnergyAPI:
+        """Add a controller to the fleet.
+
+        Parameters
+        ----------
+        host
+            The hostname or IP adress e.g. ap4400.local
+        username
+            Required for basic auth
+        password
+            Required for basic auth
+        options
+            Other options of `KebaKeEnergyAPI` e.g. `ssl` or `cache`
+
+        Returns
+        -------
+        KebaKeEnergyAPI
+            The client of the controller with the shared session
+
+        """
+        client: KebaKeEnergyAPI = KebaKeEnergyAPI(host, username, password, session=self.get_session(), **options)
+        self.clients[host] = client
+        self._host_semaphores[host] = asyncio.Semaphore(self.limit_per_host)
+        return client
+
+    def remove(self, host: str, /) -> None:
+        """Remove a controller from the fleet.
+
+        Parameters
+        ----------
+        host
+            The hostname or IP adress e.g. ap4400.local
+
+        """
+        self.clients.pop(host, None)
+        self._host_semaphores.pop(host, None)
+
+    async def close(self) -> None:
+        """Close the shared client session and its connector."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _poll(self, host: str, poll: Callable[[KebaKeEnergyAPI], Awaitable[T]]) -> FleetResult[T]:
+        await asyncio.sleep(random.uniform(0, self.jitter))  # noqa: S311
+
+        if host not in self.clients:
+            message: str = f"Unknown host {host!r}"
+            return FleetResult(host=host, error=APIError(message))
+
+        async with self._semaphore, self._host_semaphores[host]:
+            try:
+                return FleetResult(host=host, value=await poll(self.clients[host]))
+            except Exception as error:  # noqa: BLE001
+                # A malformed response of one controller must not stop the polls of the other controllers
+                return FleetResult(host=host, error=error)
+
+    async def poll_all(
+        self,
+        poll: Callable[[KebaKeEnergyAPI], Awaitable[T]],
+        hosts: Iterable[str] | None = None,
+    ) -> AsyncGenerator[FleetResult[T], None]:
+        """Poll every controller and yield the results in the order they complete.
+
+        Every poll starts after a random delay up to `jitter` seconds and waits for a free slot of the fleet and the
+        controller. Every error of a controller, e.g. an `APIError` or an invalid response, is returned in its result
+        and doesn't stop the other polls. If the iteration is stopped early, the remaining polls are cancelled.
+
+        Parameters
+        ----------
+        poll
+            Read the values of one client e.g. `lambda client: client.read_data([HeatPump.STATE])`
+        hosts
+            Poll only these controllers, all controllers by default. Unknown hosts return an `APIError` result.
+
+        Yields
+        ------
+        FleetResult
+            The result of every controller
+
+        Examples
+        --------
+        >>> async for result in fleet.poll_all(lambda client: client.heat_pump.get_state(position=ALL)):
+        >>>     print(result.host, result.value)
+
+        """
+        tasks: list[asyncio.Task[FleetResult[T]]] = [
+            asyncio.create_task(self._poll(host, poll)) for host in (self.clients if hosts is None else hosts)
+        ]
+
+        try:
+            for future in asyncio.as_completed(tasks):
+                yield await future
+        finally:
+            for task in tasks:
+                task.cancel()
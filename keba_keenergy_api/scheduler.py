@@ -0,0 +1,184 @@
+"""Poll every variable in its own interval."""
+
+import math
+import re
+from collections.abc import Iterable
+from collections.abc import Mapping
+from collections.abc import Sequence
+from enum import Enum
+from re import Pattern
+from typing import get_args
+
+from keba_keenergy_api.constants import API_DEFAULT_MAX_POLL_INTERVAL
+from keba_keenergy_api.constants import API_DEFAULT_MIN_POLL_INTERVAL
+from keba_keenergy_api.constants import Section
+from keba_keenergy_api.subscription import ValueChange
+from keba_keenergy_api.subscription import Variable
+
+STATIC_INTERVAL: float = math.inf
+SLOW_INTERVAL: float = 300
+
+STATIC_MEMBER_PATTERN: Pattern[str] = re.compile(r"^(NAME|HAS_(?!.*_FAILURE$)\w+|\w+_NUMBERS|\w+_METER_TYPE)$")
+SLOW_MEMBER_PATTERN: Pattern[str] = re.compile(
+    r"((HEATING|COOLING|HOT_WATER|THERMAL|DAILY|TOTAL)_ENERGY|ENERGY_CONSUMPTION|OPERATING_TIME|ACTIVATION_COUNTER)$",
+)
+
+
+def _get_default_policies() -> dict[type[Enum] | Enum, float]:
+    policies: dict[type[Enum] | Enum, float] = {}
+
+    for section in get_args(Section):
+        for member in section:
+            if STATIC_MEMBER_PATTERN.match(member.name):
+                policies[member] = STATIC_INTERVAL
+            elif SLOW_MEMBER_PATTERN.search(member.name):
+                policies[member] = SLOW_INTERVAL
+
+    return policies
+
+
+# Names and installed features are read once, energy meters and operating counters every few minutes
+DEFAULT_POLL_POLICIES: dict[type[Enum] | Enum, float] = _get_default_policies()
+
+
+class PollScheduler:
+    """Schedule the polls of every variable.
+
+    Every variable is polled in the interval (in seconds) of its section member, its section or the default interval,
+    in this order. Variables with an infinite interval are read only once. With `adaptive`, the interval of a variable
+    is halved if its value changed and increased by half if not, within `min_interval` and `max_interval`. The first
+    poll of a variable is only the baseline and doesn't change its interval.
+
+    Examples
+    --------
+    >>> scheduler = PollScheduler(
+    >>>     [Variable(section=HeatPump.COMPRESSOR, position=1), Variable(section=HeatPump.NAME, position=1)],
+    >>>     interval=5,
+    >>>     policies=DEFAULT_POLL_POLICIES,
+    >>> )
+    >>> scheduler.get_due(monotonic())
+    [0, 1]
+
+    """
+
+    def __init__(
+        self,
+        variables: Sequence[Variable],
+        *,
+        interval: float,
+        policies: Mapping[type[Enum] | Enum, float] | None = None,
+        adaptive: bool = False,
+        min_interval: float = API_DEFAULT_MIN_POLL_INTERVAL,
+        max_interval: float = API_DEFAULT_MAX_POLL_INTERVAL,
+    ) -> None:
+        self.variables: tuple[Variable, ...] = tuple(variables)
+        self.interval: float = interval
+        self.policies: Mapping[type[Enum] | Enum, float] = policies or {}
+        self.adaptive: bool = adaptive
+        self.min_interval: float = min_interval
+        self.max_interval: float = max_interval
+        self.intervals: list[float] = [self.get_interval(variable.section) for variable in self.variables]
+        self._due: list[float] = [-math.inf] * len(self.variables)
+        self._indexes: dict[Variable, int] = {variable: idx for idx, variable in enumerate(self.variables)}
+
+    def set_variables(self, variables: Sequence[Variable], /) -> None:
+        """Replace the variables and keep the schedule of the known variables.
+
+        New variables are due immediately.
+
+        Parameters
+        ----------
+        variables
+            The variables in the order of the read payload
+
+        """
+        intervals: list[float] = []
+        due: list[float] = []
+
+        for variable in variables:
+            if (idx := self._indexes.get(variable)) is None:
+                intervals.append(self.get_interval(variable.section))
+                due.append(-math.inf)
+            else:
+                intervals.append(self.intervals[idx])
+                due.append(self._due[idx])
+
+        self.variables = tuple(variables)
+        self.intervals = intervals
+        self._due = due
+        self._indexes = {variable: idx for idx, variable in enumerate(self.variables)}
+
+    def get_interval(self, section: Section, /) -> float:
+        """Get the configured interval for a section member.
+
+        Parameters
+        ----------
+        section
+            The section member e.g. HeatPump.COMPRESSOR
+
+        Returns
+        -------
+        float
+            The interval in seconds
+
+        """
+        return self.policies.get(section, self.policies.get(type(section), self.interval))
+
+    def get_due(self, now: float, /) -> list[int]:
+        """Get the indexes of the variables that are due.
+
+        Parameters
+        ----------
+        now
+            The monotonic time
+
+        Returns
+        -------
+        list
+            The indexes of the due variables in the order of the read payload
+
+        """
+        return [idx for idx, due in enumerate(self._due) if due <= now]
+
+    def get_delay(self, now: float, /) -> float:
+        """Get the time until the next variable is due.
+
+        Parameters
+        ----------
+        now
+            The monotonic time
+
+        Returns
+        -------
+        float
+            The delay in seconds, infinite if every variable was read once and is not polled again
+
+        """
+        return max(0, min(self._due, default=math.inf) - now)
+
+    def update(self, indexes: Iterable[int], changes: Iterable[ValueChange], now: float) -> None:
+        """Schedule the next poll of the polled variables.
+
+        Parameters
+        ----------
+        indexes
+            The indexes of the polled variables
+        changes
+            The changed values of the poll
+        now
+            The monotonic time of the poll
+
+        """
+        changed: set[int] = {
+            self._indexes[Variable(change.section, change.position, change.sub_index)] for change in changes
+        }
+
+        for idx in indexes:
+            interval: float = self.intervals[idx]
+
+            # The first poll of a variable has no previous value to compare with
+            if self.adaptive and interval != STATIC_INTERVAL and self._due[idx] != -math.inf:
+                interval = interval / 2 if idx in changed else interval * 1.5
+                self.intervals[idx] = interval = min(max(interval, self.min_interval), self.max_interval)
+
+            self._due[idx] = now + interval
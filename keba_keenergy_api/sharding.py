@@ -0,0 +1,392 @@
+"""Poll a large fleet with one event loop per worker process."""
+
+import asyncio
+import multiprocessing
+import os
+import queue
+from collections.abc import AsyncGenerator
+from collections.abc import Sequence
+from contextlib import suppress
+from functools import partial
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+from typing import Protocol
+from typing import TYPE_CHECKING
+from typing import cast
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.codec import CODECS
+from keba_keenergy_api.codec import JSONCodec
+from keba_keenergy_api.codec import STDLIB_CODEC
+from keba_keenergy_api.codec import get_codec
+from keba_keenergy_api.constants import API_DEFAULT_FLEET_JITTER
+from keba_keenergy_api.constants import API_DEFAULT_FLEET_LIMIT
+from keba_keenergy_api.constants import API_DEFAULT_FLEET_LIMIT_PER_HOST
+from keba_keenergy_api.constants import API_DEFAULT_SHARD_BATCH_SIZE
+from keba_keenergy_api.constants import SECTION_METADATA
+from keba_keenergy_api.constants import SECTION_NAMES
+from keba_keenergy_api.constants import Section
+from keba_keenergy_api.endpoints import Position
+from keba_keenergy_api.endpoints import ValueResponse
+from keba_keenergy_api.error import APIError
+from keba_keenergy_api.fleet import FleetResult
+from keba_keenergy_api.fleet import KebaFleet
+
+if TYPE_CHECKING:
+    from multiprocessing.context import SpawnProcess
+    from multiprocessing.queues import Queue
+
+
+class Channel(Protocol):
+    """A queue between the parent process and a worker process e.g. `multiprocessing.Queue`."""
+
+    def get(self) -> Any:  # noqa: ANN401
+        """Remove and return an item, wait until an item is available."""
+
+    def put(self, obj: Any, /) -> None:  # noqa: ANN401
+        """Put an item into the queue."""
+
+
+@dataclass(frozen=True, slots=True)
+class ReadCommand:
+    """Arguments of `read_data()` for one poll of every worker process.
+
+    The section members are sent by name e.g. `HeatPump.STATE`, because their values can't be pickled.
+
+    """
+
+    request: list[str]
+    position: Position | int | list[int] | None = None
+    human_readable: bool = True
+    extra_attributes: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class WorkerOptions:
+    """Options of the fleet and the clients of a worker process."""
+
+    limit: int
+    limit_per_host: int
+    jitter: float
+    batch_size: int
+    codec: str | None
+    client_options: dict[str, Any]
+
+
+def get_shards(hosts: Sequence[str], processes: int) -> list[list[str]]:
+    """Split the hosts round-robin into shards.
+
+    Parameters
+    ----------
+    hosts
+        The hostnames or IP adresses e.g. ap4400.local
+    processes
+        The maximum number of shards
+
+    Returns
+    -------
+    list
+        The hosts of every shard, without empty shards
+
+    Examples
+    --------
+    >>> get_shards(["ap4400-1.local", "ap4400-2.local", "ap4400-3.local"], 2)
+    [['ap4400-1.local', 'ap4400-3.local'], ['ap4400-2.local']]
+
+    """
+    return [list(hosts[idx::processes]) for idx in range(min(processes, len(hosts)))]
+
+
+def get_channel_codec(name: str | None = None) -> JSONCodec:
+    """Get the JSON codec for the results of the worker processes.
+
+    Parameters
+    ----------
+    name
+        The codec name `orjson`, `msgspec` or `json`, the fastest installed codec by default
+
+    Returns
+    -------
+    JSONCodec
+        The JSON codec
+
+    """
+    if name is not None:
+        return get_codec(name)
+
+    for factory in (CODECS["orjson"], CODECS["msgspec"]):
+        with suppress(ImportError):
+            return factory()
+
+    return STDLIB_CODEC
+
+
+async def _read_data(command: ReadCommand, client: KebaKeEnergyAPI) -> dict[str, ValueResponse]:
+    return await client.read_data(
+        [SECTION_NAMES[name] for name in command.request],
+        command.position,
+        human_readable=command.human_readable,
+        extra_attributes=command.extra_attributes,
+    )
+
+
+async def run_worker(hosts: list[str], options: WorkerOptions, commands: Channel, results: Channel) -> None:
+    """Poll a shard of hosts for every command until `None` is received.
+
+    The results are sent in batches of encoded `[host, value, error]` items, every poll ends with `None`.
+
+    Parameters
+    ----------
+    hosts
+        The hosts of the shard
+    options
+        The options of the fleet and the clients
+    commands
+        The read commands from the parent process
+    results
+        The encoded results for the parent process
+
+    """
+    codec: JSONCodec = get_channel_codec(options.codec)
+
+    async with KebaFleet(limit=options.limit, limit_per_host=options.limit_per_host, jitter=options.jitter) as fleet:
+        for host in hosts:
+            fleet.add(host, codec=get_codec(options.codec), **options.client_options)
+
+        while (command := await asyncio.to_thread(commands.get)) is not None:
+            batch: list[tuple[str, dict[str, ValueResponse] | None, str | None]] = []
+
+            async for result in fleet.poll_all(partial(_read_data, command)):
+                batch.append((result.host, result.value, None if result.error is None else str(result.error)))
+
+                if len(batch) >= options.batch_size:
+                    results.put(codec.encode(batch))
+                    batch = []
+
+            if batch:
+                results.put(codec.encode(batch))
+
+            results.put(None)
+
+
+def _run_worker_process(hosts: list[str], options: WorkerOptions, commands: Channel, results: Channel) -> None:
+    asyncio.run(run_worker(hosts, options, commands, results))  # pragma: no cover
+
+
+class ShardedFleet:
+    """Poll a large fleet with `read_data()` in several worker processes.
+
+    The hosts are split round-robin into one shard per worker process. Every worker process runs its own event loop
+    with a `KebaFleet` and keeps its clients and pooled session between polls. The results are sent back to the
+    parent process as batches of JSON encoded items.
+
+    Examples
+    --------
+    >>> async with ShardedFleet(hosts, processes=4, limit=100) as fleet:
+    >>>     # Without a position, every controller reads all of its installed devices
+    >>>     async for result in fleet.poll_all([HeatPump.STATE, HeatPump.FLOW_TEMPERATURE]):
+    >>>         print(result.host, result.value, result.error)
+
+    """
+
+    WORKER_CHECK_INTERVAL: float = 1
+
+    def __init__(
+        self,
+        hosts: Sequence[str],
+        username: str | None = None,
+        password: str | None = None,
+        *,
+        processes: int | None = None,
+        limit: int = API_DEFAULT_FLEET_LIMIT,
+        limit_per_host: int = API_DEFAULT_FLEET_LIMIT_PER_HOST,
+        jitter: float = API_DEFAULT_FLEET_JITTER,
+        batch_size: int = API_DEFAULT_SHARD_BATCH_SIZE,
+        codec: str | None = None,
+        **options: Any,  # noqa: ANN401
+    ) -> None:
+        """Initialize the fleet with the hosts and the number of worker processes.
+
+        Parameters
+        ----------
+        hosts
+            The hostnames or IP adresses e.g. ap4400.local
+        username
+            Required for basic auth
+        password
+            Required for basic auth
+        processes
+            The number of worker processes, the number of CPUs by default
+        limit
+            The maximum number of concurrent polls of every worker process
+        limit_per_host
+            The maximum number of concurrent polls per controller
+        jitter
+            Delay every poll by a random time between `0` and `jitter` seconds
+        batch_size
+            Send the results of a worker process in batches of this size
+        codec
+            The name of the JSON codec for the responses and results, the fastest installed codec by default
+        options
+            Other picklable options of `KebaKeEnergyAPI` e.g. `ssl`
+
+        """
+        self.hosts: tuple[str, ...] = tuple(hosts)
+        self.shards: list[list[str]] = get_shards(self.hosts, processes or os.cpu_count() or 1)
+        self.options: WorkerOptions = WorkerOptions(
+            limit=limit,
+            limit_per_host=limit_per_host,
+            jitter=jitter,
+            batch_size=batch_size,
+            codec=codec,
+            client_options={"username": username, "password": password, **options},
+        )
+        self.codec: JSONCodec = get_channel_codec(codec)
+        self._processes: list[SpawnProcess] = []
+        self._commands: list[Channel] = []
+        self._results: Queue[Any] | None = None
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "ShardedFleet":  # noqa: PYI034
+        self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        """Start the worker processes, if they are not running.
+
+        If a worker process exited, all worker processes are restarted with new queues, so no results of an aborted
+        poll are left in the result queue.
+
+        """
+        if self._processes and all(process.is_alive() for process in self._processes):
+            return
+
+        self._kill()
+
+        context: multiprocessing.context.SpawnContext = multiprocessing.get_context("spawn")
+        self._results = context.Queue()
+
+        for shard in self.shards:
+            commands: Channel = context.Queue()
+            process: SpawnProcess = context.Process(
+                target=_run_worker_process,
+                args=(shard, self.options, commands, self._results),
+                daemon=True,
+            )
+            process.start()
+
+            self._commands.append(commands)
+            self._processes.append(process)
+
+    async def close(self) -> None:
+        """Stop the worker processes."""
+        for commands in self._commands:
+            commands.put(None)
+
+        for process in self._processes:
+            await asyncio.to_thread(process.join, self.WORKER_CHECK_INTERVAL)
+
+            if process.is_alive():
+                process.kill()
+
+        self._processes = []
+        self._commands = []
+        self._results = None
+
+    def _kill(self) -> None:
+        for process in self._processes:
+            process.kill()
+            process.join()
+
+        self._processes = []
+        self._commands = []
+        self._results = None
+
+    async def _get_result(self) -> Any:  # noqa: ANN401
+        results: Queue[Any] = cast("Queue[Any]", self._results)
+
+        while True:
+            with suppress(queue.Empty):
+                return await asyncio.to_thread(results.get, timeout=self.WORKER_CHECK_INTERVAL)
+
+            if not all(process.is_alive() for process in self._processes):
+                message: str = "A worker process of the sharded fleet exited"
+                raise APIError(message)
+
+    async def poll_all(
+        self,
+        request: Section | list[Section],
+        position: Position | int | list[int] | None = None,
+        *,
+        human_readable: bool = True,
+        extra_attributes: bool = False,
+    ) -> AsyncGenerator[FleetResult[dict[str, ValueResponse]], None]:
+        """Read the request from every controller and yield the results in the order the batches arrive.
+
+        Only one poll runs at a time. If the iteration is stopped early, the remaining results of the poll are
+        discarded.
+
+        Parameters
+        ----------
+        request
+            Section or a list of sections e.g. [BufferTank.NAME, ...]
+        position
+            The number of the installed devices e.g. number of buffer tanks, all installed devices of every controller
+            by default. Like `read_data()`, `ALL` is not supported.
+        human_readable
+            Return a human-readable string
+        extra_attributes
+            Append the extra attributes to the response
+
+        Yields
+        ------
+        FleetResult
+            The result of every controller, errors are returned as `APIError`
+
+        Raises
+        ------
+        APIError
+            If a worker process exited, the worker processes are restarted by the next poll
+
+        """
+        command: ReadCommand = ReadCommand(
+            request=[
+                SECTION_METADATA[section].name for section in (request if isinstance(request, list) else [request])
+            ],
+            position=position,
+            human_readable=human_readable,
+            extra_attributes=extra_attributes,
+        )
+
+        async with self._lock:
+            self.start()
+
+            for commands in self._commands:
+                commands.put(command)
+
+            pending: int = len(self._commands)
+
+            try:
+                while pending:
+                    data: str | bytes | None = await self._get_result()
+
+                    if data is None:
+                        pending -= 1
+                        continue
+
+                    for host, value, error in self.codec.decode(data):
+                        yield FleetResult(host=host, value=value, error=None if error is None else APIError(error))
+            finally:
+                # Discard the remaining results, so the next poll starts with an empty channel
+                while pending:
+                    if await self._get_result() is None:
+                        pending -= 1
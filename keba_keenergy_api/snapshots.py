@@ -0,0 +1,264 @@
+"""Typed snapshots of all values of a section.
+
+Every field is `None` if the value was not read.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class SystemSnapshot:
+    """Snapshot of all system values."""
+
+    buffer_tank_numbers: int | None = None
+    hot_water_tank_numbers: int | None = None
+    heat_pump_numbers: int | None = None
+    heat_circuit_numbers: int | None = None
+    solar_circuit_numbers: int | None = None
+    external_heat_source_numbers: int | None = None
+    switch_valve_numbers: int | None = None
+    has_photovoltaics: int | str | None = None
+    has_outdoor_temperature: int | str | None = None
+    operating_mode: int | str | None = None
+    outdoor_temperature: float | None = None
+    cpu_usage: float | None = None
+    webview_cpu_usage: float | None = None
+    webserver_cpu_usage: float | None = None
+    control_cpu_usage: float | None = None
+    ram_usage: int | None = None
+    free_ram: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class BufferTankSnapshot:
+    """Snapshot of all buffer tank values."""
+
+    name: str | None = None
+    current_top_temperature: float | None = None
+    current_bottom_temperature: float | None = None
+    operating_mode: int | str | None = None
+    standby_temperature: float | None = None
+    target_temperature: float | None = None
+    excess_energy_target_temperature: float | None = None
+    excess_energy_target_temperature_hysteresis: float | None = None
+    outdoor_temperature_excess_energy_limit: float | None = None
+    use_excess_energy: int | str | None = None
+    excess_energy_mode: int | str | None = None
+    heat_request: int | str | None = None
+    cool_request: int | str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class HotWaterTankSnapshot:
+    """Snapshot of all hot water tank values."""
+
+    name: str | None = None
+    current_temperature: float | None = None
+    operating_mode: int | str | None = None
+    standby_temperature: float | None = None
+    target_temperature: float | None = None
+    excess_energy_target_temperature: float | None = None
+    excess_energy_target_temperature_hysteresis: float | None = None
+    use_excess_energy: int | str | None = None
+    excess_energy_mode: int | str | None = None
+    heat_request: int | str | None = None
+    has_fresh_water_module: int | str | None = None
+    fresh_water_flow: int | str | None = None
+    fresh_water_module_temperature: float | None = None
+    fresh_water_module_pump_speed: float | None = None
+    circulation_return_temperature: float | None = None
+    circulation_pump_state: int | str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class HeatPumpSnapshot:
+    """Snapshot of all heat pump values."""
+
+    name: str | None = None
+    state: int | str | None = None
+    substate: int | str | None = None
+    operating_mode: int | str | None = None
+    compressor_use_night_speed: int | str | None = None
+    compressor_night_speed: float | None = None
+    circulation_pump_speed: float | None = None
+    source_pump_speed: float | None = None
+    flow_temperature: float | None = None
+    return_flow_temperature: float | None = None
+    source_input_temperature: float | None = None
+    source_output_temperature: float | None = None
+    compressor_input_temperature: float | None = None
+    compressor_output_temperature: float | None = None
+    compressor: float | None = None
+    condenser_temperature: float | None = None
+    vaporizer_temperature: float | None = None
+    target_overheating: float | None = None
+    current_overheating: float | None = None
+    expansion_valve_position: int | None = None
+    high_pressure: float | None = None
+    low_pressure: float | None = None
+    heat_request: int | str | None = None
+    consuming_excess_energy: int | str | None = None
+    excess_energy_operating_time: int | None = None
+    excess_energy_max_runtime: int | None = None
+    excess_energy_activation_counter: int | None = None
+    heating_power: float | None = None
+    heating_mass_flow_rate: float | None = None
+    cooling_mass_flow_rate: float | None = None
+    hot_water_power: float | None = None
+    hot_water_mass_flow_rate: float | None = None
+    compressor_power: float | None = None
+    cop: float | None = None
+    heating_energy: float | None = None
+    heating_energy_consumption: float | None = None
+    heating_spf: float | None = None
+    cooling_energy: float | None = None
+    cooling_energy_consumption: float | None = None
+    cooling_spf: float | None = None
+    hot_water_energy: float | None = None
+    hot_water_energy_consumption: float | None = None
+    hot_water_spf: float | None = None
+    total_thermal_energy: float | None = None
+    total_energy_consumption: float | None = None
+    excess_energy_consumption: float | None = None
+    heating_excess_energy_consumption: float | None = None
+    cooling_excess_energy_consumption: float | None = None
+    hot_water_excess_energy_consumption: float | None = None
+    total_spf: float | None = None
+    has_active_cooling: int | str | None = None
+    has_passive_cooling: int | str | None = None
+    operating_time: int | None = None
+    max_runtime: int | None = None
+    activation_counter: int | None = None
+    has_compressor_failure: int | str | None = None
+    has_source_failure: int | str | None = None
+    has_source_actuator_failure: int | str | None = None
+    has_three_phase_failure: int | str | None = None
+    has_source_pressure_failure: int | str | None = None
+    has_vfd_failure: int | str | None = None
+    electric_energy_meter_type: int | None = None
+    heat_meter_type: int | None = None
+    cool_meter_type: int | None = None
+    hot_water_meter_type: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class HeatCircuitSnapshot:
+    """Snapshot of all heat circuit values."""
+
+    name: str | None = None
+    mode: int | str | None = None
+    has_room_temperature: int | str | None = None
+    room_temperature: float | None = None
+    has_room_humidity: int | str | None = None
+    room_humidity: float | None = None
+    dew_point: float | None = None
+    flow_temperature_setpoint: float | None = None
+    has_mixer: int | str | None = None
+    mixer_flow_temperature: float | None = None
+    mixer_return_flow_temperature: float | None = None
+    mixer_position: int | str | None = None
+    pump_state: int | str | None = None
+    has_return_flow_temperature: int | str | None = None
+    return_flow_temperature: float | None = None
+    target_temperature: float | None = None
+    use_excess_energy: int | str | None = None
+    excess_energy_mode: int | str | None = None
+    excess_energy_target_temperature: float | None = None
+    excess_energy_target_temperature_hysteresis: float | None = None
+    excess_energy_target_cooling_temperature: float | None = None
+    excess_energy_target_cooling_temperature_hysteresis: float | None = None
+    selected_target_temperature: float | None = None
+    target_temperature_day: float | None = None
+    target_cooling_temperature_day: float | None = None
+    heating_limit_day: float | None = None
+    cooling_limit_day: float | None = None
+    excess_energy_heating_limit_day: float | None = None
+    excess_energy_cooling_limit_day: float | None = None
+    target_temperature_night: float | None = None
+    target_cooling_temperature_night: float | None = None
+    heating_limit_night: float | None = None
+    cooling_limit_night: float | None = None
+    excess_energy_heating_limit_night: float | None = None
+    excess_energy_cooling_limit_night: float | None = None
+    target_temperature_away: float | None = None
+    target_temperature_offset: float | None = None
+    operating_mode: int | str | None = None
+    heat_request: int | str | None = None
+    cool_request: int | str | None = None
+    away_start_date: int | None = None
+    away_end_date: int | None = None
+    heating_curve_offset: float | None = None
+    cooling_curve_offset: float | None = None
+    heating_curve_slope: float | None = None
+    cooling_curve_slope: float | None = None
+    use_heating_curve: int | str | None = None
+    heating_curve: str | None = None
+    cooling_curve: str | None = None
+    has_pump: int | str | None = None
+    has_var_speed_pump: int | str | None = None
+    pump_speed: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class SolarCircuitSnapshot:
+    """Snapshot of all solar circuit values."""
+
+    name: str | None = None
+    operating_mode: int | str | None = None
+    source_temperature: float | None = None
+    pump_1: float | None = None
+    pump_2: float | None = None
+    current_temperature: tuple[float, ...] | None = None
+    target_temperature: tuple[float, ...] | None = None
+    heat_request: tuple[int | str, ...] | None = None
+    heating_energy: float | None = None
+    daily_energy: float | None = None
+    actual_power: float | None = None
+    priority_1_before_2: int | str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ExternalHeatSourceSnapshot:
+    """Snapshot of all external heat source values."""
+
+    operating_mode: int | str | None = None
+    target_temperature: float | None = None
+    heat_request: int | str | None = None
+    operating_time: int | None = None
+    max_runtime: int | None = None
+    activation_counter: int | None = None
+    consuming_excess_energy: int | str | None = None
+    excess_energy_operating_time: int | None = None
+    excess_energy_max_runtime: int | None = None
+    excess_energy_activation_counter: int | None = None
+    use_excess_energy: int | str | None = None
+    min_runtime_excess_energy: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class SwitchValveSnapshot:
+    """Snapshot of all switch valve values."""
+
+    position: int | str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class PassiveCoolingSnapshot:
+    """Snapshot of all passive cooling values."""
+
+    temperature: float | None = None
+    switch_valve_position: int | str | None = None
+    circulation_pump_speed: float | None = None
+    mixer_target_temperature: float | None = None
+    mixer_flow_temperature: float | None = None
+    mixer_position: int | str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class PhotovoltaicsSnapshot:
+    """Snapshot of all photovoltaics values."""
+
+    excess_energy_active: int | str | None = None
+    excess_power: float | None = None
+    daily_energy: float | None = None
+    total_energy: float | None = None
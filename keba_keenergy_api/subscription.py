@@ -0,0 +1,127 @@
+"""Detect value changes between polls."""
+
+from collections.abc import Sequence
+from datetime import datetime
+from datetime import timezone
+from typing import Any
+from typing import NamedTuple
+
+from keba_keenergy_api.constants import SECTION_METADATA
+from keba_keenergy_api.constants import Section
+from keba_keenergy_api.constants import SectionMetadata
+from keba_keenergy_api.error import APIError
+
+
+class Variable(NamedTuple):
+    """A polled variable in the order of the read payload."""
+
+    section: Section
+    position: int | None
+    sub_index: int = 0
+
+
+class ValueChange(NamedTuple):
+    """A changed value.
+
+    The position is `None` for sections without devices e.g. `System`. The sub-index is only used for sections with
+    more than one value per device.
+
+    """
+
+    section: Section
+    position: int | None
+    sub_index: int
+    value: float | int | str
+    timestamp: datetime
+
+
+class ChangeTracker:
+    """Compare the raw values of every poll with the previous poll and convert only the changed values.
+
+    Examples
+    --------
+    >>> tracker = ChangeTracker([Variable(section=HeatPump.STATE, position=1)])
+    >>> tracker.update([{"name": "APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState", "value": "3"}])
+    [ValueChange(section=<HeatPump.STATE: ...>, position=1, sub_index=0, value='defrost', timestamp=...)]
+
+    """
+
+    def __init__(self, variables: Sequence[Variable], *, human_readable: bool = True) -> None:
+        self.variables: tuple[Variable, ...] = tuple(variables)
+        self.human_readable: bool = human_readable
+        self._raw_values: list[Any] = [None] * len(self.variables)
+        self._values: list[float | int | str | None] = [None] * len(self.variables)
+
+    def set_variables(self, variables: Sequence[Variable], /) -> None:
+        """Replace the variables and keep the values of the known variables.
+
+        Parameters
+        ----------
+        variables
+            The variables in the order of the read payload
+
+        """
+        known: dict[Variable, int] = {variable: idx for idx, variable in enumerate(self.variables)}
+        indexes: list[int | None] = [known.get(variable) for variable in variables]
+
+        self.variables = tuple(variables)
+        self._raw_values = [None if idx is None else self._raw_values[idx] for idx in indexes]
+        self._values = [None if idx is None else self._values[idx] for idx in indexes]
+
+    def _convert(self, variable: Variable, raw_value: Any) -> float | int | str:  # noqa: ANN401
+        metadata: SectionMetadata = SECTION_METADATA[variable.section]
+
+        try:
+            value: float | int | str = metadata.convert(raw_value)
+
+            if self.human_readable and metadata.get_name is not None:
+                value = metadata.get_name(value)
+        except ValueError as error:
+            message: str = f"Can't convert value {raw_value!r} of {variable.section}!"
+            raise APIError(message) from error
+
+        return value
+
+    def update(
+        self,
+        response: Sequence[dict[str, Any]],
+        timestamp: datetime | None = None,
+        *,
+        indexes: Sequence[int] | None = None,
+    ) -> list[ValueChange]:
+        """Update the values with a response and get the changed values.
+
+        Parameters
+        ----------
+        response
+            The response items in the order of the variables
+        timestamp
+            The time of the poll, the current time by default
+        indexes
+            The indexes of the polled variables if only a part of the variables was polled
+
+        Returns
+        -------
+        list
+            The changed values, every value is changed on the first update
+
+        """
+        _timestamp: datetime = timestamp or datetime.now(tz=timezone.utc)
+        changes: list[ValueChange] = []
+
+        for idx, item in zip(range(len(self.variables)) if indexes is None else indexes, response, strict=True):
+            variable: Variable = self.variables[idx]
+            raw_value: Any = item["value"]
+
+            # Compare the raw value first, only changed values are converted
+            if raw_value == self._raw_values[idx]:
+                continue
+
+            self._raw_values[idx] = raw_value
+            value: float | int | str = self._convert(variable, raw_value)
+
+            if value != self._values[idx]:
+                self._values[idx] = value
+                changes.append(ValueChange(variable.section, variable.position, variable.sub_index, value, _timestamp))
+
+        return changes
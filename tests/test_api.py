@@ -1,5 +1,7 @@
+import asyncio
 from typing import Any
 from typing import TYPE_CHECKING
+from typing import cast
 
 import pytest
 from aiohttp import BasicAuth
@@ -19,8 +21,17 @@ from keba_keenergy_api.constants import Section
 from keba_keenergy_api.constants import SolarCircuit
 from keba_keenergy_api.constants import SwitchValve
 from keba_keenergy_api.constants import System
+from keba_keenergy_api.endpoints import Connection
+from keba_keenergy_api.endpoints import Position
+from keba_keenergy_api.endpoints import ReadPlan
+from keba_keenergy_api.endpoints import ReadPlanEntry
+from keba_keenergy_api.endpoints import SystemEndpoints
+from keba_keenergy_api.endpoints import Value
+from keba_keenergy_api.endpoints import ValueResponse
 from keba_keenergy_api.error import APIError
 from keba_keenergy_api.error import AuthenticationError
+from tests.test_api_data import get_heat_pump_flow_temperature_payload
+from tests.test_api_data import get_positions_payload
 from tests.test_api_data import read_data_expected_data_1
 from tests.test_api_data import read_data_expected_data_2
 from tests.test_api_data import read_data_expected_data_3
@@ -65,19 +76,19 @@ class TestKebaKeEnergyAPI:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            response: float = await client.system.get_outdoor_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                response: float = await client.system.get_outdoor_temperature()
 
-            assert isinstance(response, float)
-            assert response == 10.81  # noqa: PLR2004
+                assert isinstance(response, float)
+                assert response == 10.81  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_api_with_session(self) -> None:
@@ -119,6 +130,331 @@ class TestKebaKeEnergyAPI:
                 ssl=False,
             )
 
+    @pytest.mark.asyncio
+    async def test_api_with_context_manager(self) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue",
+                        "attributes": {},
+                        "value": "10.808357",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+                repeat=3,
+            )
+
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                assert client.connection.session is None
+
+                await client.system.get_outdoor_temperature()
+                session: ClientSession | None = client.connection.session
+
+                assert session is not None
+                assert not session.closed
+
+                await client.system.get_outdoor_temperature()
+                await client.read_data(request=System.OUTDOOR_TEMPERATURE, position=1)
+
+                assert client.connection.session is session
+
+            assert session.closed
+            assert client.connection.session is None
+
+    @pytest.mark.asyncio
+    async def test_api_close_with_session(self) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue",
+                        "attributes": {},
+                        "value": "10.808357",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+                repeat=2,
+            )
+
+            session: ClientSession = ClientSession()
+            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host", session=session)
+
+            await client.system.get_outdoor_temperature()
+            await client.close()
+
+            assert client.connection.session is session
+            assert not session.closed
+
+            await session.close()
+            data: float = await client.system.get_outdoor_temperature()
+
+            assert data == 10.81  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("coalesce_window", [0, 0.01])
+    async def test_api_with_coalescing(self, coalesce_window: float) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue",
+                        "attributes": {},
+                        "value": "10.808357",
+                    },
+                    {
+                        "name": "APPL.CtrlAppl.sParam.heatpump[0].TempHeatFlow.values.actValue",
+                        "attributes": {},
+                        "value": "30.9",
+                    },
+                    {
+                        "name": "APPL.CtrlAppl.sParam.hotWaterTank[0].topTemp.values.actValue",
+                        "attributes": {},
+                        "value": "47.5",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            async with KebaKeEnergyAPI(host="mocked-host", coalesce_window=coalesce_window) as client:
+                data: tuple[float, float, float] = await asyncio.gather(
+                    client.system.get_outdoor_temperature(),
+                    client.heat_pump.get_flow_temperature(),
+                    client.hot_water_tank.get_current_temperature(),
+                )
+
+            assert list(data) == [10.81, 30.9, 47.5]
+
+            mock_keenergy_api.assert_called_once_with(
+                url="http://mocked-host/var/readWriteVars",
+                data=(
+                    '[{"name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "attr": "1"}, '
+                    '{"name": "APPL.CtrlAppl.sParam.heatpump[0].TempHeatFlow.values.actValue", "attr": "1"}, '
+                    '{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].topTemp.values.actValue", "attr": "1"}]'
+                ),
+                method="POST",
+                auth=None,
+                ssl=False,
+            )
+
+    @pytest.mark.asyncio
+    async def test_api_with_coalescing_error(self) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload={"developerMessage": "mocked-error"},
+                headers={"Content-Type": "application/json;charset=utf-8"},
+                status=500,
+            )
+
+            async with KebaKeEnergyAPI(host="mocked-host", coalesce_window=0) as client:
+                data: tuple[float | BaseException, float | BaseException] = await asyncio.gather(
+                    client.system.get_outdoor_temperature(),
+                    client.heat_pump.get_flow_temperature(),
+                    return_exceptions=True,
+                )
+
+            assert all(isinstance(item, APIError) for item in data)
+            mock_keenergy_api.assert_called_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("single_flight", "expected_requests"), [(True, 1), (False, 2)])
+    async def test_api_with_single_flight(self, *, single_flight: bool, expected_requests: int) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue",
+                        "attributes": {},
+                        "value": "10.808357",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+                repeat=True,
+            )
+
+            async with KebaKeEnergyAPI(host="mocked-host", single_flight=single_flight) as client:
+                data: tuple[float, float] = await asyncio.gather(
+                    client.system.get_outdoor_temperature(),
+                    client.system.get_outdoor_temperature(),
+                )
+
+            assert list(data) == [10.81, 10.81]
+            assert mock_keenergy_api.requests is not None
+            assert sum(len(calls) for calls in mock_keenergy_api.requests.values()) == expected_requests
+
+    @pytest.mark.asyncio
+    async def test_api_without_connection(self) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue",
+                        "attributes": {},
+                        "value": "10.808357",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            endpoints: SystemEndpoints = SystemEndpoints(
+                base_url="http://mocked-host",
+                ssl=False,
+                skip_ssl_verification=False,
+            )
+            data: float = await endpoints.get_outdoor_temperature()
+
+            assert data == 10.81  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_api_with_read_plans(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(Connection, "MAX_READ_PLANS", 1)
+
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue",
+                        "attributes": {},
+                        "value": "10.808357",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+                repeat=3,
+            )
+
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                assert await client.system.get_outdoor_temperature() == 10.81  # noqa: PLR2004
+                plans: list[ReadPlan] = list(client.connection.read_plans.values())
+
+                assert await client.system.get_outdoor_temperature() == 10.81  # noqa: PLR2004
+                assert list(client.connection.read_plans.values()) == plans
+                assert plans[0].data == '[{"name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "attr": "1"}]'
+                assert plans[0].entries == (
+                    ReadPlanEntry(key="system_outdoor_temperature", section=System.OUTDOOR_TEMPERATURE),
+                )
+
+                await client.read_data(request=System.OUTDOOR_TEMPERATURE, position=1, extra_attributes=False)
+                assert len(client.connection.read_plans) == 1
+                assert list(client.connection.read_plans.values()) != plans
+
+    def test_get_response_data_keeps_response(self) -> None:
+        client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+        plan: ReadPlan = client._get_read_plan(  # noqa: SLF001
+            request=[System.OUTDOOR_TEMPERATURE, HeatPump.FLOW_TEMPERATURE],
+            position=[1, 2],
+            allowed_type=None,
+        )
+        response: list[dict[str, Any]] = [
+            {"name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "value": "10.808357"},
+            {"name": "APPL.CtrlAppl.sParam.heatpump[0].TempHeatFlow.values.actValue", "value": "24.6"},
+            {"name": "APPL.CtrlAppl.sParam.heatpump[1].TempHeatFlow.values.actValue", "value": "25.1"},
+        ]
+
+        data: dict[str, Any] = client._get_response_data(response, plan)  # noqa: SLF001
+
+        assert data == {
+            "system_outdoor_temperature": [{"value": 10.81, "attributes": {}}],
+            "heat_pump_flow_temperature": [{"value": 24.6, "attributes": {}}, {"value": 25.1, "attributes": {}}],
+        }
+        assert len(response) == 3  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_api_with_shared_attributes(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(Connection, "MAX_SHARED_ATTRIBUTES", 1)
+
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": f"APPL.CtrlAppl.sParam.heatpump[{idx}].TempHeatFlow.values.actValue",
+                        "attributes": attributes,
+                        "value": "24.6",
+                    }
+                    for idx, attributes in enumerate(
+                        [
+                            {"formatId": "fmtTemp", "upperLimit": "90"},
+                            {"formatId": "fmtTemp", "upperLimit": "90"},
+                            {"formatId": "fmtTemp", "upperLimit": "80"},
+                            {"formatId": "fmtTemp", "lowerLimit": ["0"]},
+                        ],
+                    )
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            async with KebaKeEnergyAPI(host="mocked-host", share_attributes=True) as client:
+                data: dict[str, ValueResponse] = await client.read_data(
+                    request=HeatPump.FLOW_TEMPERATURE,
+                    position=[1, 2, 3, 4],
+                )
+
+                values: list[Value] = cast("list[Value]", data["heat_pump"]["flow_temperature"])
+
+                assert [value["attributes"] for value in values] == [
+                    {"upper_limit": "90"},
+                    {"upper_limit": "90"},
+                    {"upper_limit": "80"},
+                    {"lower_limit": ["0"]},
+                ]
+                assert values[0]["attributes"] is values[1]["attributes"]
+                assert client.connection.attributes == {
+                    (("formatId", "fmtTemp"), ("upperLimit", "90")): values[0]["attributes"]
+                }
+
+    @pytest.mark.asyncio
+    async def test_api_with_cached_attributes(self) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState",
+                        "attributes": {"formatId": "fmtHPState", "lowerLimit": "0", "upperLimit": "32767"},
+                        "value": "3",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[{"name": "APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState", "value": "1"}],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            async with KebaKeEnergyAPI(host="mocked-host", cache_attributes=True) as client:
+                first: dict[str, ValueResponse] = await client.read_data(request=HeatPump.STATE, position=1)
+                second: dict[str, ValueResponse] = await client.read_data(request=HeatPump.STATE, position=1)
+
+                assert first["heat_pump"]["state"] == [
+                    {"value": "defrost", "attributes": {"lower_limit": "0", "upper_limit": "32767", "raw_value": 3}},
+                ]
+                assert second["heat_pump"]["state"] == [
+                    {"value": "flow", "attributes": {"lower_limit": "0", "upper_limit": "32767", "raw_value": 1}},
+                ]
+                assert client.connection.variable_attributes == {
+                    "APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState": {
+                        "lower_limit": "0",
+                        "upper_limit": "32767",
+                    },
+                }
+
+                mock_keenergy_api.assert_called_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState", "attr": "0"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
+
     @pytest.mark.asyncio
     async def test_api_with_basic_auth(self) -> None:
         with aioresponses() as mock_keenergy_api:
@@ -140,23 +476,23 @@ class TestKebaKeEnergyAPI:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(
+            async with KebaKeEnergyAPI(
                 host="mocked-host",
                 username="test",
                 password="test",  # noqa: S106
-            )
-            response: float = await client.system.get_outdoor_temperature()
+            ) as client:
+                response: float = await client.system.get_outdoor_temperature()
 
-            assert isinstance(response, float)
-            assert response == 10.81  # noqa: PLR2004
+                assert isinstance(response, float)
+                assert response == 10.81  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "attr": "1"}]',
-                method="POST",
-                auth=BasicAuth(login="test", password="test", encoding="utf-8"),  # noqa: S106
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "attr": "1"}]',
+                    method="POST",
+                    auth=BasicAuth(login="test", password="test", encoding="utf-8"),  # noqa: S106
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -272,31 +608,140 @@ class TestKebaKeEnergyAPI:
                     headers={"Content-Type": "application/json;charset=utf-8"},
                 )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            response: dict[str, ValueResponse] = await client.read_data(
-                request=section,
-                position=position,
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                response: dict[str, ValueResponse] = await client.read_data(
+                    request=section,
+                    position=position,
+                )
+
+                assert isinstance(response, dict)
+                assert response == expected_response
+
+                mock_keenergy_api.assert_any_call(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=expected_data,
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
+
+                if expected_extra_attributes:
+                    mock_keenergy_api.assert_any_call(
+                        url="http://mocked-host/var/readWriteVars",
+                        data=expected_extra_attributes,
+                        method="POST",
+                        auth=None,
+                        ssl=False,
+                    )
+
+    @pytest.mark.asyncio
+    async def test_read_data_with_cached_positions(self) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=get_positions_payload(),
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=get_heat_pump_flow_temperature_payload(),
+                headers={"Content-Type": "application/json;charset=utf-8"},
+                repeat=2,
+            )
+
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                first: dict[str, ValueResponse] = await client.read_data(request=HeatPump.FLOW_TEMPERATURE)
+                second: dict[str, ValueResponse] = await client.read_data(request=HeatPump.FLOW_TEMPERATURE)
+
+            assert first == second
+            assert first["heat_pump"] == {"flow_temperature": [{"value": 30.5, "attributes": {}}]}
+
+            assert mock_keenergy_api.requests is not None
+            assert sum(len(calls) for calls in mock_keenergy_api.requests.values()) == 3  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("heat_pumps", "expected_requests"), [(1, 2), (2, 3)])
+    async def test_read_data_revalidate_positions(self, heat_pumps: int, expected_requests: int) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=get_positions_payload(),
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=get_heat_pump_flow_temperature_payload() + get_positions_payload(heat_pumps),
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=get_heat_pump_flow_temperature_payload(heat_pumps) + get_positions_payload(heat_pumps)[:1],
+                headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            assert isinstance(response, dict)
-            assert response == expected_response
+            async with KebaKeEnergyAPI(host="mocked-host", positions_ttl=0) as client:
+                await client.get_positions()
+
+                data: dict[str, ValueResponse] = await client.read_data(
+                    request=[HeatPump.FLOW_TEMPERATURE, System.HEAT_PUMP_NUMBERS],
+                    extra_attributes=False,
+                )
+
+            assert data["system"] == {"heat_pump_numbers": {"value": heat_pumps, "attributes": {}}}
+            assert data["heat_pump"] == {
+                "flow_temperature": [{"value": 30.5 + idx, "attributes": {}} for idx in range(heat_pumps)],
+            }
+
+            assert mock_keenergy_api.requests is not None
+            assert sum(len(calls) for calls in mock_keenergy_api.requests.values()) == expected_requests
 
             mock_keenergy_api.assert_any_call(
                 url="http://mocked-host/var/readWriteVars",
-                data=expected_data,
+                data=(
+                    '[{"name": "APPL.CtrlAppl.sParam.heatpump[0].TempHeatFlow.values.actValue", "attr": "0"}, '
+                    '{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHeatPumps", "attr": "0"}, '
+                    '{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHeatingCircuits", "attr": "0"}, '
+                    '{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfSolarCircuits", "attr": "0"}, '
+                    '{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfBuffers", "attr": "0"}, '
+                    '{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHotWaterTanks", "attr": "0"}, '
+                    '{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfExtHeatSources", "attr": "0"}, '
+                    '{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfSwitchValves", "attr": "0"}]'
+                ),
                 method="POST",
                 auth=None,
                 ssl=False,
             )
 
-            if expected_extra_attributes:
-                mock_keenergy_api.assert_any_call(
-                    url="http://mocked-host/var/readWriteVars",
-                    data=expected_extra_attributes,
-                    method="POST",
-                    auth=None,
-                    ssl=False,
+    @pytest.mark.asyncio
+    async def test_get_positions(self) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=get_positions_payload(),
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=get_positions_payload(heat_pumps=2),
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            async with KebaKeEnergyAPI(host="mocked-host", positions_ttl=None) as client:
+                assert await client.get_positions() == Position(
+                    heat_pump=1,
+                    heat_circuit=1,
+                    solar_circuit=0,
+                    buffer_tank=0,
+                    hot_water_tank=1,
+                    external_heat_source=0,
+                    switch_valve=0,
                 )
+                assert (await client.get_positions()).heat_pump == 1
+                assert (await client.get_positions(refresh=True)).heat_pump == 2  # noqa: PLR2004
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -360,16 +805,16 @@ class TestKebaKeEnergyAPI:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            await client.write_data(request=section)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                await client.write_data(request=section)
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars?action=set",
-                data=expected_data,
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars?action=set",
+                    data=expected_data,
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -490,12 +935,12 @@ class TestKebaKeEnergyAPI:
                 repeat=repeat,
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: list[Section] = await client.filter_request(
-                request=section,
-                position=position,
-            )
-            assert data == expected
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: list[Section] = await client.filter_request(
+                    request=section,
+                    position=position,
+                )
+                assert data == expected
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -615,9 +1060,36 @@ class TestKebaKeEnergyAPI:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: list[Section] = await client.filter_request(request=section)
-            assert data == expected
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: list[Section] = await client.filter_request(request=section)
+                assert data == expected
+
+    @pytest.mark.asyncio
+    async def test_filter_request_with_capabilities(self) -> None:
+        with aioresponses() as mock_keenergy_api:
+            for ret in ("ERROR", "OK", "ERROR", "OK"):
+                mock_keenergy_api.post(
+                    "http://mocked-host/var/readVarChildren",
+                    payload={"ret": ret},
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                request: list[Section] = [SolarCircuit.HEAT_REQUEST, BufferTank.NAME, SolarCircuit.HEAT_REQUEST]
+
+                data: list[Section] = await client.filter_request(request=request, position=1, limit=1)
+                assert data == [SolarCircuit.HEAT_REQUEST]
+                assert client.capabilities == {SolarCircuit.HEAT_REQUEST: True, BufferTank.NAME: False}
+
+                data = await client.filter_request(request=request)
+                assert data == [SolarCircuit.HEAT_REQUEST]
+
+                data = await client.filter_request(request=BufferTank.NAME, position=1, refresh=True)
+                assert data == [BufferTank.NAME]
+                assert client.capabilities == {SolarCircuit.HEAT_REQUEST: True, BufferTank.NAME: True}
+
+                assert mock_keenergy_api.requests is not None
+                assert sum(len(calls) for calls in mock_keenergy_api.requests.values()) == 4  # noqa: PLR2004
 
     @pytest.mark.asyncio
     async def test_invalid_credentials(self) -> None:
@@ -628,16 +1100,15 @@ class TestKebaKeEnergyAPI:
                 headers={"Content-Type": "text/html"},
                 status=401,
             )
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(
+            async with KebaKeEnergyAPI(
                 host="mocked-host",
                 username="test",
                 password="invalid",  # noqa: S106
-            )
-
-            with pytest.raises(
-                AuthenticationError, match="401 Unauthorized: No permission -- see authorization schemes"
-            ):
-                await client.system.get_outdoor_temperature()
+            ) as client:
+                with pytest.raises(
+                    AuthenticationError, match="401 Unauthorized: No permission -- see authorization schemes"
+                ):
+                    await client.system.get_outdoor_temperature()
 
     @pytest.mark.asyncio
     async def test_api_status_4xx(self) -> None:
@@ -648,16 +1119,15 @@ class TestKebaKeEnergyAPI:
                 headers={"Content-Type": "text/html"},
                 status=405,
             )
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(
+            async with KebaKeEnergyAPI(
                 host="mocked-host",
                 username="test",
                 password="test",  # noqa: S106
-            )
-
-            with pytest.raises(
-                APIError, match=r"405 Method Not Allowed: Specified method is invalid for this resource - \{}"
-            ):
-                await client.system.get_outdoor_temperature()
+            ) as client:
+                with pytest.raises(
+                    APIError, match=r"405 Method Not Allowed: Specified method is invalid for this resource - \{}"
+                ):
+                    await client.system.get_outdoor_temperature()
 
     @pytest.mark.asyncio
     async def test_api_client_error(self) -> None:
@@ -666,10 +1136,9 @@ class TestKebaKeEnergyAPI:
                 "http://mocked-host/var/readWriteVars",
                 exception=ServerTimeoutError("Server took too long to respond"),
             )
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-
-            with pytest.raises(APIError, match="Server took too long to respond"):
-                await client.system.get_outdoor_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                with pytest.raises(APIError, match="Server took too long to respond"):
+                    await client.system.get_outdoor_temperature()
 
     @pytest.mark.asyncio
     async def test_api_error(self) -> None:
@@ -680,9 +1149,8 @@ class TestKebaKeEnergyAPI:
                 headers={"Content-Type": "application/json;charset=utf-8"},
                 status=500,
             )
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-
-            with pytest.raises(
-                APIError, match="500 Internal Server Error: Server got itself in trouble - mocked-error"
-            ):
-                await client.system.get_outdoor_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                with pytest.raises(
+                    APIError, match="500 Internal Server Error: Server got itself in trouble - mocked-error"
+                ):
+                    await client.system.get_outdoor_temperature()
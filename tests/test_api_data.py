@@ -900,3 +900,28 @@ read_data_expected_response_4: dict[str, Any] = {
     "passive_cooling": {},
     "photovoltaics": {},
 }
+
+
+def get_positions_payload(heat_pumps: int = 1) -> list[dict[str, Any]]:
+    """Get the response payload for the number of installed devices."""
+    return [
+        {"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHeatPumps", "attributes": {}, "value": str(heat_pumps)},
+        {"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHeatingCircuits", "attributes": {}, "value": "1"},
+        {"name": "APPL.CtrlAppl.sParam.options.systemNumberOfSolarCircuits", "attributes": {}, "value": "0"},
+        {"name": "APPL.CtrlAppl.sParam.options.systemNumberOfBuffers", "attributes": {}, "value": "0"},
+        {"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHotWaterTanks", "attributes": {}, "value": "1"},
+        {"name": "APPL.CtrlAppl.sParam.options.systemNumberOfExtHeatSources", "attributes": {}, "value": "0"},
+        {"name": "APPL.CtrlAppl.sParam.options.systemNumberOfSwitchValves", "attributes": {}, "value": "0"},
+    ]
+
+
+def get_heat_pump_flow_temperature_payload(heat_pumps: int = 1) -> list[dict[str, Any]]:
+    """Get the response payload for the flow temperature of all heat pumps."""
+    return [
+        {
+            "name": f"APPL.CtrlAppl.sParam.heatpump[{idx}].TempHeatFlow.values.actValue",
+            "attributes": {},
+            "value": f"3{idx}.5",
+        }
+        for idx in range(heat_pumps)
+    ]
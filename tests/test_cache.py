@@ -0,0 +1,222 @@
+import asyncio
+import json
+from typing import Any
+
+import pytest
+from aioresponses import CallbackResult
+from aioresponses import aioresponses
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.cache import ReadCache
+from keba_keenergy_api.cache import get_section_member
+from keba_keenergy_api.constants import HeatPump
+from keba_keenergy_api.constants import Section
+from keba_keenergy_api.constants import System
+
+
+class TestReadCache:
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState", HeatPump.STATE),
+            ("APPL.CtrlAppl.sParam.heatpump[12].values.heatpumpState", HeatPump.STATE),
+            ("APPL.CtrlAppl.sProcData.processStatus[1].cpuTimePercent", System.WEBSERVER_CPU_USAGE),
+            ("APPL.CtrlAppl.sParam.linTabPool[0].name", None),
+        ],
+    )
+    def test_get_section_member(self, name: str, expected: HeatPump | System | None) -> None:
+        assert get_section_member(name) == expected
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("APPL.CtrlAppl.sParam.options.systemNumberOfHeatPumps", 3600),
+            ("APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", 10),
+            ("APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState", 5),
+            ("APPL.CtrlAppl.sParam.linTabPool[0].name", 5),
+        ],
+    )
+    def test_get_ttl(self, name: str, expected: float) -> None:
+        cache: ReadCache = ReadCache(ttl=5, policies={System: 10, System.HEAT_PUMP_NUMBERS: 3600})
+
+        assert cache.get_ttl(name) == expected
+        assert cache.get_ttl(name) == expected
+
+    def test_get_and_set(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        now: float = 100
+        monkeypatch.setattr("keba_keenergy_api.cache.monotonic", lambda: now)
+
+        cache: ReadCache = ReadCache(ttl=5, policies={HeatPump: 0})
+        cache.set("APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "0", {"value": "1"})
+        cache.set("APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState", "1", {"value": "2"})
+        cache.set("APPL.CtrlAppl.sParam.param.operatingMode", "1", {"name": "mode", "value": "3", "attributes": {}})
+
+        assert cache.get("APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "0") == {"value": "1"}
+        assert cache.get("APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "1") is None
+        assert cache.get("APPL.CtrlAppl.sParam.param.operatingMode", "0") == {"name": "mode", "value": "3"}
+        assert cache.get("APPL.CtrlAppl.sParam.param.operatingMode", "1") == {
+            "name": "mode",
+            "value": "3",
+            "attributes": {},
+        }
+        assert cache.get("APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState") is None
+
+        now = 105
+        assert cache.get("APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "0") is None
+
+    def test_invalidate(self) -> None:
+        cache: ReadCache = ReadCache(ttl=5)
+        cache.set("APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "1", {"value": "1"})
+        cache.set("APPL.CtrlAppl.sParam.param.operatingMode", "1", {"value": "2"})
+
+        cache.invalidate(["APPL.CtrlAppl.sParam.param.operatingMode", "APPL.CtrlAppl.sParam.unknown"])
+        assert cache.get("APPL.CtrlAppl.sParam.outdoorTemp.values.actValue") == {"value": "1"}
+        assert cache.get("APPL.CtrlAppl.sParam.param.operatingMode") is None
+
+        cache.invalidate()
+        assert cache.get("APPL.CtrlAppl.sParam.outdoorTemp.values.actValue") is None
+
+    def test_set_with_generation(self) -> None:
+        cache: ReadCache = ReadCache(ttl=5)
+        generation: int = cache.get_generation("APPL.CtrlAppl.sParam.param.operatingMode")
+
+        cache.invalidate(["APPL.CtrlAppl.sParam.param.operatingMode"])
+        cache.set("APPL.CtrlAppl.sParam.param.operatingMode", "1", {"value": "1"}, generation=generation)
+        assert cache.get("APPL.CtrlAppl.sParam.param.operatingMode") is None
+
+        generation = cache.get_generation("APPL.CtrlAppl.sParam.param.operatingMode")
+        cache.set("APPL.CtrlAppl.sParam.param.operatingMode", "1", {"value": "2"}, generation=generation)
+        assert cache.get("APPL.CtrlAppl.sParam.param.operatingMode") == {"value": "2"}
+
+        generation = cache.get_generation("APPL.CtrlAppl.sParam.outdoorTemp.values.actValue")
+        cache.invalidate()
+        cache.set("APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "1", {"value": "1"}, generation=generation)
+        assert cache.get("APPL.CtrlAppl.sParam.outdoorTemp.values.actValue") is None
+
+    @pytest.mark.asyncio
+    async def test_read_data_with_overlapping_write(self) -> None:
+        reading: asyncio.Event = asyncio.Event()
+        written: asyncio.Event = asyncio.Event()
+
+        async def read_old_value(*_: Any, **__: Any) -> CallbackResult:  # noqa: ANN401
+            reading.set()
+            await written.wait()
+            return CallbackResult(
+                body=json.dumps([{"name": "APPL.CtrlAppl.sParam.param.operatingMode", "attributes": {}, "value": "1"}]),
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post("http://mocked-host/var/readWriteVars", callback=read_old_value)
+
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars?action=set",
+                payload=[{}],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[{"name": "APPL.CtrlAppl.sParam.param.operatingMode", "attributes": {}, "value": "2"}],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            cache: ReadCache = ReadCache(policies={System.OPERATING_MODE: 3600})
+
+            async with KebaKeEnergyAPI(host="mocked-host", cache=cache) as client:
+                # The read starts before the write and its response arrives after the write
+                read: asyncio.Task[int | str] = asyncio.create_task(
+                    client.system.get_operating_mode(human_readable=False),
+                )
+                await reading.wait()
+                await client.system.set_operating_mode(2)
+                written.set()
+
+                assert await read == 1
+                assert cache.get("APPL.CtrlAppl.sParam.param.operatingMode") is None
+                assert await client.system.get_operating_mode(human_readable=False) == 2  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_read_data_with_cache(self) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.options.systemNumberOfHeatPumps",
+                        "attributes": {},
+                        "value": "1",
+                    },
+                    {
+                        "name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue",
+                        "attributes": {},
+                        "value": "10.808357",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue",
+                        "attributes": {},
+                        "value": "11.1",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars?action=set",
+                payload=[{}],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {
+                        "name": "APPL.CtrlAppl.sParam.param.operatingMode",
+                        "attributes": {},
+                        "value": "2",
+                    },
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            cache: ReadCache = ReadCache(policies={System.HEAT_PUMP_NUMBERS: 3600, System.OPERATING_MODE: 3600})
+
+            async with KebaKeEnergyAPI(host="mocked-host", cache=cache) as client:
+                request: list[Section] = [System.HEAT_PUMP_NUMBERS, System.OUTDOOR_TEMPERATURE]
+
+                first = await client.read_data(request=request, position=1)
+                second = await client.read_data(request=request, position=1)
+
+                assert first["system"]["heat_pump_numbers"] == {"value": 1, "attributes": {}}
+                assert first["system"]["outdoor_temperature"] == {"value": 10.81, "attributes": {}}
+                assert second["system"]["heat_pump_numbers"] == {"value": 1, "attributes": {}}
+                assert second["system"]["outdoor_temperature"] == {"value": 11.1, "attributes": {}}
+
+                mock_keenergy_api.assert_called_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.outdoorTemp.values.actValue", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
+
+                cache.set("APPL.CtrlAppl.sParam.param.operatingMode", "1", {"value": "1", "attributes": {}})
+                await client.system.set_operating_mode(2)
+
+                assert await client.system.get_operating_mode(human_readable=False) == 2  # noqa: PLR2004
+                assert await client.system.get_operating_mode() == "auto_heat"
+
+                mock_keenergy_api.assert_called_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.param.operatingMode", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
@@ -0,0 +1,104 @@
+import json
+from pathlib import Path
+
+import pytest
+from aioresponses import aioresponses
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.capabilities import CapabilityStore
+from keba_keenergy_api.constants import BufferTank
+from keba_keenergy_api.constants import HeatPump
+from keba_keenergy_api.constants import Section
+from keba_keenergy_api.endpoints import Position
+from tests.test_api_data import get_positions_payload
+
+
+class TestCapabilityStore:
+    def test_get_key(self) -> None:
+        position: Position = Position(
+            heat_pump=1,
+            heat_circuit=1,
+            solar_circuit=0,
+            buffer_tank=1,
+            hot_water_tank=1,
+            external_heat_source=0,
+            switch_valve=0,
+        )
+
+        key: str = CapabilityStore.get_key({"name": "KeEnergy.WebHmi_2.2.0.0"}, {"version": "2.2.2"}, position)
+
+        assert key == CapabilityStore.get_key({"name": "KeEnergy.WebHmi_2.2.0.0"}, {"version": "2.2.2"}, position)
+        assert key != CapabilityStore.get_key({"name": "KeEnergy.WebHmi_2.3.0.0"}, {"version": "2.2.2"}, position)
+
+    def test_save_and_load(self, tmp_path: Path) -> None:
+        store: CapabilityStore = CapabilityStore(tmp_path / "keenergy" / "capabilities.json")
+        store.save("key", {HeatPump.STATE: True, BufferTank.NAME: False})
+
+        assert json.loads(store.path.read_text(encoding="utf-8")) == {
+            "key": "key",
+            "capabilities": {"BufferTank.NAME": False, "HeatPump.STATE": True},
+        }
+        assert store.load("key") == {HeatPump.STATE: True, BufferTank.NAME: False}
+        assert store.load("other-key") == {}
+
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            (None, {}),
+            ("{", {}),
+            ("[]", {}),
+            ('{"key": "key"}', {}),
+            ('{"key": "key", "capabilities": []}', {}),
+            ('{"key": "key", "capabilities": {"HeatPump.STATE": "yes"}}', {}),
+            (
+                '{"key": "key", "capabilities": {"HeatPump.UNKNOWN": true, "HeatPump.STATE": true}}',
+                {HeatPump.STATE: True},
+            ),
+        ],
+    )
+    def test_load_invalid_file(self, tmp_path: Path, content: str | None, expected: dict[Section, bool]) -> None:
+        store: CapabilityStore = CapabilityStore(tmp_path / "capabilities.json")
+
+        if content is not None:
+            store.path.write_text(content, encoding="utf-8")
+
+        assert store.load("key") == expected
+
+    @pytest.mark.asyncio
+    async def test_filter_request_with_capability_store(self, tmp_path: Path) -> None:
+        store: CapabilityStore = CapabilityStore(tmp_path / "capabilities.json")
+        request: list[Section] = [HeatPump.STATE, BufferTank.NAME]
+
+        for expected_requests in (5, 3):
+            with aioresponses() as mock_keenergy_api:
+                mock_keenergy_api.post(
+                    "http://mocked-host/swupdate?action=getHmiInstalled",
+                    payload=[{"ret": "OK", "name": "KeEnergy.WebHmi_2.2.0.0"}],
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+                mock_keenergy_api.post(
+                    "http://mocked-host/swupdate?action=getSystemInstalled",
+                    payload=[{"ret": "OK", "name": "KeEnergy.MTec", "version": "2.2.2"}],
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+                mock_keenergy_api.post(
+                    "http://mocked-host/var/readWriteVars",
+                    payload=get_positions_payload(),
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+                for ret in ("OK", "ERROR"):
+                    mock_keenergy_api.post(
+                        "http://mocked-host/var/readVarChildren",
+                        payload={"ret": ret},
+                        headers={"Content-Type": "application/json;charset=utf-8"},
+                    )
+
+                async with KebaKeEnergyAPI(host="mocked-host", capability_store=store) as client:
+                    assert await client.filter_request(request=request) == [HeatPump.STATE]
+                    assert await client.filter_request(request=request) == [HeatPump.STATE]
+
+                assert mock_keenergy_api.requests is not None
+                assert sum(len(calls) for calls in mock_keenergy_api.requests.values()) == expected_requests
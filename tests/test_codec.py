@@ -0,0 +1,81 @@
+import json
+from typing import Any
+
+import pytest
+from aioresponses import aioresponses
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.codec import JSONCodec
+from keba_keenergy_api.codec import STDLIB_CODEC
+from keba_keenergy_api.codec import get_codec
+from tests.test_api_data import get_positions_payload
+
+
+class TestJSONCodec:
+    @pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+    def test_get_codec(self, name: str) -> None:
+        if name != "json":
+            pytest.importorskip(name)
+
+        codec: JSONCodec = get_codec(name)
+        payload: list[dict[str, str]] = [{"name": "APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState", "attr": "1"}]
+
+        assert codec.name == name
+        assert json.loads(codec.encode(payload)) == payload
+        assert codec.decode(json.dumps(payload)) == payload
+
+    def test_get_default_codec(self) -> None:
+        codec: JSONCodec = get_codec()
+
+        assert codec.encode is json.dumps
+        assert codec.decode('[{"value": "1"}]') == [{"value": "1"}]
+
+    def test_get_default_codec_without_fast_decoder(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def import_module(name: str) -> None:
+            raise ImportError(name)
+
+        monkeypatch.setattr("keba_keenergy_api.codec.import_module", import_module)
+
+        assert get_codec() is STDLIB_CODEC
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("yaml", "Unknown JSON codec 'yaml'"),
+            ("msgspec", "JSON codec 'msgspec' is not installed"),
+        ],
+    )
+    def test_get_invalid_codec(self, monkeypatch: pytest.MonkeyPatch, name: str, expected: str) -> None:
+        def import_module(name: str) -> None:
+            raise ImportError(name)
+
+        monkeypatch.setattr("keba_keenergy_api.codec.import_module", import_module)
+
+        with pytest.raises(ValueError, match=expected):
+            get_codec(name)
+
+    @pytest.mark.asyncio
+    async def test_api_with_codec(self) -> None:
+        calls: list[str] = []
+
+        def encode(obj: Any) -> str:  # noqa: ANN401
+            calls.append("encode")
+            return json.dumps(obj)
+
+        def decode(data: str | bytes) -> Any:  # noqa: ANN401
+            calls.append("decode")
+            return json.loads(data)
+
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=get_positions_payload(),
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            codec: JSONCodec = JSONCodec(name="custom", encode=encode, decode=decode)
+
+            async with KebaKeEnergyAPI(host="mocked-host", codec=codec) as client:
+                assert client.connection.codec is codec
+                assert (await client.system.get_positions()).heat_pump == 1
+                assert calls == ["encode", "decode"]
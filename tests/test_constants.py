@@ -0,0 +1,35 @@
+import pytest
+
+from keba_keenergy_api.constants import HeatPumpSubState
+
+
+class TestBaseEnum:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (0, HeatPumpSubState.NONE),
+            (3, HeatPumpSubState.PUMP_PRE_RUN),
+            (22, HeatPumpSubState.PRESSURE_EQUALIZATION),
+            ((13, 25), HeatPumpSubState.DRIP),
+        ],
+    )
+    def test_lookup(self, value: int | tuple[int, ...], expected: HeatPumpSubState) -> None:
+        assert HeatPumpSubState(value) is expected
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (0, "none"),
+            (2, "pump_pre_run"),
+            (21, "pressure_equalization"),
+        ],
+    )
+    def test_get_name(self, value: int, expected: str) -> None:
+        assert HeatPumpSubState.get_name(value) == expected
+
+    def test_invalid_value(self) -> None:
+        with pytest.raises(ValueError, match="99 is not a valid HeatPumpSubState"):
+            HeatPumpSubState(99)
+
+        with pytest.raises(ValueError, match="99 is not a valid HeatPumpSubState"):
+            HeatPumpSubState.get_name(99)
@@ -0,0 +1,135 @@
+import json
+
+import pytest
+from aioresponses import aioresponses
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.constants import HeatPump
+from keba_keenergy_api.coordinator import PollCoordinator
+from keba_keenergy_api.coordinator import Subscription
+from keba_keenergy_api.error import APIError
+from keba_keenergy_api.subscription import ValueChange
+from keba_keenergy_api.subscription import Variable
+from tests.test_api_data import get_positions_payload
+from tests.test_subscription import TIMESTAMP
+
+STATE: str = "APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState"
+FLOW_TEMPERATURE: str = "APPL.CtrlAppl.sParam.heatpump[0].TempHeatFlow.values.actValue"
+COMPRESSOR_FAILURE: str = "APPL.CtrlAppl.sParam.heatpump[0].FailureCompressor.values.actValue"
+
+
+def get_values(changes: list[ValueChange]) -> list[float | int | str]:
+    """Get the values of the changes."""
+    return [change.value for change in changes]
+
+
+class TestSubscription:
+    @pytest.mark.asyncio
+    async def test_put(self) -> None:
+        async with KebaKeEnergyAPI(host="mocked-host") as client:
+            subscription: Subscription = Subscription(
+                PollCoordinator(client),
+                [Variable(section=HeatPump.STATE, position=1)],
+                maxsize=1,
+            )
+            subscription.put([ValueChange(HeatPump.STATE, 1, 0, "flow", TIMESTAMP)])
+            subscription.put([ValueChange(HeatPump.STATE, 1, 0, "defrost", TIMESTAMP)])
+
+            assert subscription.dropped == 1
+            assert get_values(await anext(subscription)) == ["defrost"]
+
+
+class TestPollCoordinator:
+    @pytest.mark.asyncio
+    async def test_init_adaptive_bounds(self) -> None:
+        async with KebaKeEnergyAPI(host="mocked-host") as client:
+            coordinator: PollCoordinator = PollCoordinator(client, adaptive=True, min_interval=5.0, max_interval=60.0)
+
+            assert coordinator._scheduler.adaptive is True  # noqa: SLF001
+            assert coordinator._scheduler.min_interval == 5.0  # noqa: SLF001, PLR2004
+            assert coordinator._scheduler.max_interval == 60.0  # noqa: SLF001, PLR2004
+
+    @pytest.mark.asyncio
+    async def test_subscribe(self) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[{"name": STATE, "value": "3"}, {"name": FLOW_TEMPERATURE, "value": "30.5"}],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[{"name": COMPRESSOR_FAILURE, "value": "false"}],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            async with (
+                KebaKeEnergyAPI(host="mocked-host") as client,
+                PollCoordinator(client, interval=3600) as coordinator,
+            ):
+                dashboard: Subscription = await coordinator.subscribe([HeatPump.STATE, HeatPump.FLOW_TEMPERATURE], 1)
+                assert get_values(await anext(dashboard)) == ["defrost", 30.5]
+
+                alarms: Subscription = await coordinator.subscribe(
+                    [HeatPump.FLOW_TEMPERATURE, HeatPump.HAS_COMPRESSOR_FAILURE],
+                    1,
+                    maxsize=10,
+                )
+                assert get_values(await anext(alarms)) == [30.5]
+                assert get_values(await anext(alarms)) == ["off"]
+
+                mock_keenergy_api.assert_called_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=json.dumps([{"name": COMPRESSOR_FAILURE, "attr": "0"}]),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
+
+                alarms.close()
+                alarms.close()
+
+                assert coordinator.subscriptions == [dashboard]
+                assert list(coordinator._counts) == [  # noqa: SLF001
+                    Variable(section=HeatPump.STATE, position=1),
+                    Variable(section=HeatPump.FLOW_TEMPERATURE, position=1),
+                ]
+
+            assert [changes async for changes in dashboard] == []
+            assert dashboard.queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_subscribe_all_positions(self) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=get_positions_payload(),
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[{"name": STATE, "value": "1"}],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                coordinator: PollCoordinator = PollCoordinator(client, interval=3600, human_readable=False)
+                subscription: Subscription = await coordinator.subscribe(HeatPump.STATE)
+
+                assert get_values(await anext(subscription)) == [1]
+
+                await coordinator.stop()
+
+    @pytest.mark.asyncio
+    async def test_subscribe_with_error(self) -> None:
+        with aioresponses():
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                coordinator: PollCoordinator = PollCoordinator(client)
+                subscription: Subscription = await coordinator.subscribe(HeatPump.STATE, [1])
+
+                with pytest.raises(APIError):
+                    await anext(subscription)
+
+                await coordinator.stop()
@@ -27,19 +27,19 @@ class TestHappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: str = await client.buffer_tank.get_name()
-
-            assert isinstance(data, str)
-            assert data == "Puffer1"
-
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.name", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: str = await client.buffer_tank.get_name()
+
+                assert isinstance(data, str)
+                assert data == "Puffer1"
+
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.name", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_current_top_temperature(self) -> None:
@@ -62,19 +62,19 @@ class TestHappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.buffer_tank.get_current_top_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.buffer_tank.get_current_top_temperature()
 
-            assert isinstance(data, float)
-            assert data == 45.03  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 45.03  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].topTemp.values.actValue", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].topTemp.values.actValue", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_current_bottom_temperature(self) -> None:
@@ -97,19 +97,19 @@ class TestHappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.buffer_tank.get_current_bottom_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.buffer_tank.get_current_bottom_temperature()
 
-            assert isinstance(data, float)
-            assert data == 33.09  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 33.09  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].midTemp.values.actValue", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].midTemp.values.actValue", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -141,19 +141,19 @@ class TestHappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.buffer_tank.get_operating_mode(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.buffer_tank.get_operating_mode(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.operatingMode", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.operatingMode", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -172,17 +172,17 @@ class TestHappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            await client.buffer_tank.set_operating_mode(operating_mode)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                await client.buffer_tank.set_operating_mode(operating_mode)
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars?action=set",
-                data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.operatingMode", "value": "%s"}]'  # noqa: UP031
-                % expected_value,
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars?action=set",
+                    data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.operatingMode", "value": "%s"}]'  # noqa: UP031
+                    % expected_value,
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_standby_temperature(self) -> None:
@@ -205,19 +205,19 @@ class TestHappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.buffer_tank.get_standby_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.buffer_tank.get_standby_temperature()
 
-            assert isinstance(data, float)
-            assert data == 10.0  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 10.0  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.backupTemp", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.backupTemp", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_set_standby_temperature(self) -> None:
@@ -228,16 +228,16 @@ class TestHappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            await client.buffer_tank.set_standby_temperature(10)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                await client.buffer_tank.set_standby_temperature(10)
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars?action=set",
-                data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.backupTemp", "value": "10"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars?action=set",
+                    data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.backupTemp", "value": "10"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_target_temperature(self) -> None:
@@ -260,19 +260,19 @@ class TestHappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.buffer_tank.get_target_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.buffer_tank.get_target_temperature()
 
-            assert isinstance(data, float)
-            assert data == 37.75  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 37.75  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].values.setTemp", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].values.setTemp", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_excess_energy_target_temperature(self) -> None:
@@ -295,19 +295,19 @@ class TestHappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.buffer_tank.get_excess_energy_target_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.buffer_tank.get_excess_energy_target_temperature()
 
-            assert isinstance(data, float)
-            assert data == 55.0  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 55.0  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.excessEnergyTemp.value", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.excessEnergyTemp.value", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_set_excess_energy_target_temperature(self) -> None:
@@ -318,16 +318,16 @@ class TestHappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            await client.buffer_tank.set_excess_energy_target_temperature(43)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                await client.buffer_tank.set_excess_energy_target_temperature(43)
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars?action=set",
-                data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.excessEnergyTemp.value", "value": "43"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars?action=set",
+                    data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.excessEnergyTemp.value", "value": "43"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_excess_energy_target_temperature_hysteresis(self) -> None:
@@ -350,19 +350,19 @@ class TestHappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.buffer_tank.get_excess_energy_target_temperature_hysteresis()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.buffer_tank.get_excess_energy_target_temperature_hysteresis()
 
-            assert isinstance(data, float)
-            assert data == 2.0  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 2.0  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.excessEnergyTemp.hyst", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.excessEnergyTemp.hyst", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_set_excess_energy_target_temperature_hysteresis(self) -> None:
@@ -373,16 +373,16 @@ class TestHappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            await client.buffer_tank.set_excess_energy_target_temperature_hysteresis(3)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                await client.buffer_tank.set_excess_energy_target_temperature_hysteresis(3)
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars?action=set",
-                data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.excessEnergyTemp.hyst", "value": "3"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars?action=set",
+                    data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.excessEnergyTemp.hyst", "value": "3"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_outdoor_temperature_excess_energy_limit(self) -> None:
@@ -405,22 +405,22 @@ class TestHappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.buffer_tank.get_outdoor_temperature_excess_energy_limit()
-
-            assert isinstance(data, float)
-            assert data == 25.0  # noqa: PLR2004
-
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data=(
-                    '[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.thresholdOutTempExcessEnergy.value", '
-                    '"attr": "1"}]'
-                ),
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.buffer_tank.get_outdoor_temperature_excess_energy_limit()
+
+                assert isinstance(data, float)
+                assert data == 25.0  # noqa: PLR2004
+
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.thresholdOutTempExcessEnergy.value", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_set_outdoor_temperature_excess_energy_limit(self) -> None:
@@ -431,19 +431,19 @@ class TestHappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            await client.buffer_tank.set_outdoor_temperature_excess_energy_limit(22)
-
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars?action=set",
-                data=(
-                    '[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.thresholdOutTempExcessEnergy.value", '
-                    '"value": "22"}]'
-                ),
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                await client.buffer_tank.set_outdoor_temperature_excess_energy_limit(22)
+
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars?action=set",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.thresholdOutTempExcessEnergy.value", '
+                        '"value": "22"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -476,19 +476,19 @@ class TestHappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.buffer_tank.get_use_excess_energy(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.buffer_tank.get_use_excess_energy(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.useExcessEnergy", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.useExcessEnergy", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -512,17 +512,17 @@ class TestHappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            await client.buffer_tank.set_use_excess_energy(mode)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                await client.buffer_tank.set_use_excess_energy(mode)
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars?action=set",
-                data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.useExcessEnergy", "value": "%s"}]'  # noqa: UP031
-                % expected_value,
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars?action=set",
+                    data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.useExcessEnergy", "value": "%s"}]'  # noqa: UP031
+                    % expected_value,
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -537,12 +537,11 @@ class TestHappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-
-            with pytest.raises(APIError, match=r"Invalid value! Allowed values are \['OFF', '0', 'ON', '1']"):
-                await client.buffer_tank.set_use_excess_energy(mode)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                with pytest.raises(APIError, match=r"Invalid value! Allowed values are \['OFF', '0', 'ON', '1']"):
+                    await client.buffer_tank.set_use_excess_energy(mode)
 
-            mock_keenergy_api.assert_not_called()
+                mock_keenergy_api.assert_not_called()
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -578,19 +577,19 @@ class TestHappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.buffer_tank.get_excess_energy_mode(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.buffer_tank.get_excess_energy_mode(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].values.useExcessEnergy", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].values.useExcessEnergy", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -621,19 +620,19 @@ class TestHappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.buffer_tank.get_heat_request(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.buffer_tank.get_heat_request(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].values.heatRequestTop", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].values.heatRequestTop", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -664,19 +663,19 @@ class TestHappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.buffer_tank.get_cool_request(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.buffer_tank.get_cool_request(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].values.coolRequestBot", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].values.coolRequestBot", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
 
 @pytest.mark.unhappy
@@ -703,26 +702,25 @@ class TestUnhappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-
-            with pytest.raises(
-                APIError,
-                match=(
-                    'Can\'t convert value to type "int"! '
-                    r"{'name': 'APPL\.CtrlAppl\.sParam\.bufferTank\[0]\.param\.operatingMode', "
-                    r"'attributes': {'formatId': 'fmtBufferMode', 'longText': 'Oper\. mode', "
-                    "'unitId': 'Enum', 'upperLimit': '32767', 'lowerLimit': '0'}, 'value': '-0.010321236'}"
-                ),
-            ):
-                await client.buffer_tank.get_operating_mode(human_readable=False)
-
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.operatingMode", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                with pytest.raises(
+                    APIError,
+                    match=(
+                        'Can\'t convert value to type "int"! '
+                        r"{'name': 'APPL\.CtrlAppl\.sParam\.bufferTank\[0]\.param\.operatingMode', "
+                        r"'attributes': {'formatId': 'fmtBufferMode', 'longText': 'Oper\. mode', "
+                        "'unitId': 'Enum', 'upperLimit': '32767', 'lowerLimit': '0'}, 'value': '-0.010321236'}"
+                    ),
+                ):
+                    await client.buffer_tank.get_operating_mode(human_readable=False)
+
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.operatingMode", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -753,26 +751,25 @@ class TestUnhappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-
-            with pytest.raises(
-                APIError,
-                match=(
-                    "Can't convert value to human readable value! "
-                    r"{'name': 'APPL\.CtrlAppl\.sParam\.bufferTank\[0]\.param\.operatingMode', "
-                    r"'attributes': {'formatId': 'fmtBufferMode', 'longText': 'Oper\. mode', "
-                    "'unitId': 'Enum', 'upperLimit': '32767', 'lowerLimit': '0'}, 'value': '10'}"
-                ),
-            ):
-                await client.buffer_tank.get_operating_mode(human_readable=human_readable)
-
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.operatingMode", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                with pytest.raises(
+                    APIError,
+                    match=(
+                        "Can't convert value to human readable value! "
+                        r"{'name': 'APPL\.CtrlAppl\.sParam\.bufferTank\[0]\.param\.operatingMode', "
+                        r"'attributes': {'formatId': 'fmtBufferMode', 'longText': 'Oper\. mode', "
+                        "'unitId': 'Enum', 'upperLimit': '32767', 'lowerLimit': '0'}, 'value': '10'}"
+                    ),
+                ):
+                    await client.buffer_tank.get_operating_mode(human_readable=human_readable)
+
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.bufferTank[0].param.operatingMode", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -790,11 +787,10 @@ class TestUnhappyPathBufferTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-
-            with pytest.raises(
-                APIError, match=r"Invalid value! Allowed values are \['OFF', '0', 'ON', '1', 'HEAT_UP', '2']"
-            ):
-                await client.buffer_tank.set_operating_mode(operating_mode)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                with pytest.raises(
+                    APIError, match=r"Invalid value! Allowed values are \['OFF', '0', 'ON', '1', 'HEAT_UP', '2']"
+                ):
+                    await client.buffer_tank.set_operating_mode(operating_mode)
 
-            mock_keenergy_api.assert_not_called()
+                mock_keenergy_api.assert_not_called()
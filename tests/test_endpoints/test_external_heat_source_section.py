@@ -38,19 +38,19 @@ class TestHappyPathExternalHeatSourceSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.external_heat_source.get_operating_mode(human_readable=human_readable)
-
-            assert isinstance(data, (int | str))
-            assert data == expected_value
-
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].param.operatingMode", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.external_heat_source.get_operating_mode(human_readable=human_readable)
+
+                assert isinstance(data, (int | str))
+                assert data == expected_value
+
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].param.operatingMode", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -69,17 +69,17 @@ class TestHappyPathExternalHeatSourceSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            await client.external_heat_source.set_operating_mode(operating_mode)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                await client.external_heat_source.set_operating_mode(operating_mode)
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars?action=set",
-                data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].param.operatingMode", "value": "%s"}]'  # noqa: UP031
-                % expected_value,
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars?action=set",
+                    data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].param.operatingMode", "value": "%s"}]'  # noqa: UP031
+                    % expected_value,
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_target_temperature(self) -> None:
@@ -102,19 +102,19 @@ class TestHappyPathExternalHeatSourceSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.external_heat_source.get_target_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.external_heat_source.get_target_temperature()
 
-            assert isinstance(data, float)
-            assert data == 22.56  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 22.56  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].values.setTemp", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].values.setTemp", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -147,19 +147,19 @@ class TestHappyPathExternalHeatSourceSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.external_heat_source.get_heat_request(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.external_heat_source.get_heat_request(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].DO.values.setValueB", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].DO.values.setValueB", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_operating_time(self) -> None:
@@ -180,19 +180,19 @@ class TestHappyPathExternalHeatSourceSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.external_heat_source.get_operating_time()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.external_heat_source.get_operating_time()
 
-            assert isinstance(data, int)
-            assert data == 3809028  # noqa: PLR2004
+                assert isinstance(data, int)
+                assert data == 3809028  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].DO.operationalData.operationalTimeS", "attr": "1"}]',  # noqa: E501
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].DO.operationalData.operationalTimeS", "attr": "1"}]',  # noqa: E501
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_max_runtime(self) -> None:
@@ -213,19 +213,22 @@ class TestHappyPathExternalHeatSourceSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.external_heat_source.get_max_runtime()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.external_heat_source.get_max_runtime()
 
-            assert isinstance(data, int)
-            assert data == 602403  # noqa: PLR2004
+                assert isinstance(data, int)
+                assert data == 602403  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].DO.operationalData.maxRunTimeS", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].DO.operationalData.maxRunTimeS", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_activation_counter(self) -> None:
@@ -245,19 +248,19 @@ class TestHappyPathExternalHeatSourceSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.external_heat_source.get_activation_counter()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.external_heat_source.get_activation_counter()
 
-            assert isinstance(data, int)
-            assert data == 477  # noqa: PLR2004
+                assert isinstance(data, int)
+                assert data == 477  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].DO.operationalData.activationCounter", "attr": "1"}]',  # noqa: E501
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].DO.operationalData.activationCounter", "attr": "1"}]',  # noqa: E501
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -290,21 +293,24 @@ class TestHappyPathExternalHeatSourceSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.external_heat_source.get_consuming_excess_energy(
-                human_readable=human_readable
-            )
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.external_heat_source.get_consuming_excess_energy(
+                    human_readable=human_readable
+                )
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].values.consumingExcessEnergy", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].values.consumingExcessEnergy", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_excess_energy_operating_time(self) -> None:
@@ -325,19 +331,19 @@ class TestHappyPathExternalHeatSourceSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.external_heat_source.get_excess_energy_operating_time()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.external_heat_source.get_excess_energy_operating_time()
 
-            assert isinstance(data, int)
-            assert data == 3809028  # noqa: PLR2004
+                assert isinstance(data, int)
+                assert data == 3809028  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].operationalDataExcessEnergy.operationalTimeS", "attr": "1"}]',  # noqa: E501
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].operationalDataExcessEnergy.operationalTimeS", "attr": "1"}]',  # noqa: E501
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_excess_energy_max_runtime(self) -> None:
@@ -358,22 +364,22 @@ class TestHappyPathExternalHeatSourceSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.external_heat_source.get_excess_energy_max_runtime()
-
-            assert isinstance(data, int)
-            assert data == 602403  # noqa: PLR2004
-
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data=(
-                    '[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].operationalDataExcessEnergy.maxRunTimeS", '
-                    '"attr": "1"}]'
-                ),
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.external_heat_source.get_excess_energy_max_runtime()
+
+                assert isinstance(data, int)
+                assert data == 602403  # noqa: PLR2004
+
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].operationalDataExcessEnergy.maxRunTimeS", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_excess_energy_activation_counter(self) -> None:
@@ -393,19 +399,19 @@ class TestHappyPathExternalHeatSourceSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.external_heat_source.get_excess_energy_activation_counter()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.external_heat_source.get_excess_energy_activation_counter()
 
-            assert isinstance(data, int)
-            assert data == 477  # noqa: PLR2004
+                assert isinstance(data, int)
+                assert data == 477  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].operationalDataExcessEnergy.activationCounter", "attr": "1"}]',  # noqa: E501
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].operationalDataExcessEnergy.activationCounter", "attr": "1"}]',  # noqa: E501
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -438,19 +444,19 @@ class TestHappyPathExternalHeatSourceSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.external_heat_source.get_use_excess_energy(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.external_heat_source.get_use_excess_energy(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].param.supportExcessEnergy", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].param.supportExcessEnergy", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -474,17 +480,17 @@ class TestHappyPathExternalHeatSourceSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            await client.external_heat_source.set_use_excess_energy(mode)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                await client.external_heat_source.set_use_excess_energy(mode)
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars?action=set",
-                data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].param.supportExcessEnergy", "value": "%s"}]'  # noqa: UP031
-                % expected_value,
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars?action=set",
+                    data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].param.supportExcessEnergy", "value": "%s"}]'  # noqa: UP031
+                    % expected_value,
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -499,12 +505,11 @@ class TestHappyPathExternalHeatSourceSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                with pytest.raises(APIError, match=r"Invalid value! Allowed values are \['OFF', '0', 'ON', '1']"):
+                    await client.external_heat_source.set_use_excess_energy(mode)
 
-            with pytest.raises(APIError, match=r"Invalid value! Allowed values are \['OFF', '0', 'ON', '1']"):
-                await client.external_heat_source.set_use_excess_energy(mode)
-
-            mock_keenergy_api.assert_not_called()
+                mock_keenergy_api.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_min_runtime_excess_energy(self) -> None:
@@ -527,19 +532,22 @@ class TestHappyPathExternalHeatSourceSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | None = await client.external_heat_source.get_min_runtime_excess_energy()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | None = await client.external_heat_source.get_min_runtime_excess_energy()
 
-            assert isinstance(data, int)
-            assert data == 2  # noqa: PLR2004
+                assert isinstance(data, int)
+                assert data == 2  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].param.minRunTimeExcessEnergy", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].param.minRunTimeExcessEnergy", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_set_min_runtime_excess_energy(self) -> None:
@@ -550,16 +558,19 @@ class TestHappyPathExternalHeatSourceSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            await client.external_heat_source.set_min_runtime_excess_energy(5)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                await client.external_heat_source.set_min_runtime_excess_energy(5)
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars?action=set",
-                data='[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].param.minRunTimeExcessEnergy", "value": "5"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars?action=set",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.extHeatSource[0].param.minRunTimeExcessEnergy", '
+                        '"value": "5"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
 
 @pytest.mark.unhappy
@@ -581,9 +592,8 @@ class TestUnhappyPathExternalHeatSourceSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-
-            with pytest.raises(APIError, match=r"Invalid value! Allowed values are \['OFF', '0', 'ON', '1']"):
-                await client.external_heat_source.set_operating_mode(operating_mode)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                with pytest.raises(APIError, match=r"Invalid value! Allowed values are \['OFF', '0', 'ON', '1']"):
+                    await client.external_heat_source.set_operating_mode(operating_mode)
 
-            mock_keenergy_api.assert_not_called()
+                mock_keenergy_api.assert_not_called()
@@ -4048,3 +4048,36 @@ heating_curve_points_expected_response_2: HeatingCurves = {
         HeatingCurvePoint(outdoor=-15.0, flow=20.0),
     ),
 }
+
+heating_curve_versions_expected_data: str = (
+    "["
+    + ", ".join(f'{{"name": "APPL.CtrlAppl.sParam.linTabPool[{idx}].verCnt", "attr": "0"}}' for idx in range(30))
+    + "]"
+)
+
+
+def get_heating_curve_versions_payload(version: int = 1) -> Response:
+    """Get the response payload for the version counters of all heating curves."""
+    return [{"name": f"APPL.CtrlAppl.sParam.linTabPool[{idx}].verCnt", "value": str(version)} for idx in range(30)]
+
+
+def get_heating_curve_no_of_points_payload(no_of_points: dict[int, int]) -> Response:
+    """Get the response payload for the number of points of the given heating curves."""
+    return [
+        {"name": f"APPL.CtrlAppl.sParam.linTabPool[{idx}].noOfPoints", "value": str(points)}
+        for idx, points in no_of_points.items()
+    ]
+
+
+def get_heating_curve_used_points_payload(no_of_points: dict[int, int]) -> Response:
+    """Get the response payload for the used points of the given heating curves."""
+    payload: Response = []
+
+    for idx, points in no_of_points.items():
+        for point_idx in range(points):
+            payload += [
+                {"name": f"APPL.CtrlAppl.sParam.linTabPool[{idx}].points[{point_idx}].x", "value": str(point_idx)},
+                {"name": f"APPL.CtrlAppl.sParam.linTabPool[{idx}].points[{point_idx}].y", "value": str(idx)},
+            ]
+
+    return payload
@@ -1,10 +1,17 @@
+import json
+
 import pytest
 from aioresponses.core import aioresponses
 
 from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.constants import ALL
 from keba_keenergy_api.constants import BoolEnum
 from keba_keenergy_api.constants import HeatPumpOperatingMode
+from keba_keenergy_api.endpoints import HeatPumpEndpoints
+from keba_keenergy_api.endpoints import Positions
 from keba_keenergy_api.error import APIError
+from tests.test_api_data import get_heat_pump_flow_temperature_payload
+from tests.test_api_data import get_positions_payload
 
 
 @pytest.mark.happy
@@ -26,19 +33,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: str = await client.heat_pump.get_name()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: str = await client.heat_pump.get_name()
 
-            assert isinstance(data, str)
-            assert data == "WPS26"
+                assert isinstance(data, str)
+                assert data == "WPS26"
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].param.name", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].param.name", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -70,19 +77,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.heat_pump.get_state(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.heat_pump.get_state(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -118,19 +125,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.heat_pump.get_substate(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.heat_pump.get_substate(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpSubState", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpSubState", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -162,19 +169,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.heat_pump.get_operating_mode(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.heat_pump.get_operating_mode(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].param.operatingMode", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].param.operatingMode", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -193,17 +200,17 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            await client.heat_pump.set_operating_mode(operating_mode)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                await client.heat_pump.set_operating_mode(operating_mode)
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars?action=set",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].param.operatingMode", "value": "%s"}]'  # noqa: UP031
-                % expected_value,
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars?action=set",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].param.operatingMode", "value": "%s"}]'  # noqa: UP031
+                    % expected_value,
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -236,19 +243,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.heat_pump.get_compressor_use_night_speed(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.heat_pump.get_compressor_use_night_speed(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].HeatPumpPowerCtrl.param.useDayNightSpeed", "attr": "1"}]',  # noqa: E501
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].HeatPumpPowerCtrl.param.useDayNightSpeed", "attr": "1"}]',  # noqa: E501
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -272,17 +279,17 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            await client.heat_pump.set_compressor_use_night_speed(mode)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                await client.heat_pump.set_compressor_use_night_speed(mode)
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars?action=set",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].HeatPumpPowerCtrl.param.useDayNightSpeed", "value": "%s"}]'  # noqa: E501, UP031
-                % expected_value,
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars?action=set",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].HeatPumpPowerCtrl.param.useDayNightSpeed", "value": "%s"}]'  # noqa: E501, UP031
+                    % expected_value,
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_compressor_night_speed(self) -> None:
@@ -305,19 +312,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_compressor_night_speed()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_compressor_night_speed()
 
-            assert isinstance(data, float)
-            assert data == 0.5  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 0.5  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].HeatPumpPowerCtrl.param.maxPowerScaledNight", "attr": "1"}]',  # noqa: E501
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].HeatPumpPowerCtrl.param.maxPowerScaledNight", "attr": "1"}]',  # noqa: E501
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_set_compressor_night_speed(self) -> None:
@@ -328,16 +335,16 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            await client.heat_pump.set_compressor_night_speed(0.6)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                await client.heat_pump.set_compressor_night_speed(0.6)
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars?action=set",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].HeatPumpPowerCtrl.param.maxPowerScaledNight", "value": "0.6"}]',  # noqa: E501
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars?action=set",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].HeatPumpPowerCtrl.param.maxPowerScaledNight", "value": "0.6"}]',  # noqa: E501
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_min_compressor_night_speed(self) -> None:
@@ -360,22 +367,22 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_min_compressor_night_speed()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_min_compressor_night_speed()
 
-            assert isinstance(data, float)
-            assert data == 0.5  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 0.5  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data=(
-                    '[{"name": "APPL.CtrlAppl.sParam.heatpump[0].HeatPumpPowerCtrl.param.maxPowerScaledNight", '
-                    '"attr": "1"}]'
-                ),
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.heatpump[0].HeatPumpPowerCtrl.param.maxPowerScaledNight", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_max_compressor_night_speed(self) -> None:
@@ -398,22 +405,22 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_max_compressor_night_speed()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_max_compressor_night_speed()
 
-            assert isinstance(data, float)
-            assert data == 1
+                assert isinstance(data, float)
+                assert data == 1
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data=(
-                    '[{"name": "APPL.CtrlAppl.sParam.heatpump[0].HeatPumpPowerCtrl.param.maxPowerScaledNight", '
-                    '"attr": "1"}]'
-                ),
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.heatpump[0].HeatPumpPowerCtrl.param.maxPowerScaledNight", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_circulation_pump_speed(self) -> None:
@@ -436,19 +443,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_circulation_pump_speed()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_circulation_pump_speed()
 
-            assert isinstance(data, float)
-            assert data == 0.5  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 0.5  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].CircPump.values.setValueScaled", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].CircPump.values.setValueScaled", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_source_pump_speed(self) -> None:
@@ -471,19 +478,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_source_pump_speed()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_source_pump_speed()
 
-            assert isinstance(data, float)
-            assert data == 0.4488  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 0.4488  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].Source.values.setValueScaled", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].Source.values.setValueScaled", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_flow_temperature(self) -> None:
@@ -504,19 +511,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_flow_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_flow_temperature()
 
-            assert isinstance(data, float)
-            assert data == 24.2  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 24.2  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].TempHeatFlow.values.actValue", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].TempHeatFlow.values.actValue", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_return_flow_temperature(self) -> None:
@@ -537,19 +544,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_return_flow_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_return_flow_temperature()
 
-            assert isinstance(data, float)
-            assert data == 23.2  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 23.2  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].TempHeatReflux.values.actValue", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].TempHeatReflux.values.actValue", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_source_input_temperature(self) -> None:
@@ -570,19 +577,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_source_input_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_source_input_temperature()
 
-            assert isinstance(data, float)
-            assert data == 22.7  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 22.7  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].TempSourceIn.values.actValue", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].TempSourceIn.values.actValue", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_source_output_temperature(self) -> None:
@@ -603,19 +610,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_source_output_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_source_output_temperature()
 
-            assert isinstance(data, float)
-            assert data == 24.6  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 24.6  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].TempSourceOut.values.actValue", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].TempSourceOut.values.actValue", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_compressor_input_temperature(self) -> None:
@@ -636,19 +643,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_compressor_input_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_compressor_input_temperature()
 
-            assert isinstance(data, float)
-            assert data == 26.4  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 26.4  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].TempCompressorIn.values.actValue", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].TempCompressorIn.values.actValue", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_compressor_output_temperature(self) -> None:
@@ -669,19 +676,22 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_compressor_output_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_compressor_output_temperature()
 
-            assert isinstance(data, float)
-            assert data == 26.5  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 26.5  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].TempCompressorOut.values.actValue", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.heatpump[0].TempCompressorOut.values.actValue", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_compressor_speed(self) -> None:
@@ -704,19 +714,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_compressor_speed()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_compressor_speed()
 
-            assert isinstance(data, float)
-            assert data == 0.3  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 0.3  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].Compressor.values.setValueScaled", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].Compressor.values.setValueScaled", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_condenser_temperature(self) -> None:
@@ -739,19 +749,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_condenser_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_condenser_temperature()
 
-            assert isinstance(data, float)
-            assert data == 31.51  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 31.51  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].OverHeatCtrl.values.tempCond", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].OverHeatCtrl.values.tempCond", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_vaporizer_temperature(self) -> None:
@@ -772,19 +782,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_vaporizer_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_vaporizer_temperature()
 
-            assert isinstance(data, float)
-            assert data == -4.56  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == -4.56  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].OverHeatCtrl.values.tempVap", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].OverHeatCtrl.values.tempVap", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_target_overheating(self) -> None:
@@ -805,19 +815,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_target_overheating()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_target_overheating()
 
-            assert isinstance(data, float)
-            assert data == 5.50  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 5.50  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].OverHeatCtrl.values.setOH", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].OverHeatCtrl.values.setOH", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_current_overheating(self) -> None:
@@ -838,19 +848,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_current_overheating()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_current_overheating()
 
-            assert isinstance(data, float)
-            assert data == 18.68  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 18.68  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].OverHeatCtrl.values.actOH", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].OverHeatCtrl.values.actOH", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_expansion_valve_position(self) -> None:
@@ -870,19 +880,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.heat_pump.get_expansion_valve_position()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.heat_pump.get_expansion_valve_position()
 
-            assert isinstance(data, int)
-            assert data == 20  # noqa: PLR2004
+                assert isinstance(data, int)
+                assert data == 20  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].OverHeatCtrl.values.stepperPos", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].OverHeatCtrl.values.stepperPos", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_high_pressure(self) -> None:
@@ -903,19 +913,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_high_pressure()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_high_pressure()
 
-            assert isinstance(data, float)
-            assert data == 15.02  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 15.02  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].HighPressure.values.actValue", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].HighPressure.values.actValue", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_low_pressure(self) -> None:
@@ -936,19 +946,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_low_pressure()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_low_pressure()
 
-            assert isinstance(data, float)
-            assert data == 14.81  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 14.81  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].LowPressure.values.actValue", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].LowPressure.values.actValue", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -979,19 +989,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.heat_pump.get_heat_request(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.heat_pump.get_heat_request(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].values.request", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].values.request", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -1024,19 +1034,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.heat_pump.get_consuming_excess_energy(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.heat_pump.get_consuming_excess_energy(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].values.consumingExcessEnergy", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].values.consumingExcessEnergy", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_compressor_power(self) -> None:
@@ -1057,19 +1067,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_compressor_power()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_compressor_power()
 
-            assert isinstance(data, float)
-            assert data == 5.52  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 5.52  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].ElectricEnergyMeter.values.power", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].ElectricEnergyMeter.values.power", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_excess_energy_operating_time(self) -> None:
@@ -1090,19 +1100,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.heat_pump.get_excess_energy_operating_time()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.heat_pump.get_excess_energy_operating_time()
 
-            assert isinstance(data, int)
-            assert data == 602403  # noqa: PLR2004
+                assert isinstance(data, int)
+                assert data == 602403  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].operationalDataExcessEnergy.operationalTimeS", "attr": "1"}]',  # noqa: E501
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].operationalDataExcessEnergy.operationalTimeS", "attr": "1"}]',  # noqa: E501
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_excess_energy_max_runtime(self) -> None:
@@ -1123,22 +1133,22 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.heat_pump.get_excess_energy_max_runtime()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.heat_pump.get_excess_energy_max_runtime()
 
-            assert isinstance(data, int)
-            assert data == 602403  # noqa: PLR2004
+                assert isinstance(data, int)
+                assert data == 602403  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data=(
-                    '[{"name": "APPL.CtrlAppl.sParam.heatpump[0].operationalDataExcessEnergy.maxRunTimeS", '
-                    '"attr": "1"}]'
-                ),
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.heatpump[0].operationalDataExcessEnergy.maxRunTimeS", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_excess_energy_activation_counter(self) -> None:
@@ -1158,22 +1168,22 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.heat_pump.get_excess_energy_activation_counter()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.heat_pump.get_excess_energy_activation_counter()
 
-            assert isinstance(data, int)
-            assert data == 477  # noqa: PLR2004
+                assert isinstance(data, int)
+                assert data == 477  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data=(
-                    '[{"name": "APPL.CtrlAppl.sParam.heatpump[0].operationalDataExcessEnergy.activationCounter", '
-                    '"attr": "1"}]'
-                ),
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.heatpump[0].operationalDataExcessEnergy.activationCounter", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_heating_power(self) -> None:
@@ -1194,19 +1204,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_heating_power()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_heating_power()
 
-            assert isinstance(data, float)
-            assert data == 3.22  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 3.22  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].HeatMeter.values.power", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].HeatMeter.values.power", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_hot_water_power(self) -> None:
@@ -1227,19 +1237,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_hot_water_power()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_hot_water_power()
 
-            assert isinstance(data, float)
-            assert data == 2.77  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 2.77  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].HotWaterMeter.values.power", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].HotWaterMeter.values.power", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_cop(self) -> None:
@@ -1259,19 +1269,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_cop()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_cop()
 
-            assert isinstance(data, float)
-            assert data == 2.55  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 2.55  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].values.COP", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].values.COP", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_heating_energy(self) -> None:
@@ -1292,19 +1302,22 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_heating_energy()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_heating_energy()
 
-            assert isinstance(data, float)
-            assert data == 8.43  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 8.43  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.heating.energy", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.heating.energy", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_heating_energy_consumption(self) -> None:
@@ -1325,19 +1338,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_heating_energy_consumption()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_heating_energy_consumption()
 
-            assert isinstance(data, float)
-            assert data == 7.33  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 7.33  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.heating.electricalenergy", "attr": "1"}]',  # noqa: E501
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.heating.electricalenergy", "attr": "1"}]',  # noqa: E501
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_heating_spf(self) -> None:
@@ -1356,19 +1369,22 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_heating_spf()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_heating_spf()
 
-            assert isinstance(data, float)
-            assert data == 3.32  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 3.32  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].EnergyEfficiencyRatioHeat", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].EnergyEfficiencyRatioHeat", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_cooling_energy(self) -> None:
@@ -1389,19 +1405,22 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_cooling_energy()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_cooling_energy()
 
-            assert isinstance(data, float)
-            assert data == 7.21  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 7.21  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.cooling.energy", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.cooling.energy", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_cooling_energy_consumption(self) -> None:
@@ -1422,19 +1441,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_cooling_energy_consumption()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_cooling_energy_consumption()
 
-            assert isinstance(data, float)
-            assert data == 8.72  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 8.72  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.cooling.electricalenergy", "attr": "1"}]',  # noqa: E501
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.cooling.electricalenergy", "attr": "1"}]',  # noqa: E501
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_cooling_spf(self) -> None:
@@ -1454,19 +1473,22 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_cooling_spf()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_cooling_spf()
 
-            assert isinstance(data, float)
-            assert data == 4.22  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 4.22  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].EnergyEfficiencyRatioCool", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].EnergyEfficiencyRatioCool", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_hot_water_energy(self) -> None:
@@ -1487,19 +1509,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_hot_water_energy()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_hot_water_energy()
 
-            assert isinstance(data, float)
-            assert data == 7.86  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 7.86  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.domHotWater.energy", "attr": "1"}]',  # noqa: E501
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.domHotWater.energy", "attr": "1"}]',  # noqa: E501
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_hot_water_energy_consumption(self) -> None:
@@ -1520,19 +1542,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_hot_water_energy_consumption()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_hot_water_energy_consumption()
 
-            assert isinstance(data, float)
-            assert data == 2.77  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 2.77  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.domHotWater.electricalenergy", "attr": "1"}]',  # noqa: E501
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.domHotWater.electricalenergy", "attr": "1"}]',  # noqa: E501
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_hot_water_spf(self) -> None:
@@ -1551,19 +1573,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_hot_water_spf()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_hot_water_spf()
 
-            assert isinstance(data, float)
-            assert data == 2.50  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 2.50  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].EnergyEfficiencyRatioDomHotWater", "attr": "1"}]',  # noqa: E501
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].EnergyEfficiencyRatioDomHotWater", "attr": "1"}]',  # noqa: E501
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_total_thermal_energy(self) -> None:
@@ -1584,19 +1606,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_total_thermal_energy()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_total_thermal_energy()
 
-            assert isinstance(data, float)
-            assert data == 8.22  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 8.22  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.energy", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.energy", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_total_energy_consumption(self) -> None:
@@ -1617,19 +1639,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_total_energy_consumption()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_total_energy_consumption()
 
-            assert isinstance(data, float)
-            assert data == 5.21  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 5.21  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.electricalenergy", "attr": "1"}]',  # noqa: E501
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.electricalenergy", "attr": "1"}]',  # noqa: E501
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_excess_energy_consumption(self) -> None:
@@ -1650,22 +1672,22 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_excess_energy_consumption()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_excess_energy_consumption()
 
-            assert isinstance(data, float)
-            assert data == 10.00  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 10.00  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data=(
-                    '[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.consumedExcessEnergy", '
-                    '"attr": "1"}]'
-                ),
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.consumedExcessEnergy", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_heating_excess_energy_consumption(self) -> None:
@@ -1686,22 +1708,23 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_heating_excess_energy_consumption()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_heating_excess_energy_consumption()
 
-            assert isinstance(data, float)
-            assert data == 10.00  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 10.00  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data=(
-                    '[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.heating.consumedExcessEnergy", '
-                    '"attr": "1"}]'
-                ),
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.heating.'
+                        'consumedExcessEnergy", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_cooling_excess_energy_consumption(self) -> None:
@@ -1722,22 +1745,23 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_cooling_excess_energy_consumption()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_cooling_excess_energy_consumption()
 
-            assert isinstance(data, float)
-            assert data == 10.00  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 10.00  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data=(
-                    '[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.cooling.consumedExcessEnergy", '
-                    '"attr": "1"}]'
-                ),
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.cooling.'
+                        'consumedExcessEnergy", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_hot_water_excess_energy_consumption(self) -> None:
@@ -1758,22 +1782,22 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_hot_water_excess_energy_consumption()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_hot_water_excess_energy_consumption()
 
-            assert isinstance(data, float)
-            assert data == 10.00  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 10.00  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data=(
-                    '[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.domHotWater.'
-                    'consumedExcessEnergy", "attr": "1"}]'
-                ),
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].consumption.domHotWater.'
+                        'consumedExcessEnergy", "attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_total_spf(self) -> None:
@@ -1793,19 +1817,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.heat_pump.get_total_spf()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.heat_pump.get_total_spf()
 
-            assert isinstance(data, float)
-            assert data == 2.43  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 2.43  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].EnergyEfficiencyRatio", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sStatisticalData.heatpump[0].EnergyEfficiencyRatio", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -1838,19 +1862,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.heat_pump.has_active_cooling(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.heat_pump.has_active_cooling(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.options.heatpump[0].hasActiveCooling", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.options.heatpump[0].hasActiveCooling", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -1881,19 +1905,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.heat_pump.has_passive_cooling(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.heat_pump.has_passive_cooling(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.options.heatpump[0].hasPassiveCooling", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.options.heatpump[0].hasPassiveCooling", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_operating_time(self) -> None:
@@ -1914,19 +1938,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.heat_pump.get_operating_time()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.heat_pump.get_operating_time()
 
-            assert isinstance(data, int)
-            assert data == 65037217  # noqa: PLR2004
+                assert isinstance(data, int)
+                assert data == 65037217  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].operationalData.operationalTimeS", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].operationalData.operationalTimeS", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_max_runtime(self) -> None:
@@ -1947,19 +1971,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.heat_pump.get_max_runtime()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.heat_pump.get_max_runtime()
 
-            assert isinstance(data, int)
-            assert data == 8836597  # noqa: PLR2004
+                assert isinstance(data, int)
+                assert data == 8836597  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].operationalData.maxRunTimeS", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].operationalData.maxRunTimeS", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_activation_counter(self) -> None:
@@ -1979,19 +2003,22 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.heat_pump.get_activation_counter()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.heat_pump.get_activation_counter()
 
-            assert isinstance(data, int)
-            assert data == 1197  # noqa: PLR2004
+                assert isinstance(data, int)
+                assert data == 1197  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].operationalData.activationCounter", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.heatpump[0].operationalData.activationCounter", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -2024,19 +2051,22 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.heat_pump.has_compressor_failure(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.heat_pump.has_compressor_failure(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].FailureCompressor.values.actValue", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.heatpump[0].FailureCompressor.values.actValue", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -2069,19 +2099,19 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.heat_pump.has_source_failure(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.heat_pump.has_source_failure(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].FailureSource.values.actValue", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].FailureSource.values.actValue", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -2114,21 +2144,22 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.heat_pump.has_source_actuator_failure(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.heat_pump.has_source_actuator_failure(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data=(
-                    '[{"name": "APPL.CtrlAppl.sParam.heatpump[0].FailureActuatorSource.values.actValue", "attr": "1"}]'
-                ),
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.heatpump[0].FailureActuatorSource.values.'
+                        'actValue", "attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -2161,19 +2192,22 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.heat_pump.has_three_phase_failure(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.heat_pump.has_three_phase_failure(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].FailureThreePhase.values.actValue", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.heatpump[0].FailureThreePhase.values.actValue", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -2206,19 +2240,22 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.heat_pump.has_source_pressure_failure(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.heat_pump.has_source_pressure_failure(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].FailureSrcPressure.values.actValue", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.heatpump[0].FailureSrcPressure.values.actValue", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -2251,20 +2288,119 @@ class TestHappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.heat_pump.has_vfd_failure(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.heat_pump.has_vfd_failure(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].FailureVFD.values.actValue", "attr": "1"}]',
-                method="POST",
-                auth=None,
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.heatpump[0].FailureVFD.values.actValue", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("position", "heat_pumps", "expected_value"),
+        [
+            (2, [1], 31.5),
+            ([1, 3], [0, 2], [30.5, 32.5]),
+            ((3, 1), [2, 0], [32.5, 30.5]),
+            (ALL, [0, 1, 2], [30.5, 31.5, 32.5]),
+        ],
+    )
+    async def test_get_flow_temperature_with_positions(
+        self,
+        position: int | Positions,
+        heat_pumps: list[int],
+        expected_value: float | list[float],
+    ) -> None:
+        with aioresponses() as mock_keenergy_api:
+            if position == ALL:
+                mock_keenergy_api.post(
+                    "http://mocked-host/var/readWriteVars",
+                    payload=get_positions_payload(heat_pumps=3),
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[get_heat_pump_flow_temperature_payload(heat_pumps=3)[idx] for idx in heat_pumps],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                assert await client.heat_pump.get_flow_temperature(position) == expected_value
+
+                mock_keenergy_api.assert_called_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=json.dumps(
+                        [
+                            {"name": f"APPL.CtrlAppl.sParam.heatpump[{idx}].TempHeatFlow.values.actValue", "attr": "1"}
+                            for idx in heat_pumps
+                        ],
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
+
+    @pytest.mark.asyncio
+    async def test_get_flow_temperature_with_all_positions_without_client(self) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=get_positions_payload(heat_pumps=2),
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=get_heat_pump_flow_temperature_payload(heat_pumps=2),
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            endpoints: HeatPumpEndpoints = HeatPumpEndpoints(
+                "http://mocked-host",
                 ssl=False,
+                skip_ssl_verification=False,
+            )
+
+            assert await endpoints.get_flow_temperature(ALL) == [30.5, 31.5]
+
+    @pytest.mark.asyncio
+    async def test_get_flow_temperature_with_all_positions_without_devices(self) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=get_positions_payload(heat_pumps=0),
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                assert await client.heat_pump.get_flow_temperature(ALL) == []
+                assert await client.heat_pump.has_compressor_failure(ALL) == []
+
+                mock_keenergy_api.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_has_compressor_failure_with_positions(self) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {"name": f"APPL.CtrlAppl.sParam.heatpump[{idx}].FailureCompressor.values.actValue", "value": value}
+                    for idx, value in ((0, "false"), (1, "true"))
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                assert await client.heat_pump.has_compressor_failure([1, 2]) == ["off", "on"]
+
 
 @pytest.mark.unhappy
 class TestUnhappyPathHeatPumpSection:
@@ -2285,14 +2421,13 @@ class TestUnhappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                with pytest.raises(APIError) as error:
+                    await client.heat_pump.set_operating_mode(operating_mode)
 
-            with pytest.raises(APIError) as error:
-                await client.heat_pump.set_operating_mode(operating_mode)
+                assert str(error.value) == "Invalid value! Allowed values are ['OFF', '0', 'ON', '1', 'BACKUP', '2']"
 
-            assert str(error.value) == "Invalid value! Allowed values are ['OFF', '0', 'ON', '1', 'BACKUP', '2']"
-
-            mock_keenergy_api.assert_not_called()
+                mock_keenergy_api.assert_not_called()
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -2310,9 +2445,8 @@ class TestUnhappyPathHeatPumpSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-
-            with pytest.raises(APIError, match=r"Invalid value! Allowed values are \['OFF', '0', 'ON', '1']"):
-                await client.heat_pump.set_compressor_use_night_speed(operating_mode)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                with pytest.raises(APIError, match=r"Invalid value! Allowed values are \['OFF', '0', 'ON', '1']"):
+                    await client.heat_pump.set_compressor_use_night_speed(operating_mode)
 
-            mock_keenergy_api.assert_not_called()
+                mock_keenergy_api.assert_not_called()
@@ -27,19 +27,19 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: str = await client.hot_water_tank.get_name()
-
-            assert isinstance(data, str)
-            assert data == "Boiler"
-
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.name", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: str = await client.hot_water_tank.get_name()
+
+                assert isinstance(data, str)
+                assert data == "Boiler"
+
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.name", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_current_temperature(self) -> None:
@@ -62,19 +62,19 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.hot_water_tank.get_current_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.hot_water_tank.get_current_temperature()
 
-            assert isinstance(data, float)
-            assert data == 58.9  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 58.9  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].topTemp.values.actValue", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].topTemp.values.actValue", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -106,19 +106,19 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.hot_water_tank.get_operating_mode(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.hot_water_tank.get_operating_mode(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.operatingMode", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.operatingMode", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -137,17 +137,17 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            await client.hot_water_tank.set_operating_mode(operating_mode)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                await client.hot_water_tank.set_operating_mode(operating_mode)
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars?action=set",
-                data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.operatingMode", "value": "%s"}]'  # noqa: UP031
-                % expected_value,
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars?action=set",
+                    data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.operatingMode", "value": "%s"}]'  # noqa: UP031
+                    % expected_value,
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_min_target_temperature(self) -> None:
@@ -171,19 +171,19 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.hot_water_tank.get_min_target_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.hot_water_tank.get_min_target_temperature()
 
-            assert isinstance(data, int)
-            assert data == 0
+                assert isinstance(data, int)
+                assert data == 0
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.normalSetTempMax.value", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.normalSetTempMax.value", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_max_target_temperature(self) -> None:
@@ -207,19 +207,19 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.hot_water_tank.get_max_target_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.hot_water_tank.get_max_target_temperature()
 
-            assert isinstance(data, int)
-            assert data == 52  # noqa: PLR2004
+                assert isinstance(data, int)
+                assert data == 52  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.normalSetTempMax.value", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.normalSetTempMax.value", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_target_temperature(self) -> None:
@@ -243,19 +243,19 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.hot_water_tank.get_target_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.hot_water_tank.get_target_temperature()
 
-            assert isinstance(data, float)
-            assert data == 47.0  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 47.0  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.normalSetTempMax.value", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.normalSetTempMax.value", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_set_target_temperature(self) -> None:
@@ -266,16 +266,19 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            await client.hot_water_tank.set_target_temperature(47)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                await client.hot_water_tank.set_target_temperature(47)
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars?action=set",
-                data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.normalSetTempMax.value", "value": "47"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars?action=set",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.normalSetTempMax.value", '
+                        '"value": "47"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_standby_temperature(self) -> None:
@@ -299,19 +302,22 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.hot_water_tank.get_standby_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.hot_water_tank.get_standby_temperature()
 
-            assert isinstance(data, float)
-            assert data == 0.0
+                assert isinstance(data, float)
+                assert data == 0.0
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.reducedSetTempMax.value", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.reducedSetTempMax.value", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_set_standby_temperature(self) -> None:
@@ -322,16 +328,19 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            await client.hot_water_tank.set_standby_temperature(10)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                await client.hot_water_tank.set_standby_temperature(10)
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars?action=set",
-                data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.reducedSetTempMax.value", "value": "10"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars?action=set",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.reducedSetTempMax.value", '
+                        '"value": "10"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_excess_energy_target_temperature(self) -> None:
@@ -354,19 +363,19 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.hot_water_tank.get_excess_energy_target_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.hot_water_tank.get_excess_energy_target_temperature()
 
-            assert isinstance(data, float)
-            assert data == 55.0  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 55.0  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.excessEnergyTemp.value", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.excessEnergyTemp.value", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_set_excess_energy_target_temperature(self) -> None:
@@ -377,16 +386,19 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            await client.hot_water_tank.set_excess_energy_target_temperature(60)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                await client.hot_water_tank.set_excess_energy_target_temperature(60)
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars?action=set",
-                data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.excessEnergyTemp.value", "value": "60"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars?action=set",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.excessEnergyTemp.value", '
+                        '"value": "60"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_excess_energy_target_temperature_hysteresis(self) -> None:
@@ -409,19 +421,19 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.hot_water_tank.get_excess_energy_target_temperature_hysteresis()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.hot_water_tank.get_excess_energy_target_temperature_hysteresis()
 
-            assert isinstance(data, float)
-            assert data == 5  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 5  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.excessEnergyTemp.hyst", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.excessEnergyTemp.hyst", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_set_excess_energy_target_temperature_hysteresis(self) -> None:
@@ -432,16 +444,16 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            await client.hot_water_tank.set_excess_energy_target_temperature_hysteresis(3)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                await client.hot_water_tank.set_excess_energy_target_temperature_hysteresis(3)
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars?action=set",
-                data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.excessEnergyTemp.hyst", "value": "3"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars?action=set",
+                    data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.excessEnergyTemp.hyst", "value": "3"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -474,19 +486,19 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.hot_water_tank.get_use_excess_energy(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.hot_water_tank.get_use_excess_energy(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.useExcessEnergy", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.useExcessEnergy", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -510,17 +522,17 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            await client.hot_water_tank.set_use_excess_energy(mode)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                await client.hot_water_tank.set_use_excess_energy(mode)
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars?action=set",
-                data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.useExcessEnergy", "value": "%s"}]'  # noqa: UP031
-                % expected_value,
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars?action=set",
+                    data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.useExcessEnergy", "value": "%s"}]'  # noqa: UP031
+                    % expected_value,
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -535,12 +547,11 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                with pytest.raises(APIError, match=r"Invalid value! Allowed values are \['OFF', '0', 'ON', '1']"):
+                    await client.hot_water_tank.set_use_excess_energy(mode)
 
-            with pytest.raises(APIError, match=r"Invalid value! Allowed values are \['OFF', '0', 'ON', '1']"):
-                await client.hot_water_tank.set_use_excess_energy(mode)
-
-            mock_keenergy_api.assert_not_called()
+                mock_keenergy_api.assert_not_called()
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -576,19 +587,19 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.hot_water_tank.get_excess_energy_mode(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.hot_water_tank.get_excess_energy_mode(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].values.useExcessEnergy", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].values.useExcessEnergy", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -619,19 +630,19 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.hot_water_tank.get_heat_request(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.hot_water_tank.get_heat_request(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].values.heatRequestTop", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].values.heatRequestTop", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -664,19 +675,19 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.hot_water_tank.has_fresh_water_module(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.hot_water_tank.has_fresh_water_module(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.options.hotWaterTank[0].hasFreshWaterModule", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.options.hotWaterTank[0].hasFreshWaterModule", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -709,19 +720,19 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.hot_water_tank.get_fresh_water_flow(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.hot_water_tank.get_fresh_water_flow(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].FreshWater.freshWaterFlow.values.actValue", "attr": "1"}]',  # noqa: E501
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].FreshWater.freshWaterFlow.values.actValue", "attr": "1"}]',  # noqa: E501
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_fresh_water_module_temperature(self) -> None:
@@ -744,19 +755,19 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.hot_water_tank.get_fresh_water_module_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.hot_water_tank.get_fresh_water_module_temperature()
 
-            assert isinstance(data, float)
-            assert data == 30.0  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 30.0  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].FreshWater.freshWaterTemp.values.actValue", "attr": "1"}]',  # noqa: E501
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].FreshWater.freshWaterTemp.values.actValue", "attr": "1"}]',  # noqa: E501
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_fresh_water_module_pump_speed(self) -> None:
@@ -779,22 +790,23 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.hot_water_tank.get_fresh_water_module_pump_speed()
-
-            assert isinstance(data, float)
-            assert data == 0.4002  # noqa: PLR2004
-
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data=(
-                    '[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].FreshWater.freshWaterPump.values.setValueScaled", '
-                    '"attr": "1"}]'
-                ),
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.hot_water_tank.get_fresh_water_module_pump_speed()
+
+                assert isinstance(data, float)
+                assert data == 0.4002  # noqa: PLR2004
+
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].FreshWater.freshWaterPump.values.'
+                        'setValueScaled", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_circulation_return_temperature(self) -> None:
@@ -817,19 +829,19 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.hot_water_tank.get_circulation_return_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.hot_water_tank.get_circulation_return_temperature()
 
-            assert isinstance(data, float)
-            assert data == 47.44  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 47.44  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data=('[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].circTemp.values.actValue", "attr": "1"}]'),
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=('[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].circTemp.values.actValue", "attr": "1"}]'),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -862,19 +874,21 @@ class TestHappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.hot_water_tank.get_circulation_pump_state(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.hot_water_tank.get_circulation_pump_state(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data=('[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].circPump.pump.values.setValueB", "attr": "1"}]'),
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].circPump.pump.values.setValueB", "attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
 
 @pytest.mark.unhappy
@@ -909,26 +923,25 @@ class TestUnhappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-
-            with pytest.raises(
-                APIError,
-                match=(
-                    "Can't convert value to human readable value! "
-                    r"{'name': 'APPL\.CtrlAppl\.sParam.hotWaterTank\[0]\.param\.operatingMode', "
-                    r"'attributes': {'formatId': 'fmtHotWaterTank', 'longText': 'Op\.mode', "
-                    "'lowerLimit': '0', 'unitId': 'Enum', 'upperLimit': '32767'}, 'value': '10'}"
-                ),
-            ):
-                await client.hot_water_tank.get_operating_mode(human_readable=human_readable)
-
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.operatingMode", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                with pytest.raises(
+                    APIError,
+                    match=(
+                        "Can't convert value to human readable value! "
+                        r"{'name': 'APPL\.CtrlAppl\.sParam.hotWaterTank\[0]\.param\.operatingMode', "
+                        r"'attributes': {'formatId': 'fmtHotWaterTank', 'longText': 'Op\.mode', "
+                        "'lowerLimit': '0', 'unitId': 'Enum', 'upperLimit': '32767'}, 'value': '10'}"
+                    ),
+                ):
+                    await client.hot_water_tank.get_operating_mode(human_readable=human_readable)
+
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.hotWaterTank[0].param.operatingMode", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -946,13 +959,12 @@ class TestUnhappyPathHotWaterTankSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-
-            with pytest.raises(APIError) as error:
-                await client.hot_water_tank.set_operating_mode(operating_mode)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                with pytest.raises(APIError) as error:
+                    await client.hot_water_tank.set_operating_mode(operating_mode)
 
-            assert str(error.value) == (
-                "Invalid value! Allowed values are ['OFF', '0', 'AUTO', '1', 'ON', '2', 'HEAT_UP', '3']"
-            )
+                assert str(error.value) == (
+                    "Invalid value! Allowed values are ['OFF', '0', 'AUTO', '1', 'ON', '2', 'HEAT_UP', '3']"
+                )
 
-            mock_keenergy_api.assert_not_called()
+                mock_keenergy_api.assert_not_called()
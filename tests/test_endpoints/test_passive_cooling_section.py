@@ -28,19 +28,19 @@ class TestHappyPathPassiveCoolingSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.passive_cooling.get_temperature()
-
-            assert isinstance(data, float)
-            assert data == 20.60  # noqa: PLR2004
-
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.passivecooling[0].TempCoolPassive.values.actValue", "attr": "1"}]',  # noqa: E501
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.passive_cooling.get_temperature()
+
+                assert isinstance(data, float)
+                assert data == 20.60  # noqa: PLR2004
+
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.passivecooling[0].TempCoolPassive.values.actValue", "attr": "1"}]',  # noqa: E501
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -73,19 +73,19 @@ class TestHappyPathPassiveCoolingSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.passive_cooling.get_switch_valve_position(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.passive_cooling.get_switch_valve_position(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.passivecooling[0].SwitchValvePassiveCool.values.actPosition", "attr": "1"}]',  # noqa: E501
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.passivecooling[0].SwitchValvePassiveCool.values.actPosition", "attr": "1"}]',  # noqa: E501
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_circulation_pump_speed(self) -> None:
@@ -108,19 +108,19 @@ class TestHappyPathPassiveCoolingSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.passive_cooling.get_circulation_pump_speed()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.passive_cooling.get_circulation_pump_speed()
 
-            assert isinstance(data, float)
-            assert data == 0.2  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 0.2  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.passivecooling[0].Pump.values.setValueScaled", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.passivecooling[0].Pump.values.setValueScaled", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_mixer_target_temperature(self) -> None:
@@ -139,19 +139,19 @@ class TestHappyPathPassiveCoolingSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.passive_cooling.get_mixer_target_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.passive_cooling.get_mixer_target_temperature()
 
-            assert isinstance(data, float)
-            assert data == 22.0  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 22.0  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.passivecooling[0].Mixer.values.setValue", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.passivecooling[0].Mixer.values.setValue", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_mixer_flow_temperature(self) -> None:
@@ -174,19 +174,22 @@ class TestHappyPathPassiveCoolingSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.passive_cooling.get_mixer_flow_temperature()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.passive_cooling.get_mixer_flow_temperature()
 
-            assert isinstance(data, float)
-            assert data == 22.10  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 22.10  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.passivecooling[0].Mixer.flowTemp.values.actValue", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.passivecooling[0].Mixer.flowTemp.values.actValue", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -219,19 +222,19 @@ class TestHappyPathPassiveCoolingSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.passive_cooling.get_mixer_position(human_readable=human_readable)
-
-            assert isinstance(data, (int | str))
-            assert data == expected_value
-
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data=(
-                    '[{"name": "APPL.CtrlAppl.sParam.passivecooling[0].Mixer.mixer.values.setValueScaled", '
-                    '"attr": "1"}]'
-                ),
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.passive_cooling.get_mixer_position(human_readable=human_readable)
+
+                assert isinstance(data, (int | str))
+                assert data == expected_value
+
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.passivecooling[0].Mixer.mixer.values.setValueScaled", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
@@ -39,19 +39,19 @@ class TestHappyPathPhotovoltaicsSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.photovoltaics.get_excess_energy_active(human_readable=human_readable)
-
-            assert isinstance(data, (int | str))
-            assert data == expected_value
-
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.photovoltaics.values.excessEnergyActive", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.photovoltaics.get_excess_energy_active(human_readable=human_readable)
+
+                assert isinstance(data, (int | str))
+                assert data == expected_value
+
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.photovoltaics.values.excessEnergyActive", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_excess_power(self) -> None:
@@ -73,19 +73,22 @@ class TestHappyPathPhotovoltaicsSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.photovoltaics.get_excess_power()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.photovoltaics.get_excess_power()
 
-            assert isinstance(data, float)
-            assert data == 23.23  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 23.23  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.photovoltaics.ElectricEnergyMeter.values.power", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.photovoltaics.ElectricEnergyMeter.values.power", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_daily_energy(self) -> None:
@@ -107,19 +110,22 @@ class TestHappyPathPhotovoltaicsSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.photovoltaics.get_daily_energy()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.photovoltaics.get_daily_energy()
 
-            assert isinstance(data, float)
-            assert data == 49.39  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 49.39  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.photovoltaics.ElectricEnergyMeter.values.heatDay", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.photovoltaics.ElectricEnergyMeter.values.heatDay", '
+                        '"attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_total_energy(self) -> None:
@@ -141,16 +147,16 @@ class TestHappyPathPhotovoltaicsSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.photovoltaics.get_total_energy()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.photovoltaics.get_total_energy()
 
-            assert isinstance(data, float)
-            assert data == 349442.23  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 349442.23  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.photovoltaics.ElectricEnergyMeter.values.accumulatedHeat", "attr": "1"}]',  # noqa: E501
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.photovoltaics.ElectricEnergyMeter.values.accumulatedHeat", "attr": "1"}]',  # noqa: E501
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
@@ -104,33 +104,33 @@ class TestHappyPathSystemSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            response: Position = await client.system.get_positions()
-
-            assert isinstance(response, Position)
-            assert response.heat_pump == 2  # noqa: PLR2004
-            assert response.heat_circuit == 1
-            assert response.solar_circuit == 1
-            assert response.buffer_tank == 1
-            assert response.hot_water_tank == 1
-            assert response.external_heat_source == 1
-            assert response.switch_valve == 1
-
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data=(
-                    '[{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHeatPumps", "attr": "1"}, '
-                    '{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHeatingCircuits", "attr": "1"}, '
-                    '{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfSolarCircuits", "attr": "1"}, '
-                    '{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfBuffers", "attr": "1"}, '
-                    '{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHotWaterTanks", "attr": "1"}, '
-                    '{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfExtHeatSources", "attr": "1"}, '
-                    '{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfSwitchValves", "attr": "1"}]'
-                ),
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                response: Position = await client.system.get_positions()
+
+                assert isinstance(response, Position)
+                assert response.heat_pump == 2  # noqa: PLR2004
+                assert response.heat_circuit == 1
+                assert response.solar_circuit == 1
+                assert response.buffer_tank == 1
+                assert response.hot_water_tank == 1
+                assert response.external_heat_source == 1
+                assert response.switch_valve == 1
+
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHeatPumps", "attr": "1"}, '
+                        '{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHeatingCircuits", "attr": "1"}, '
+                        '{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfSolarCircuits", "attr": "1"}, '
+                        '{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfBuffers", "attr": "1"}, '
+                        '{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHotWaterTanks", "attr": "1"}, '
+                        '{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfExtHeatSources", "attr": "1"}, '
+                        '{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfSwitchValves", "attr": "1"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_info(self) -> None:
@@ -147,21 +147,21 @@ class TestHappyPathSystemSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: dict[str, Any] = await client.system.get_info()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: dict[str, Any] = await client.system.get_info()
 
-            assert isinstance(data, dict)
-            assert data == {
-                "name": "KeEnergy.MTec",
-                "version": "2.2.2",
-            }
+                assert isinstance(data, dict)
+                assert data == {
+                    "name": "KeEnergy.MTec",
+                    "version": "2.2.2",
+                }
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/swupdate?action=getSystemInstalled",
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/swupdate?action=getSystemInstalled",
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_hmi_info(self) -> None:
@@ -177,20 +177,20 @@ class TestHappyPathSystemSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: dict[str, Any] = await client.system.get_hmi_info()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: dict[str, Any] = await client.system.get_hmi_info()
 
-            assert isinstance(data, dict)
-            assert data == {
-                "name": "KeEnergy.WebHmi_2.2.0.0",
-            }
+                assert isinstance(data, dict)
+                assert data == {
+                    "name": "KeEnergy.WebHmi_2.2.0.0",
+                }
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/swupdate?action=getHmiInstalled",
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/swupdate?action=getHmiInstalled",
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_device_info(self) -> None:
@@ -210,24 +210,24 @@ class TestHappyPathSystemSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            response: dict[str, Any] = await client.system.get_device_info()
-
-            assert isinstance(response, dict)
-            assert response == {
-                "revNo": 2,
-                "orderNo": 12345678,
-                "serNo": 12345678,
-                "name": "MOCKED-NAME",
-                "variantNo": 0,
-            }
-
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/deviceControl?action=getDeviceInfo",
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                response: dict[str, Any] = await client.system.get_device_info()
+
+                assert isinstance(response, dict)
+                assert response == {
+                    "revNo": 2,
+                    "orderNo": 12345678,
+                    "serNo": 12345678,
+                    "name": "MOCKED-NAME",
+                    "variantNo": 0,
+                }
+
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/deviceControl?action=getDeviceInfo",
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_number_of_buffer_tanks(self) -> None:
@@ -251,19 +251,19 @@ class TestHappyPathSystemSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.system.get_number_of_buffer_tanks()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.system.get_number_of_buffer_tanks()
 
-            assert isinstance(data, int)
-            assert data == 2  # noqa: PLR2004
+                assert isinstance(data, int)
+                assert data == 2  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfBuffers", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfBuffers", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_number_of_hot_water_tanks(self) -> None:
@@ -287,19 +287,19 @@ class TestHappyPathSystemSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.system.get_number_of_hot_water_tanks()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.system.get_number_of_hot_water_tanks()
 
-            assert isinstance(data, int)
-            assert data == 2  # noqa: PLR2004
+                assert isinstance(data, int)
+                assert data == 2  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHotWaterTanks", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHotWaterTanks", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_number_of_heat_pumps(self) -> None:
@@ -323,19 +323,19 @@ class TestHappyPathSystemSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.system.get_number_of_heat_pumps()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.system.get_number_of_heat_pumps()
 
-            assert isinstance(data, int)
-            assert data == 1
+                assert isinstance(data, int)
+                assert data == 1
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHeatPumps", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHeatPumps", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_number_of_heating_circuits(self) -> None:
@@ -359,19 +359,19 @@ class TestHappyPathSystemSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.system.get_number_of_heating_circuits()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.system.get_number_of_heating_circuits()
 
-            assert isinstance(data, int)
-            assert data == 3  # noqa: PLR2004
+                assert isinstance(data, int)
+                assert data == 3  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHeatingCircuits", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfHeatingCircuits", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_number_of_external_heat_sources(self) -> None:
@@ -393,19 +393,19 @@ class TestHappyPathSystemSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.system.get_number_of_external_heat_sources()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.system.get_number_of_external_heat_sources()
 
-            assert isinstance(data, int)
-            assert data == 1
+                assert isinstance(data, int)
+                assert data == 1
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfExtHeatSources", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfExtHeatSources", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_number_of_switch_valves(self) -> None:
@@ -416,19 +416,19 @@ class TestHappyPathSystemSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.system.get_number_of_switch_valves()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.system.get_number_of_switch_valves()
 
-            assert isinstance(data, int)
-            assert data == 1
+                assert isinstance(data, int)
+                assert data == 1
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfSwitchValves", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.options.systemNumberOfSwitchValves", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -461,19 +461,19 @@ class TestHappyPathSystemSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.system.has_photovoltaics(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.system.has_photovoltaics(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.options.hasPhotovoltaics", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.options.hasPhotovoltaics", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -506,19 +506,19 @@ class TestHappyPathSystemSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.system.has_outdoor_temperature(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.system.has_outdoor_temperature(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.options.hasOutdoorTemp", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.options.hasOutdoorTemp", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -550,19 +550,19 @@ class TestHappyPathSystemSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int | str = await client.system.get_operating_mode(human_readable=human_readable)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int | str = await client.system.get_operating_mode(human_readable=human_readable)
 
-            assert isinstance(data, (int | str))
-            assert data == expected_value
+                assert isinstance(data, (int | str))
+                assert data == expected_value
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sParam.param.operatingMode", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sParam.param.operatingMode", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -581,17 +581,17 @@ class TestHappyPathSystemSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            await client.system.set_operating_mode(operating_mode)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                await client.system.set_operating_mode(operating_mode)
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars?action=set",
-                data='[{"name": "APPL.CtrlAppl.sParam.param.operatingMode", "value": "%s"}]'  # noqa: UP031
-                % expected_value,
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars?action=set",
+                    data='[{"name": "APPL.CtrlAppl.sParam.param.operatingMode", "value": "%s"}]'  # noqa: UP031
+                    % expected_value,
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_cpu_usage(self) -> None:
@@ -612,19 +612,19 @@ class TestHappyPathSystemSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.system.get_cpu_usage()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.system.get_cpu_usage()
 
-            assert isinstance(data, float)
-            assert data == 2.7  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 2.7  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sProcData.globalCpuTimePercent", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sProcData.globalCpuTimePercent", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_webview_cpu_usage(self) -> None:
@@ -645,19 +645,19 @@ class TestHappyPathSystemSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.system.get_webview_cpu_usage()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.system.get_webview_cpu_usage()
 
-            assert isinstance(data, float)
-            assert data == 3.4  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 3.4  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sProcData.processStatus[0].cpuTimePercent", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sProcData.processStatus[0].cpuTimePercent", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_webserver_cpu_usage(self) -> None:
@@ -678,19 +678,19 @@ class TestHappyPathSystemSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.system.get_webserver_cpu_usage()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.system.get_webserver_cpu_usage()
 
-            assert isinstance(data, float)
-            assert data == 6.7  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 6.7  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sProcData.processStatus[1].cpuTimePercent", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sProcData.processStatus[1].cpuTimePercent", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_control_cpu_usage(self) -> None:
@@ -711,19 +711,19 @@ class TestHappyPathSystemSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: float = await client.system.get_control_cpu_usage()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: float = await client.system.get_control_cpu_usage()
 
-            assert isinstance(data, float)
-            assert data == 0.7  # noqa: PLR2004
+                assert isinstance(data, float)
+                assert data == 0.7  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sProcData.processStatus[2].cpuTimePercent", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sProcData.processStatus[2].cpuTimePercent", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_ram_usage(self) -> None:
@@ -744,19 +744,19 @@ class TestHappyPathSystemSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.system.get_ram_usage()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.system.get_ram_usage()
 
-            assert isinstance(data, int)
-            assert data == 6432  # noqa: PLR2004
+                assert isinstance(data, int)
+                assert data == 6432  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sProcData.RAMstatus.tmpfs", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sProcData.RAMstatus.tmpfs", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_free_ram(self) -> None:
@@ -777,19 +777,19 @@ class TestHappyPathSystemSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            data: int = await client.system.get_free_ram()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                data: int = await client.system.get_free_ram()
 
-            assert isinstance(data, int)
-            assert data == 100060  # noqa: PLR2004
+                assert isinstance(data, int)
+                assert data == 100060  # noqa: PLR2004
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/var/readWriteVars",
-                data='[{"name": "APPL.CtrlAppl.sProcData.totFreeRAM", "attr": "1"}]',
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data='[{"name": "APPL.CtrlAppl.sProcData.totFreeRAM", "attr": "1"}]',
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
     @pytest.mark.asyncio
     async def test_get_timezone(self) -> None:
@@ -800,18 +800,18 @@ class TestHappyPathSystemSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-            response: str = await client.system.get_timezone()
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                response: str = await client.system.get_timezone()
 
-            assert isinstance(response, str)
-            assert response == "Europe/Vienna"
+                assert isinstance(response, str)
+                assert response == "Europe/Vienna"
 
-            mock_keenergy_api.assert_called_once_with(
-                url="http://mocked-host/dateTime?action=getTimeZone",
-                method="POST",
-                auth=None,
-                ssl=False,
-            )
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/dateTime?action=getTimeZone",
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
 
 
 @pytest.mark.unhappy
@@ -833,15 +833,15 @@ class TestUnhappyPathSystemSection:
                 headers={"Content-Type": "application/json;charset=utf-8"},
             )
 
-            client: KebaKeEnergyAPI = KebaKeEnergyAPI(host="mocked-host")
-
-            with pytest.raises(
-                APIError,
-                match=(
-                    "Invalid value! Allowed values are "
-                    r"\['SETUP', '-1', 'STANDBY', '0', 'SUMMER', '1', 'AUTO_HEAT', '2', 'AUTO_COOL', '3', 'AUTO', '4']"
-                ),
-            ):
-                await client.system.set_operating_mode(operating_mode)
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                with pytest.raises(
+                    APIError,
+                    match=(
+                        "Invalid value! Allowed values are "
+                        r"\['SETUP', '-1', 'STANDBY', '0', 'SUMMER', '1', "
+                        r"'AUTO_HEAT', '2', 'AUTO_COOL', '3', 'AUTO', '4']"
+                    ),
+                ):
+                    await client.system.set_operating_mode(operating_mode)
 
-            mock_keenergy_api.assert_not_called()
+                mock_keenergy_api.assert_not_called()
@@ -0,0 +1,196 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+from aioresponses import aioresponses
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.error import APIError
+from keba_keenergy_api.fleet import FleetResult
+from keba_keenergy_api.fleet import KebaFleet
+from tests.test_api_data import get_positions_payload
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+
+class TestKebaFleet:
+    @pytest.mark.asyncio
+    async def test_add(self) -> None:
+        async with KebaFleet() as fleet:
+            client: KebaKeEnergyAPI = fleet.add("ap4400-1.local", "test", "test", ssl=True)
+            fleet.add("ap4400-2.local")
+
+            assert list(fleet.clients) == ["ap4400-1.local", "ap4400-2.local"]
+            assert client.session is fleet.get_session()
+            assert client.device_url == "https://ap4400-1.local"
+            assert fleet.clients["ap4400-2.local"].session is client.session
+
+            fleet.remove("ap4400-2.local")
+
+            assert list(fleet.clients) == ["ap4400-1.local"]
+
+        assert client.session is not None
+        assert client.session.closed
+
+    @pytest.mark.asyncio
+    async def test_poll_all(self) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://ap4400-1.local/var/readWriteVars",
+                payload=get_positions_payload(heat_pumps=2),
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            async with KebaFleet(jitter=0) as fleet:
+                fleet.add("ap4400-1.local")
+                fleet.add("ap4400-2.local")
+
+                results: list[FleetResult[int]] = [
+                    result
+                    async for result in fleet.poll_all(
+                        lambda client: client.system.get_number_of_heat_pumps(),
+                    )
+                ]
+
+        first, second = sorted(results, key=lambda result: result.host)
+
+        assert first == FleetResult(host="ap4400-1.local", value=2)
+        assert second.value is None
+        assert isinstance(second.error, APIError)
+
+    @pytest.mark.asyncio
+    async def test_poll_all_with_invalid_response(self) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://ap4400-1.local/var/readWriteVars",
+                body="[{",
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            for host in ("ap4400-2.local", "ap4400-3.local"):
+                mock_keenergy_api.post(
+                    f"http://{host}/var/readWriteVars",
+                    payload=get_positions_payload(heat_pumps=2),
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+            async with KebaFleet(jitter=0) as fleet:
+                for host in ("ap4400-1.local", "ap4400-2.local", "ap4400-3.local"):
+                    fleet.add(host)
+
+                results: list[FleetResult[int]] = [
+                    result
+                    async for result in fleet.poll_all(
+                        lambda client: client.system.get_number_of_heat_pumps(),
+                    )
+                ]
+
+        first, second, third = sorted(results, key=lambda result: result.host)
+
+        assert first.value is None
+        assert isinstance(first.error, ValueError)
+        assert second == FleetResult(host="ap4400-2.local", value=2)
+        assert third == FleetResult(host="ap4400-3.local", value=2)
+
+    @pytest.mark.asyncio
+    async def test_poll_all_with_unknown_host(self) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://ap4400-1.local/var/readWriteVars",
+                payload=get_positions_payload(heat_pumps=2),
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            async with KebaFleet(jitter=0) as fleet:
+                fleet.add("ap4400-1.local")
+
+                results: list[FleetResult[int]] = [
+                    result
+                    async for result in fleet.poll_all(
+                        lambda client: client.system.get_number_of_heat_pumps(),
+                        hosts=["ap4400-1.local", "ap4400-9.local"],
+                    )
+                ]
+
+        first, second = sorted(results, key=lambda result: result.host)
+
+        assert first == FleetResult(host="ap4400-1.local", value=2)
+        assert second.value is None
+        assert isinstance(second.error, APIError)
+        assert str(second.error) == "Unknown host 'ap4400-9.local'"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("hosts", "limit", "limit_per_host", "expected"),
+        [
+            (["ap4400-1.local", "ap4400-2.local", "ap4400-3.local"], 2, 1, 2),
+            (["ap4400-1.local", "ap4400-1.local", "ap4400-1.local"], 10, 1, 1),
+            (["ap4400-1.local", "ap4400-1.local", "ap4400-2.local"], 10, 2, 3),
+        ],
+    )
+    async def test_poll_all_with_limits(self, hosts: list[str], limit: int, limit_per_host: int, expected: int) -> None:
+        running: list[int] = [0]
+        concurrency: list[int] = []
+
+        async def poll(_: KebaKeEnergyAPI) -> None:
+            running[0] += 1
+            concurrency.append(running[0])
+            await asyncio.sleep(0.01)
+            running[0] -= 1
+
+        async with KebaFleet(limit=limit, limit_per_host=limit_per_host, jitter=0) as fleet:
+            for host in set(hosts):
+                fleet.add(host)
+
+            assert len([result async for result in fleet.poll_all(poll, hosts)]) == len(hosts)
+
+        assert max(concurrency) == expected
+
+    @pytest.mark.asyncio
+    async def test_poll_all_with_jitter(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        delays: list[tuple[float, float]] = []
+
+        def uniform(a: float, b: float) -> float:
+            delays.append((a, b))
+            return len(delays) / 100
+
+        async def poll(client: KebaKeEnergyAPI) -> str:
+            return client.host
+
+        monkeypatch.setattr("keba_keenergy_api.fleet.random.uniform", uniform)
+
+        async with KebaFleet(jitter=0.5) as fleet:
+            fleet.add("ap4400-1.local")
+            fleet.add("ap4400-2.local")
+            fleet.add("ap4400-3.local")
+
+            results: list[FleetResult[str]] = [result async for result in fleet.poll_all(poll)]
+
+        assert delays == [(0, 0.5)] * 3
+        assert [result.value for result in results] == ["ap4400-1.local", "ap4400-2.local", "ap4400-3.local"]
+
+    @pytest.mark.asyncio
+    async def test_poll_all_cancel(self) -> None:
+        cancelled: list[str] = []
+
+        async def poll(client: KebaKeEnergyAPI) -> str:
+            if client.host == "ap4400-2.local":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(client.host)
+                    raise
+
+            return client.host
+
+        async with KebaFleet(jitter=0) as fleet:
+            fleet.add("ap4400-1.local")
+            fleet.add("ap4400-2.local")
+
+            results: AsyncGenerator[FleetResult[str], None] = fleet.poll_all(poll)
+            assert (await anext(results)).value == "ap4400-1.local"
+            await results.aclose()
+            await asyncio.sleep(0)
+
+        assert cancelled == ["ap4400-2.local"]
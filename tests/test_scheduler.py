@@ -0,0 +1,193 @@
+import json
+import math
+
+import pytest
+from aioresponses import aioresponses
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.constants import HeatPump
+from keba_keenergy_api.constants import System
+from keba_keenergy_api.scheduler import DEFAULT_POLL_POLICIES
+from keba_keenergy_api.scheduler import PollScheduler
+from keba_keenergy_api.scheduler import SLOW_INTERVAL
+from keba_keenergy_api.scheduler import STATIC_INTERVAL
+from keba_keenergy_api.subscription import ValueChange
+from keba_keenergy_api.subscription import Variable
+from tests.test_subscription import TIMESTAMP
+
+NAME: str = "APPL.CtrlAppl.sParam.heatpump[0].param.name"
+FLOW_TEMPERATURE: str = "APPL.CtrlAppl.sParam.heatpump[0].TempHeatFlow.values.actValue"
+
+
+class TestPollScheduler:
+    @pytest.mark.parametrize(
+        ("section", "expected"),
+        [
+            (HeatPump.NAME, STATIC_INTERVAL),
+            (HeatPump.HAS_ACTIVE_COOLING, STATIC_INTERVAL),
+            (HeatPump.HAS_COMPRESSOR_FAILURE, 5),
+            (System.HEAT_PUMP_NUMBERS, STATIC_INTERVAL),
+            (HeatPump.HEATING_ENERGY, SLOW_INTERVAL),
+            (HeatPump.OPERATING_TIME, SLOW_INTERVAL),
+            (HeatPump.CONSUMING_EXCESS_ENERGY, 5),
+            (HeatPump.COMPRESSOR, 5),
+        ],
+    )
+    def test_get_interval_with_default_policies(self, section: HeatPump | System, expected: float) -> None:
+        scheduler: PollScheduler = PollScheduler([], interval=5, policies=DEFAULT_POLL_POLICIES)
+        assert scheduler.get_interval(section) == expected
+
+    def test_default_policies(self) -> None:
+        for member in (
+            HeatPump.HEAT_METER_TYPE,
+            HeatPump.COOL_METER_TYPE,
+            HeatPump.HOT_WATER_METER_TYPE,
+            HeatPump.ELECTRIC_ENERGY_METER_TYPE,
+        ):
+            assert DEFAULT_POLL_POLICIES[member] == STATIC_INTERVAL
+
+        for member in (
+            HeatPump.HEATING_ENERGY_CONSUMPTION,
+            HeatPump.COOLING_ENERGY_CONSUMPTION,
+            HeatPump.HOT_WATER_ENERGY_CONSUMPTION,
+            HeatPump.TOTAL_ENERGY_CONSUMPTION,
+            HeatPump.EXCESS_ENERGY_CONSUMPTION,
+            HeatPump.HEATING_EXCESS_ENERGY_CONSUMPTION,
+            HeatPump.TOTAL_THERMAL_ENERGY,
+        ):
+            assert DEFAULT_POLL_POLICIES[member] == SLOW_INTERVAL
+
+        assert HeatPump.CONSUMING_EXCESS_ENERGY not in DEFAULT_POLL_POLICIES
+
+    def test_get_interval(self) -> None:
+        scheduler: PollScheduler = PollScheduler(
+            [],
+            interval=5,
+            policies={HeatPump: 10, HeatPump.COMPRESSOR: 1},
+        )
+
+        assert scheduler.get_interval(HeatPump.COMPRESSOR) == 1
+        assert scheduler.get_interval(HeatPump.STATE) == 10  # noqa: PLR2004
+        assert scheduler.get_interval(System.OUTDOOR_TEMPERATURE) == 5  # noqa: PLR2004
+
+    def test_get_due(self) -> None:
+        scheduler: PollScheduler = PollScheduler(
+            [
+                Variable(section=HeatPump.NAME, position=1),
+                Variable(section=HeatPump.COMPRESSOR, position=1),
+                Variable(section=HeatPump.HEATING_ENERGY, position=1),
+            ],
+            interval=5,
+            policies=DEFAULT_POLL_POLICIES,
+        )
+
+        assert scheduler.get_due(100) == [0, 1, 2]
+        assert scheduler.get_delay(100) == 0
+
+        scheduler.update([0, 1, 2], [], 100)
+
+        assert scheduler.get_due(104) == []
+        assert scheduler.get_delay(104) == 1
+        assert scheduler.get_due(105) == [1]
+
+        scheduler.update([1], [], 105)
+
+        assert scheduler.get_due(400) == [1, 2]
+
+    def test_get_delay_without_polled_variables(self) -> None:
+        scheduler: PollScheduler = PollScheduler(
+            [Variable(section=HeatPump.NAME, position=1)],
+            interval=5,
+            policies=DEFAULT_POLL_POLICIES,
+        )
+        scheduler.update([0], [], 100)
+
+        assert scheduler.get_due(1e9) == []
+        assert scheduler.get_delay(100) == math.inf
+
+    def test_update_adaptive(self) -> None:
+        variables: list[Variable] = [
+            Variable(section=HeatPump.NAME, position=1),
+            Variable(section=HeatPump.COMPRESSOR, position=1),
+            Variable(section=HeatPump.FLOW_TEMPERATURE, position=1),
+        ]
+        scheduler: PollScheduler = PollScheduler(
+            variables,
+            interval=4,
+            policies=DEFAULT_POLL_POLICIES,
+            adaptive=True,
+            min_interval=1,
+            max_interval=8,
+        )
+        changes: list[ValueChange] = [
+            ValueChange(HeatPump.NAME, 1, 0, "WPS", TIMESTAMP),
+            ValueChange(HeatPump.COMPRESSOR, 1, 0, 50.0, TIMESTAMP),
+        ]
+
+        # The first poll is the baseline and doesn't adapt the intervals
+        scheduler.update([0, 1, 2], changes, 0)
+        assert scheduler.intervals == [STATIC_INTERVAL, 4, 4]
+
+        scheduler.update([1, 2], changes[1:], 0)
+        assert scheduler.intervals == [STATIC_INTERVAL, 2, 6]
+
+        scheduler.update([1, 2], changes[1:], 0)
+        assert scheduler.intervals == [STATIC_INTERVAL, 1, 8]
+        assert scheduler.get_due(1) == [1]
+
+
+class TestSubscribeWithPolicies:
+    @pytest.mark.asyncio
+    async def test_subscribe(self) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[{"name": NAME, "value": "WPS"}, {"name": FLOW_TEMPERATURE, "value": "30.5"}],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[{"name": FLOW_TEMPERATURE, "value": "31"}],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                changes: list[list[float | int | str]] = []
+
+                async for _changes in client.subscribe(
+                    [HeatPump.NAME, HeatPump.FLOW_TEMPERATURE],
+                    position=1,
+                    interval=0,
+                    policies=DEFAULT_POLL_POLICIES,
+                ):
+                    changes.append([change.value for change in _changes])
+
+                    if len(changes) == 2:  # noqa: PLR2004
+                        break
+
+                assert changes == [["WPS", 30.5], [31.0]]
+
+                mock_keenergy_api.assert_called_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=json.dumps([{"name": FLOW_TEMPERATURE, "attr": "0"}]),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
+
+    @pytest.mark.asyncio
+    async def test_subscribe_stops_without_polled_variables(self) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[{"name": NAME, "value": "WPS"}],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                changes: list[list[ValueChange]] = [
+                    _changes async for _changes in client.subscribe(HeatPump.NAME, 1, policies=DEFAULT_POLL_POLICIES)
+                ]
+
+                assert [[change.value for change in _changes] for _changes in changes] == [["WPS"]]
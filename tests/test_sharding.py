@@ -0,0 +1,223 @@
+import os
+import queue
+import signal
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from typing import Any
+from typing import TYPE_CHECKING
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aioresponses import aioresponses
+
+from keba_keenergy_api.codec import STDLIB_CODEC
+from keba_keenergy_api.constants import HeatPump
+from keba_keenergy_api.error import APIError
+from keba_keenergy_api.sharding import ReadCommand
+from keba_keenergy_api.sharding import ShardedFleet
+from keba_keenergy_api.sharding import WorkerOptions
+from keba_keenergy_api.sharding import get_channel_codec
+from keba_keenergy_api.sharding import get_shards
+from keba_keenergy_api.sharding import run_worker
+
+if TYPE_CHECKING:
+    from keba_keenergy_api.fleet import FleetResult
+
+STATE: str = "APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState"
+
+
+async def handle_read_write_vars(request: web.Request) -> web.Response:
+    """Answer every requested variable with the heat pump state `defrost`."""
+    payload: list[dict[str, str]] = await request.json()
+    return web.json_response([{"name": item["name"], "value": "3"} for item in payload])
+
+
+@pytest_asyncio.fixture
+async def hosts() -> AsyncIterator[list[str]]:
+    """Serve a stand-in API on two loopback addresses."""
+    app: web.Application = web.Application()
+    app.router.add_post("/var/readWriteVars", handle_read_write_vars)
+
+    runner: web.AppRunner = web.AppRunner(app)
+    await runner.setup()
+
+    _hosts: list[str] = []
+
+    for address in ("127.0.0.1", "127.0.0.2"):
+        site: web.TCPSite = web.TCPSite(runner, address, 0)
+        await site.start()
+        _hosts.append(f"{address}:{site._server.sockets[0].getsockname()[1]}")  # type: ignore[union-attr]  # noqa: SLF001
+
+    yield _hosts
+
+    await runner.cleanup()
+
+
+class TestSharding:
+    def test_get_shards(self) -> None:
+        hosts: list[str] = ["ap4400-1.local", "ap4400-2.local", "ap4400-3.local"]
+
+        assert get_shards(hosts, 2) == [["ap4400-1.local", "ap4400-3.local"], ["ap4400-2.local"]]
+        assert get_shards(hosts, 4) == [["ap4400-1.local"], ["ap4400-2.local"], ["ap4400-3.local"]]
+        assert get_shards([], 4) == []
+
+    def test_get_channel_codec(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        assert get_channel_codec("json") is STDLIB_CODEC
+
+        def import_module(name: str) -> None:
+            raise ImportError(name)
+
+        monkeypatch.setattr("keba_keenergy_api.codec.import_module", import_module)
+
+        assert get_channel_codec() is STDLIB_CODEC
+
+    @pytest.mark.asyncio
+    async def test_run_worker(self) -> None:
+        commands: queue.Queue[Any] = queue.Queue()
+        commands.put(ReadCommand(request=["HeatPump.STATE"], position=1, human_readable=False))
+        commands.put(None)
+
+        results: queue.Queue[Any] = queue.Queue()
+
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://ap4400-1.local/var/readWriteVars",
+                payload=[{"name": STATE, "value": "3"}],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            await run_worker(
+                ["ap4400-1.local", "ap4400-2.local", "ap4400-3.local"],
+                WorkerOptions(limit=10, limit_per_host=1, jitter=0, batch_size=2, codec="json", client_options={}),
+                commands,
+                results,
+            )
+
+        batches: list[Any] = [results.get_nowait() for _ in range(results.qsize())]
+
+        assert batches[-1] is None
+        items: list[list[Any]] = sorted(item for batch in batches[:-1] for item in STDLIB_CODEC.decode(batch))
+
+        assert items[0][0] == "ap4400-1.local"
+        assert items[0][1]["heat_pump"]["state"] == [{"value": 3, "attributes": {}}]
+        assert items[0][2] is None
+        assert items[1][0] == "ap4400-2.local"
+        assert items[1][2].startswith("Connection refused")
+        assert [len(batch) for batch in map(STDLIB_CODEC.decode, batches[:-1])] == [2, 1]
+
+    @pytest.mark.asyncio
+    async def test_run_worker_with_invalid_response(self) -> None:
+        commands: queue.Queue[Any] = queue.Queue()
+        commands.put(ReadCommand(request=["HeatPump.STATE"], position=1, human_readable=False))
+        commands.put(None)
+
+        results: queue.Queue[Any] = queue.Queue()
+
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://ap4400-1.local/var/readWriteVars",
+                body="[{",
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+            mock_keenergy_api.post(
+                "http://ap4400-2.local/var/readWriteVars",
+                payload=[{"name": STATE, "value": "3"}],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            await run_worker(
+                ["ap4400-1.local", "ap4400-2.local"],
+                WorkerOptions(limit=10, limit_per_host=1, jitter=0, batch_size=64, codec="json", client_options={}),
+                commands,
+                results,
+            )
+
+        batch: Any = results.get_nowait()
+
+        assert results.get_nowait() is None
+
+        first, second = sorted(STDLIB_CODEC.decode(batch))
+
+        assert first[0] == "ap4400-1.local"
+        assert first[1] is None
+        assert first[2] is not None
+        assert second[0] == "ap4400-2.local"
+        assert second[1]["heat_pump"]["state"] == [{"value": 3, "attributes": {}}]
+        assert second[2] is None
+
+
+class TestShardedFleet:
+    @pytest.mark.asyncio
+    async def test_poll_all(self, hosts: list[str]) -> None:
+        async with ShardedFleet(hosts, processes=2, jitter=0, codec="json") as fleet:
+            assert fleet.shards == [[hosts[0]], [hosts[1]]]
+
+            for _ in range(2):
+                results: list[FleetResult[Any]] = [result async for result in fleet.poll_all(HeatPump.STATE, [1])]
+
+                assert sorted(result.host for result in results) == hosts
+                assert [result.value["heat_pump"]["state"] for result in results if result.value] == [
+                    [{"value": "defrost", "attributes": {"raw_value": 3}}],
+                ] * 2
+
+    @pytest.mark.asyncio
+    async def test_poll_all_with_error(self, hosts: list[str]) -> None:
+        async with ShardedFleet([*hosts, "127.0.0.3:1"], processes=1, jitter=0, batch_size=1) as fleet:
+            # Stop the iteration early, the remaining results are discarded
+            async for _ in fleet.poll_all(HeatPump.STATE, [1]):
+                break
+
+            errors: list[Exception | None] = [result.error async for result in fleet.poll_all(HeatPump.STATE, [1])]
+
+            assert len(errors) == 3  # noqa: PLR2004
+            assert sum(isinstance(error, APIError) for error in errors) == 1
+
+    @pytest.mark.asyncio
+    async def test_poll_all_with_exited_worker(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(ShardedFleet, "WORKER_CHECK_INTERVAL", 0.1)
+
+        async with ShardedFleet(["ap4400-1.local"], processes=1) as fleet:
+            start: Callable[[], None] = fleet.start
+
+            def start_and_exit() -> None:
+                # The worker process exits during the poll
+                start()
+                fleet._processes[0].kill()  # noqa: SLF001
+                fleet._processes[0].join()  # noqa: SLF001
+
+            monkeypatch.setattr(fleet, "start", start_and_exit)
+
+            with pytest.raises(APIError, match="A worker process of the sharded fleet exited"):
+                [result async for result in fleet.poll_all(HeatPump.STATE, [1])]
+
+    @pytest.mark.asyncio
+    async def test_poll_all_restarts_exited_worker(self, hosts: list[str]) -> None:
+        async with ShardedFleet(hosts, processes=2, jitter=0, codec="json") as fleet:
+            [result async for result in fleet.poll_all(HeatPump.STATE, [1])]
+
+            exited: Any = fleet._processes[0]  # noqa: SLF001
+            exited.kill()
+            exited.join()
+
+            results: list[FleetResult[Any]] = [result async for result in fleet.poll_all(HeatPump.STATE, [1])]
+
+            assert exited not in fleet._processes  # noqa: SLF001
+            assert all(process.is_alive() for process in fleet._processes)  # noqa: SLF001
+            assert sorted(result.host for result in results) == hosts
+            assert all(result.error is None for result in results)
+
+    @pytest.mark.asyncio
+    async def test_close_with_stuck_worker(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(ShardedFleet, "WORKER_CHECK_INTERVAL", 0.1)
+
+        fleet: ShardedFleet = ShardedFleet(["ap4400-1.local"], processes=1)
+        fleet.start()
+
+        process: Any = fleet._processes[0]  # noqa: SLF001
+        os.kill(process.pid, signal.SIGSTOP)
+
+        await fleet.close()
+        process.join()
+
+        assert process.exitcode == -signal.SIGKILL
@@ -0,0 +1,173 @@
+import json
+from dataclasses import asdict
+from enum import Enum
+from typing import Any
+
+import pytest
+from aioresponses import aioresponses
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.constants import BufferTank
+from keba_keenergy_api.constants import ExternalHeatSource
+from keba_keenergy_api.constants import HeatCircuit
+from keba_keenergy_api.constants import HeatPump
+from keba_keenergy_api.constants import HotWaterTank
+from keba_keenergy_api.constants import PassiveCooling
+from keba_keenergy_api.constants import Photovoltaics
+from keba_keenergy_api.constants import SECTION_METADATA
+from keba_keenergy_api.constants import SolarCircuit
+from keba_keenergy_api.constants import SwitchValve
+from keba_keenergy_api.constants import System
+from keba_keenergy_api.error import APIError
+from keba_keenergy_api.snapshots import BufferTankSnapshot
+from keba_keenergy_api.snapshots import ExternalHeatSourceSnapshot
+from keba_keenergy_api.snapshots import HeatCircuitSnapshot
+from keba_keenergy_api.snapshots import HeatPumpSnapshot
+from keba_keenergy_api.snapshots import HotWaterTankSnapshot
+from keba_keenergy_api.snapshots import PassiveCoolingSnapshot
+from keba_keenergy_api.snapshots import PhotovoltaicsSnapshot
+from keba_keenergy_api.snapshots import SolarCircuitSnapshot
+from keba_keenergy_api.snapshots import SwitchValveSnapshot
+from keba_keenergy_api.snapshots import SystemSnapshot
+
+RAW_VALUES: dict[type, str] = {float: "21.456", int: "2", str: "text"}
+
+
+def get_snapshot_payload(section: type[Enum], position: int) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Get the read payload and the expected snapshot values for all members of a section."""
+    payload: list[dict[str, Any]] = []
+    expected: dict[str, Any] = {}
+
+    for member in section:
+        if member.name.startswith("_"):
+            continue
+
+        metadata = SECTION_METADATA[member]  # type: ignore[index]
+        raw_value: str = RAW_VALUES[member.value.value_type]
+        value: float | int | str = metadata.convert(raw_value)
+
+        if metadata.position is None:
+            names: list[str] = [member.value.value]
+        elif metadata.quantity > 1:
+            idx: int = position - 1
+            names = [member.value.value % sub_idx for sub_idx in range(idx * 2, metadata.quantity + idx * 2)]
+        else:
+            names = [member.value.value % (position - 1)]
+
+        payload += [{"name": name, "attr": "0", "value": raw_value} for name in names]
+        expected[member.name.lower()] = (value,) * metadata.quantity if metadata.quantity > 1 else value
+
+    return payload, expected
+
+
+class TestSnapshots:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("attribute", "section", "snapshot", "position"),
+        [
+            ("system", System, SystemSnapshot, None),
+            ("buffer_tank", BufferTank, BufferTankSnapshot, 1),
+            ("hot_water_tank", HotWaterTank, HotWaterTankSnapshot, 2),
+            ("heat_pump", HeatPump, HeatPumpSnapshot, 1),
+            ("heat_circuit", HeatCircuit, HeatCircuitSnapshot, 2),
+            ("solar_circuit", SolarCircuit, SolarCircuitSnapshot, 2),
+            ("external_heat_source", ExternalHeatSource, ExternalHeatSourceSnapshot, 1),
+            ("switch_valve", SwitchValve, SwitchValveSnapshot, 1),
+            ("passive_cooling", PassiveCooling, PassiveCoolingSnapshot, 1),
+            ("photovoltaics", Photovoltaics, PhotovoltaicsSnapshot, None),
+        ],
+    )
+    async def test_get_all(
+        self,
+        attribute: str,
+        section: type[Enum],
+        snapshot: type[Any],
+        position: int | None,
+    ) -> None:
+        payload, expected = get_snapshot_payload(section, position or 1)
+
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[{"name": item["name"], "value": item["value"]} for item in payload],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                endpoints: Any = getattr(client, attribute)
+
+                if position is None:
+                    data: Any = await endpoints.get_all(human_readable=False)
+                else:
+                    data = await endpoints.get_all(position, human_readable=False)
+
+                assert isinstance(data, snapshot)
+                assert not hasattr(data, "__dict__")
+                assert asdict(data) == expected
+
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=json.dumps([{"name": item["name"], "attr": item["attr"]} for item in payload]),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
+
+    @pytest.mark.asyncio
+    async def test_get_all_human_readable(self) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[{"name": "APPL.CtrlAppl.sParam.switchvalve[0].values.actPosition", "value": "1"}],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                assert await client.switch_valve.get_all() == SwitchValveSnapshot(position="open")
+
+    @pytest.mark.asyncio
+    async def test_get_all_with_unsupported_members(self) -> None:
+        payload, expected = get_snapshot_payload(PassiveCooling, 1)
+        unsupported: PassiveCooling = PassiveCooling.TEMPERATURE
+        supported: list[dict[str, Any]] = [item for item in payload if item["name"] != unsupported.value.value % 0]
+
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[{"name": item["name"], "value": item["value"]} for item in supported],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                client.capabilities[unsupported] = False
+                data: PassiveCoolingSnapshot = await client.passive_cooling.get_all(human_readable=False)
+
+                assert asdict(data) == expected | {unsupported.name.lower(): None}
+
+                mock_keenergy_api.assert_called_once_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=json.dumps([{"name": item["name"], "attr": item["attr"]} for item in supported]),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
+
+    @pytest.mark.asyncio
+    async def test_get_all_with_members(self) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[{"name": "APPL.CtrlAppl.sParam.heatpump[0].values.heatpumpState", "value": "3"}],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                assert await client.heat_pump.get_all(members=[HeatPump.STATE]) == HeatPumpSnapshot(state="defrost")
+
+                client.capabilities[HeatPump.STATE] = False
+                assert await client.heat_pump.get_all(members=[HeatPump.STATE]) == HeatPumpSnapshot()
+
+                with pytest.raises(APIError, match="Invalid members"):
+                    await client.heat_pump.get_all(members=[System.OUTDOOR_TEMPERATURE])  # type: ignore[list-item]
+
+                mock_keenergy_api.assert_called_once()
@@ -0,0 +1,135 @@
+from datetime import datetime
+from datetime import timezone
+
+import pytest
+from aioresponses import aioresponses
+
+from keba_keenergy_api.api import KebaKeEnergyAPI
+from keba_keenergy_api.constants import HeatPump
+from keba_keenergy_api.constants import Section
+from keba_keenergy_api.constants import SolarCircuit
+from keba_keenergy_api.constants import System
+from keba_keenergy_api.error import APIError
+from keba_keenergy_api.subscription import ChangeTracker
+from keba_keenergy_api.subscription import ValueChange
+from keba_keenergy_api.subscription import Variable
+from tests.test_api_data import get_heat_pump_flow_temperature_payload
+from tests.test_api_data import get_positions_payload
+
+TIMESTAMP: datetime = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class TestChangeTracker:
+    def test_update(self) -> None:
+        tracker: ChangeTracker = ChangeTracker(
+            [
+                Variable(section=HeatPump.STATE, position=1),
+                Variable(section=System.OUTDOOR_TEMPERATURE, position=None),
+            ],
+        )
+
+        assert tracker.update([{"value": "3"}, {"value": "10.001"}], TIMESTAMP) == [
+            ValueChange(HeatPump.STATE, 1, 0, "defrost", TIMESTAMP),
+            ValueChange(System.OUTDOOR_TEMPERATURE, None, 0, 10.0, TIMESTAMP),
+        ]
+        assert tracker.update([{"value": "3"}, {"value": "10.002"}], TIMESTAMP) == []
+        assert tracker.update([{"value": "1"}, {"value": "10.5"}], TIMESTAMP) == [
+            ValueChange(HeatPump.STATE, 1, 0, "flow", TIMESTAMP),
+            ValueChange(System.OUTDOOR_TEMPERATURE, None, 0, 10.5, TIMESTAMP),
+        ]
+
+    def test_update_with_indexes(self) -> None:
+        tracker: ChangeTracker = ChangeTracker(
+            [
+                Variable(section=HeatPump.STATE, position=1),
+                Variable(section=System.OUTDOOR_TEMPERATURE, position=None),
+            ],
+        )
+
+        assert tracker.update([{"value": "10.5"}], TIMESTAMP, indexes=[1]) == [
+            ValueChange(System.OUTDOOR_TEMPERATURE, None, 0, 10.5, TIMESTAMP),
+        ]
+        assert tracker.update([{"value": "3"}, {"value": "10.5"}], TIMESTAMP) == [
+            ValueChange(HeatPump.STATE, 1, 0, "defrost", TIMESTAMP),
+        ]
+
+    def test_update_without_human_readable(self) -> None:
+        tracker: ChangeTracker = ChangeTracker([Variable(section=HeatPump.STATE, position=2)], human_readable=False)
+        changes: list[ValueChange] = tracker.update([{"value": "3"}])
+
+        assert [(change.position, change.value) for change in changes] == [(2, 3)]
+        assert changes[0].timestamp.tzinfo is timezone.utc
+
+    def test_update_with_invalid_value(self) -> None:
+        tracker: ChangeTracker = ChangeTracker([Variable(section=HeatPump.STATE, position=1)])
+
+        with pytest.raises(APIError, match=r"Can't convert value 'X' of HeatPump\.STATE!"):
+            tracker.update([{"value": "X"}])
+
+
+class TestSubscribe:
+    @pytest.mark.asyncio
+    async def test_subscribe(self) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=get_positions_payload(heat_pumps=2),
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            for values in (("30.5", "31.5"), ("30.5", "31.5"), ("30.5", "32")):
+                mock_keenergy_api.post(
+                    "http://mocked-host/var/readWriteVars",
+                    payload=[
+                        item | {"value": value}
+                        for item, value in zip(
+                            get_heat_pump_flow_temperature_payload(heat_pumps=2), values, strict=True
+                        )
+                    ],
+                    headers={"Content-Type": "application/json;charset=utf-8"},
+                )
+
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                changes: list[list[tuple[int | None, float | int | str]]] = []
+
+                request: list[Section] = [HeatPump.FLOW_TEMPERATURE, SolarCircuit.CURRENT_TEMPERATURE]
+
+                async for _changes in client.subscribe(request, interval=0):
+                    changes.append([(change.position, change.value) for change in _changes])
+
+                    if len(changes) == 2:  # noqa: PLR2004
+                        break
+
+                assert changes == [[(1, 30.5), (2, 31.5)], [(2, 32.0)]]
+
+                mock_keenergy_api.assert_called_with(
+                    url="http://mocked-host/var/readWriteVars",
+                    data=(
+                        '[{"name": "APPL.CtrlAppl.sParam.heatpump[0].TempHeatFlow.values.actValue", "attr": "0"}, '
+                        '{"name": "APPL.CtrlAppl.sParam.heatpump[1].TempHeatFlow.values.actValue", "attr": "0"}]'
+                    ),
+                    method="POST",
+                    auth=None,
+                    ssl=False,
+                )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("position", [2, [2]])
+    async def test_subscribe_with_position(self, position: int | list[int]) -> None:
+        with aioresponses() as mock_keenergy_api:
+            mock_keenergy_api.post(
+                "http://mocked-host/var/readWriteVars",
+                payload=[
+                    {"name": f"APPL.CtrlAppl.sParam.genericHeat[{idx}].values.actValue", "value": value}
+                    for idx, value in ((2, "40"), (3, "41"))
+                ],
+                headers={"Content-Type": "application/json;charset=utf-8"},
+            )
+
+            async with KebaKeEnergyAPI(host="mocked-host") as client:
+                async for changes in client.subscribe(SolarCircuit.CURRENT_TEMPERATURE, position, interval=0):
+                    assert [(change.position, change.sub_index, change.value) for change in changes] == [
+                        (2, 0, 40.0),
+                        (2, 1, 41.0),
+                    ]
+                    break